@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+import msgspec
+import pytest
+from yatracker import YaTracker
+from yatracker.tracker.client import BaseClient, Response
+
+Handler = Callable[[str, str, Any], Any]
+
+
+def ref(key: str) -> dict[str, str]:
+    """Get reference object."""
+    return {"self": f"/{key}", "id": key, "key": key, "display": key.title()}
+
+
+def issue(status: str = "open", key: str = "KEY-1") -> dict[str, Any]:
+    """Get issue in the status."""
+    return {
+        "self": f"/issues/{key}",
+        "id": key.rsplit("-", 1)[-1],
+        "key": key,
+        "version": 1,
+        "summary": "Summary",
+        "type": ref("bug"),
+        "priority": ref("normal"),
+        "queue": ref(key.rsplit("-", 1)[0]),
+        "favorite": False,
+        "createdAt": "2024-01-01T00:00:00.000+0000",
+        "createdBy": {"self": "/users/1", "id": "1", "display": "User"},
+        "votes": 0,
+        "status": ref(status),
+    }
+
+
+class FakeClient(BaseClient):
+    """Represents client answering requests by the handler.
+
+    Handler gets (method, path, payload) and returns a response object
+    (encoded to JSON with 200 status) or `Response`.
+    """
+
+    def __init__(self, handler: Handler) -> None:
+        super().__init__(org_id=1, token="token")  # noqa: S106
+        self.handler = handler
+        self.calls: list[tuple[str, str, Any]] = []
+
+    async def _make_request(self, method: str, url: str, **kwargs) -> Response:
+        path = str(url).removeprefix(f"{self._base_url}/{self._api_version}")
+        payload = None
+        if (data := kwargs.get("data")) is not None:
+            payload = msgspec.json.decode(data._value)  # noqa: SLF001
+        self.calls.append((method, path, payload))
+
+        result = self.handler(method, path, payload)
+        if isinstance(result, Response):
+            return result
+        return Response(200, msgspec.json.encode(result), {})
+
+    async def close(self) -> None:
+        """Nothing to close."""
+
+
+@pytest.fixture
+def make_tracker() -> Callable[[Handler], YaTracker]:
+    """Get factory of trackers answering requests by the handler."""
+
+    def make(handler: Handler) -> YaTracker:
+        return YaTracker(client=FakeClient(handler))
+
+    return make
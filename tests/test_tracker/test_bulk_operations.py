@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import ServerDisconnectedError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from yatracker import YaTracker
+
+
+def bulk_change(change_id: str, status: str, total: int = 1) -> dict[str, Any]:
+    """Get bulk change object."""
+    return {
+        "self": f"/bulkchange/{change_id}",
+        "id": change_id,
+        "status": status,
+        "totalIssues": total,
+        "totalCompletedIssues": total,
+    }
+
+
+def handle(method: str, path: str, payload: Any) -> Any:  # noqa: ANN401
+    """Answer like API, the second bulk change is never finished."""
+    if method == "POST":
+        change_id = payload["issues"][0]
+        return bulk_change(change_id, "CREATED")
+    change_id = path.rsplit("/", 1)[-1]
+    return bulk_change(change_id, "COMPLETE" if change_id == "A-1" else "RUNNING")
+
+
+async def test_wait_timeout_fails_its_batch(
+    make_tracker: Callable[..., YaTracker],
+) -> None:
+    """Timed out bulk change doesn't lose results of the others."""
+    tracker = make_tracker(handle)
+    result = await tracker.bulk_update(
+        ["A-1", "B-1", "B-2"],
+        batch_size=1,
+        timeout=0.01,
+        priority="minor",
+    )
+
+    assert [change.status for change in result.changes] == [
+        "COMPLETE",
+        "CREATED",
+        "CREATED",
+    ]
+    assert [failure.issue_key for failure in result.failures] == ["B-1", "B-2"]
+    assert "not finished" in str(result.failures[0].reason)
+
+
+async def test_submit_error_fails_its_batch(
+    make_tracker: Callable[..., YaTracker],
+) -> None:
+    """Batch lost on connection error doesn't break the others."""
+
+    def drop_b(method: str, path: str, payload: Any) -> Any:  # noqa: ANN401
+        if method == "POST" and payload["issues"][0].startswith("B"):
+            raise ServerDisconnectedError
+        return handle(method, path, payload)
+
+    tracker = make_tracker(drop_b)
+    result = await tracker.bulk_update(["A-1", "B-1"], batch_size=1, priority="minor")
+
+    assert [change.id for change in result.changes] == ["A-1"]
+    assert [failure.issue_key for failure in result.failures] == ["B-1"]
+    assert "not created" in str(result.failures[0].reason)
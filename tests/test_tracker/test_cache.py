@@ -0,0 +1,33 @@
+from yatracker.tracker.cache import ResponseCache
+
+URL = "https://api.tracker.yandex.net/v2/queues"
+
+
+def test_make_key_sorts_params() -> None:
+    """Params order doesn't change the key."""
+    first = ResponseCache.make_key(URL, {"b": 2, "a": 1})
+    second = ResponseCache.make_key(URL, {"a": 1, "b": 2})
+    assert first == second
+
+
+def test_make_key_without_params() -> None:
+    """Empty params are the same as no params."""
+    assert ResponseCache.make_key(URL, None) == ResponseCache.make_key(URL, {})
+
+
+def test_make_key_differs_by_scope() -> None:
+    """Clients of other organizations or tokens get other keys."""
+    scopes = [
+        ResponseCache.make_scope("1", "OAuth first"),
+        ResponseCache.make_scope("1", "OAuth second"),
+        ResponseCache.make_scope("2", "OAuth first"),
+    ]
+    keys = {ResponseCache.make_key(URL, scope=scope) for scope in scopes}
+    assert len(keys) == len(scopes)
+
+
+def test_make_scope_hides_token() -> None:
+    """Token is not stored in keys."""
+    scope = ResponseCache.make_scope("1", "OAuth secret-token")
+    assert "secret-token" not in scope
+    assert scope.startswith("1:")
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import ClientConnectionError
+from yatracker.types import ChecklistItemChange
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from yatracker import YaTracker
+
+DEADLINE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+async def test_deadline_type_is_sent(
+    make_tracker: Callable[..., YaTracker],
+) -> None:
+    """Deadline type required by API is never omitted."""
+    tracker = make_tracker(lambda *_: {"key": "KEY-1", "checklistItems": []})
+    await tracker.add_checklist_item("KEY-1", "Text", deadline=DEADLINE)
+    await tracker.edit_checklist_item("KEY-1", "1", deadline=DEADLINE)
+
+    for _, _, payload in tracker._client.calls:  # noqa: SLF001
+        assert payload["deadline"]["deadlineType"] == "date"
+
+
+async def test_network_error_fails_its_issue(
+    make_tracker: Callable[..., YaTracker],
+) -> None:
+    """Network error of an issue doesn't lose results of the others."""
+
+    def handle(method: str, path: str, payload: Any) -> Any:  # noqa: ANN401, ARG001
+        if path.startswith("/issues/KEY-2/"):
+            msg = "Connection reset"
+            raise ClientConnectionError(msg)
+        return {"key": "KEY-1", "checklistItems": []}
+
+    tracker = make_tracker(handle)
+    change = [ChecklistItemChange(id="1", checked=True)]
+    results = await tracker.edit_checklists({"KEY-1": change, "KEY-2": change})
+
+    assert results["KEY-1"] == []
+    assert isinstance(results["KEY-2"], ClientConnectionError)
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from http import HTTPStatus
+from typing import Any
+
+import pytest
+from yatracker.exceptions import ObjectNotFoundError, ServerError
+from yatracker.tracker.client import AIOHTTPClient, BaseClient, Response
+from yatracker.tracker.retry import RetryPolicy
+
+from tests.conftest import FakeClient
+
+
+class FakeContent:
+    def __init__(self, body: bytes) -> None:
+        self.body = body
+
+    async def iter_chunked(self, size: int) -> Any:  # noqa: ANN401
+        """Yield body by chunks."""
+        for start in range(0, len(self.body), size):
+            yield self.body[start : start + size]
+
+
+class FakeStream:
+    status = HTTPStatus.OK
+    headers: dict[str, str] = {}  # noqa: RUF012
+    released = False
+
+    def __init__(self, body: bytes) -> None:
+        self.content = FakeContent(body)
+
+    def release(self) -> None:
+        """Release connection."""
+        self.released = True
+
+
+class LegacyClient(BaseClient):
+    """Represents client returning (status, body) tuples."""
+
+    def __init__(self, status: int, body: bytes) -> None:
+        super().__init__(org_id=1, token="token")  # noqa: S106
+        self.result = (status, body)
+
+    async def _make_request(self, *_: object, **__: object) -> tuple[int, bytes]:
+        return self.result
+
+    async def close(self) -> None:
+        """Nothing to close."""
+
+
+async def read(client: Any, chunk_size: int) -> list[bytes]:  # noqa: ANN401
+    """Read body of GET stream by chunks."""
+    async with client.stream("GET", "/file", chunk_size=chunk_size) as response:
+        return [chunk async for chunk in response.chunks]
+
+
+async def test_base_stream_falls_back_to_request() -> None:
+    """Client without own `stream` splits buffered body."""
+    client = FakeClient(lambda *_: Response(HTTPStatus.OK, b"abcde", {}))
+    assert await read(client, 2) == [b"ab", b"cd", b"e"]
+    assert client.calls == [("GET", "/file", None)]
+
+
+async def test_base_stream_is_retried() -> None:
+    """Returned error statuses of fallback stream are retried."""
+    statuses = iter([HTTPStatus.BAD_GATEWAY, HTTPStatus.OK])
+    client = FakeClient(lambda *_: Response(next(statuses), b"abc", {}))
+    client._retry_policy = RetryPolicy(base_delay=0)  # noqa: SLF001
+    assert await read(client, 2) == [b"ab", b"c"]
+    assert len(client.calls) == 2  # noqa: PLR2004
+
+
+async def test_base_stream_raises_errors() -> None:
+    """Error statuses are raised by fallback stream."""
+    client = FakeClient(lambda *_: Response(HTTPStatus.NOT_FOUND, b"", {}))
+    with pytest.raises(ObjectNotFoundError):
+        await read(client, 2)
+    assert len(client.calls) == 1
+
+
+async def test_base_stream_passes_range_not_satisfiable() -> None:
+    """Status 416 is returned to resume downloads."""
+    status = HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE
+    client = FakeClient(lambda *_: Response(status, b"", {}))
+    async with client.stream("GET", "/file") as response:
+        assert response.status == status
+
+
+async def test_aiohttp_stream_is_retried(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Opening of stream is retried by the policy."""
+    stream = FakeStream(b"abc")
+    attempts = []
+
+    async def open_stream(**_: Any) -> FakeStream:  # noqa: ANN401
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise ServerError(HTTPStatus.SERVICE_UNAVAILABLE, "")
+        return stream
+
+    client = AIOHTTPClient(
+        org_id=1,
+        token="token",  # noqa: S106
+        retry_policy=RetryPolicy(base_delay=0),
+    )
+    monkeypatch.setattr(client, "_open_stream", open_stream)
+
+    assert await read(client, 2) == [b"ab", b"c"]
+    assert len(attempts) == 2  # noqa: PLR2004
+    assert stream.released
+
+
+async def test_legacy_client_tuple_is_supported() -> None:
+    """Subclasses returning (status, body) keep working."""
+    client = LegacyClient(HTTPStatus.OK, b"{}")
+    assert await client.request(method="GET", uri="/myself") == b"{}"
+    response = await client.fetch(method="GET", uri="/myself")
+    assert response.headers == {}
+
+
+async def test_legacy_client_tuple_status_is_checked() -> None:
+    """Error statuses of (status, body) tuples are raised."""
+    client = LegacyClient(HTTPStatus.NOT_FOUND, b"")
+    with pytest.raises(ObjectNotFoundError):
+        await client.request(method="GET", uri="/issues/KEY-1")
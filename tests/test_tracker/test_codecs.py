@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from typing import Any
+
+import msgspec
+from yatracker.tracker.codecs import CodecRegistry
+from yatracker.tracker.payload import get_payload_builder
+from yatracker.types.base import Base
+from yatracker.types.duration import Duration
+
+
+class Money:
+    def __init__(self, amount: int) -> None:
+        self.amount = amount
+
+
+class Spent(msgspec.Struct):
+    duration: Duration
+    price: Money
+
+
+class Estimate(Base, kw_only=True):
+    duration: Duration
+
+
+def enc_money(obj: Any) -> Any:  # noqa: ANN401
+    """Encode money."""
+    if isinstance(obj, Money):
+        return obj.amount
+    raise NotImplementedError
+
+
+def dec_money(type_: type, obj: Any) -> Any:  # noqa: ANN401
+    """Decode money."""
+    if type_ is Money:
+        return Money(obj)
+    raise NotImplementedError
+
+
+def test_custom_hooks_are_chained() -> None:
+    """Own hooks don't replace the builtin Duration ones."""
+    codecs = CodecRegistry(enc_hook=enc_money, dec_hook=dec_money)
+    data = b'{"duration":"PT1H","price":10}'
+
+    spent = codecs.get_decoder(Spent).decode(data)
+    assert spent.duration == Duration(hours=1)
+    assert spent.price.amount == 10  # noqa: PLR2004
+    assert codecs.encoder.encode(spent) == data
+
+
+def test_payload_duration_needs_no_hook() -> None:
+    """Durations of payload are encoded by plain encoder."""
+    payload = get_payload_builder().build({"duration": Duration(minutes=5)})
+    assert msgspec.json.encode(payload) == b'{"duration":"PT5M"}'
+
+
+def test_payload_struct_duration_needs_no_hook() -> None:
+    """Durations inside payload structs are converted too."""
+    estimate = Estimate(duration=Duration(days=1))
+    payload = get_payload_builder().build({"estimate": estimate})
+    assert msgspec.json.encode(payload) == b'{"estimate":{"duration":"P1D"}}'
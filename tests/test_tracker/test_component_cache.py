@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import pytest
+from yatracker.exceptions import ComponentNotFoundError
+from yatracker.tracker.component_cache import (
+    ComponentCache,
+    get_queue_key,
+    has_component_names,
+)
+from yatracker.types import Component, FullComponent, Queue
+
+QUEUE = Queue(url="/queues/KEY", id="1", key="KEY", display="Key")
+
+
+def component(component_id: int, name: str) -> FullComponent:
+    """Get component of the queue."""
+    return FullComponent(
+        url=f"/components/{component_id}",
+        id=component_id,
+        version=1,
+        name=name,
+        queue=QUEUE,
+    )
+
+
+class Source:
+    def __init__(self, *components: FullComponent) -> None:
+        self.components = list(components)
+        self.calls = 0
+
+    async def get_queue_components(self, queue_id: str | int) -> list[FullComponent]:
+        """Get components, count requests."""
+        assert queue_id == "KEY"
+        self.calls += 1
+        return self.components
+
+
+async def test_resolve_names_ids_and_objects() -> None:
+    """Names are resolved by one request, ids are kept."""
+    source = Source(component(1, "Backend"), component(2, "2024"))
+    cache = ComponentCache(source)
+    ref = Component(url="/components/5", id="5", display="API")
+
+    ids = await cache.resolve("KEY", ["backend", 7, "2024", ref])
+    assert ids == [1, 7, 2, 5]
+    assert await cache.resolve("KEY", ["Backend"]) == [1]
+    assert source.calls == 1
+
+
+async def test_resolve_reloads_unknown_name() -> None:
+    """Component created after loading is found by one reload."""
+    source = Source()
+    cache = ComponentCache(source)
+    assert await cache.resolve("KEY", [3]) == [3]
+    await cache.get_components("KEY")
+
+    source.components = [component(3, "New")]
+    assert await cache.resolve("KEY", ["new"]) == [3]
+    with pytest.raises(ComponentNotFoundError):
+        await cache.resolve("KEY", ["Missing"])
+    assert source.calls == 3  # noqa: PLR2004
+
+
+async def test_resolve_value() -> None:
+    """Names of set/add/remove lists are resolved."""
+    cache = ComponentCache(Source(component(1, "Backend")))
+    value = {"add": ["Backend"], "remove": [2], "mode": "x"}
+    assert await cache.resolve_value("KEY", value) == {
+        "add": [1],
+        "remove": [2],
+        "mode": "x",
+    }
+
+
+def test_has_component_names() -> None:
+    """Any string is a name, ids are int."""
+    assert has_component_names(["12"])
+    assert has_component_names({"add": [1, "API"]})
+    assert not has_component_names([1, 2])
+    assert not has_component_names(None)
+
+
+@pytest.mark.parametrize(
+    ("issue_key", "queue"),
+    [
+        ("KEY-1", "KEY"),
+        ("MY-KEY-12", "MY-KEY"),
+        ("5f1e2d3c4b5a", None),
+        ("KEY-", None),
+        ("-1", None),
+        ("KEY-1a", None),
+    ],
+)
+def test_get_queue_key(issue_key: str, queue: str | None) -> None:
+    """Queue key is taken from issue key only."""
+    assert get_queue_key(issue_key) == queue
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import csv
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
+
+import msgspec
+import pytest
+from yatracker.exceptions import ObjectNotFoundError
+from yatracker.tracker.client import Response
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from yatracker import YaTracker
+
+API = "https://api.tracker.yandex.net/v2"
+
+
+def issue(key: str, **fields: Any) -> dict[str, Any]:  # noqa: ANN401
+    """Get raw issue object."""
+    return {"self": f"/issues/{key}", "key": key, **fields}
+
+
+def page(items: list[Any], **headers: str) -> Response:
+    """Get response with page of objects."""
+    return Response(HTTPStatus.OK, msgspec.json.encode(items), headers)
+
+
+def read_lines(path: Path) -> list[Any]:
+    """Get decoded JSONL rows."""
+    return [msgspec.json.decode(line) for line in path.read_bytes().splitlines()]
+
+
+async def test_comments_pages_are_merged(
+    make_tracker: Callable[..., YaTracker],
+    tmp_path: Path,
+) -> None:
+    """All the pages of comments are exported as a single list."""
+    next_link = f'<{API}/issues/A-1/comments?id=1>; rel="next"'
+
+    def handle(method: str, path: str, payload: Any) -> Any:  # noqa: ANN401, ARG001
+        if path == "/issues/_search":
+            return [issue("A-1")]
+        if path == "/issues/A-1/comments":
+            return page([{"id": 1}], Link=next_link)
+        return page([{"id": 2}])
+
+    path = tmp_path / "issues.jsonl"
+    await make_tracker(handle).export_issues(path, include=["comments"])
+
+    assert read_lines(path) == [
+        {"issue": issue("A-1"), "comments": [{"id": 1}, {"id": 2}]},
+    ]
+
+
+async def test_csv_columns(
+    make_tracker: Callable[..., YaTracker],
+    tmp_path: Path,
+) -> None:
+    """CSV cells are taken by dotted paths, objects are encoded to JSON."""
+    issues = [
+        issue("A-1", status={"key": "open"}, tags=["a"]),
+        issue("A-2", status=None),
+    ]
+    tracker = make_tracker(lambda *_: issues)
+    path = tmp_path / "issues.csv"
+    await tracker.export_issues(path, "csv", columns=["key", "status.key", "tags"])
+
+    with path.open(newline="") as file:
+        rows = list(csv.reader(file))
+    assert rows == [
+        ["key", "status.key", "tags"],
+        ["A-1", "open", '["a"]'],
+        ["A-2", "", ""],
+    ]
+
+
+async def test_interrupted_export_is_resumed(
+    make_tracker: Callable[..., YaTracker],
+    tmp_path: Path,
+) -> None:
+    """Export continues from the checkpoint, partial writes are dropped."""
+    headers = {"X-Scroll-Id": "scroll", "X-Total-Count": "3"}
+    responses = iter(
+        [
+            page([issue("A-1")], **headers),
+            Response(HTTPStatus.NOT_FOUND, b"", {}),
+            page([issue("A-2"), issue("A-3")], **headers),
+        ],
+    )
+    tracker = make_tracker(lambda *_: next(responses))
+    path = tmp_path / "issues.jsonl"
+    checkpoint = tmp_path / "issues.jsonl.checkpoint"
+
+    with pytest.raises(ObjectNotFoundError):
+        await tracker.export_issues(path)
+    assert msgspec.json.decode(checkpoint.read_bytes())["params"]["scrollId"] == (
+        "scroll"
+    )
+
+    with path.open("ab") as file:
+        file.write(b'{"partial')
+    progress = await tracker.export_issues(path)
+
+    assert [row["key"] for row in read_lines(path)] == ["A-1", "A-2", "A-3"]
+    assert progress.exported == 3  # noqa: PLR2004
+    assert not checkpoint.exists()
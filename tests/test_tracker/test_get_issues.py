@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from tests.conftest import issue
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from yatracker import YaTracker
+
+# moved issues are found by their old keys
+MOVED = {"OLD-2": "KEY-2"}
+
+
+def handle(method: str, path: str, payload: Any) -> Any:  # noqa: ANN401, ARG001
+    """Search issues by keys in reverse order, skip missing ones."""
+    found = []
+    for key in reversed(payload["keys"]):
+        if key in MOVED:
+            found.append({**issue(key=MOVED[key]), "aliases": [key]})
+        elif key != "KEY-404":
+            found.append(issue(key=key))
+    return found
+
+
+async def test_get_issues_keeps_keys_order(
+    make_tracker: Callable[..., YaTracker],
+) -> None:
+    """Issues are matched to the keys, including duplicates and aliases."""
+    tracker = make_tracker(handle)
+    keys = ["KEY-3", "KEY-1", "KEY-404", "KEY-1", "OLD-2"]
+    issues = await tracker.get_issues(keys, chunk_size=2)
+
+    assert [i.key if i else None for i in issues] == [
+        "KEY-3",
+        "KEY-1",
+        None,
+        "KEY-1",
+        "KEY-2",
+    ]
+    assert issues[1] is issues[3]
+    calls = tracker._client.calls  # noqa: SLF001
+    assert [payload["keys"] for _, _, payload in calls] == [
+        ["KEY-3", "KEY-1"],
+        ["KEY-404", "OLD-2"],
+    ]
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from typing import Any
+
+from yatracker import YaTracker
+from yatracker.tracker.identity_map import IdentityMap
+
+from tests.conftest import FakeClient, issue
+
+USER = {"self": "/users/1", "id": "1", "display": "User"}
+
+
+def handle(method: str, path: str, payload: Any) -> Any:  # noqa: ANN401, ARG001
+    """Find issues followed by their author."""
+    return [{**issue(key=key), "followers": [USER]} for key in payload["keys"]]
+
+
+async def test_page_shares_references() -> None:
+    """Equal references of a page, including lists, are the same objects."""
+    identity_map = IdentityMap()
+    tracker = YaTracker(client=FakeClient(handle), identity_map=identity_map)
+    first, second = await tracker.get_issues(["KEY-1", "KEY-2"])
+
+    assert first is not None
+    assert second is not None
+    assert first.created_by is second.created_by
+    assert first.followers is not None
+    assert first.followers[0] is first.created_by
+    assert first.status is second.status
+    assert first.queue is second.queue
+
+
+async def test_references_live_until_clear() -> None:
+    """References are shared across responses until the map is cleared."""
+    identity_map = IdentityMap()
+    tracker = YaTracker(client=FakeClient(handle), identity_map=identity_map)
+    (first,) = await tracker.get_issues(["KEY-1"])
+    (second,) = await tracker.get_issues(["KEY-2"])
+    assert first is not None
+    assert second is not None
+    assert first.created_by is second.created_by
+
+    identity_map.clear()
+    assert len(identity_map) == 0
+    (third,) = await tracker.get_issues(["KEY-3"])
+    assert third is not None
+    assert third.created_by is not first.created_by
+    assert third.created_by == first.created_by
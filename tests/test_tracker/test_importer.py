@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from aiohttp import ClientConnectionError
+from yatracker.tracker.client import Response
+from yatracker.tracker.importer import SourceIssue, SourceLink
+
+from tests.conftest import issue, ref
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from pathlib import Path
+
+    from yatracker import YaTracker
+
+USER = {"self": "/users/1", "id": "1", "display": "User"}
+CREATED_AT = "2024-01-01T00:00:00.000+0000"
+CREATED = {"created_at": CREATED_AT, "created_by": "1"}
+
+
+def source(count: int) -> list[SourceIssue]:
+    """Get issues linked to the next ones."""
+    return [
+        SourceIssue(
+            id=str(i),
+            fields={"queue": "NEW", "summary": f"Issue {i}", **CREATED},
+            links=[SourceLink(relationship="relates", issue=str(i + 1), **CREATED)],
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def handle(method: str, path: str, payload: Any) -> Any:  # noqa: ANN401, ARG001
+    """Import objects, fail the third issue by network error."""
+    if path == "/issues/_import":
+        number = payload["summary"].split()[-1]
+        if number == "3":
+            msg = "Connection reset"
+            raise ClientConnectionError(msg)
+        return issue("open", f"NEW-{number}")
+
+    linked = payload["issue"]
+    if not linked.startswith("NEW-"):
+        return Response(HTTPStatus.NOT_FOUND, b"Issue not found", {})
+    return {
+        "self": "/links/1",
+        "id": 1,
+        "type": {"self": "/types/1", "id": "relates", "inward": "", "outward": ""},
+        "direction": "outward",
+        "object": {**ref(linked), "key": linked},
+        "createdBy": USER,
+        "createdAt": CREATED_AT,
+        "status": ref("open"),
+    }
+
+
+async def test_import_goes_on_after_network_error(
+    make_tracker: Callable[..., YaTracker],
+    tmp_path: Path,
+) -> None:
+    """Network error fails the only issue, links are imported at the end."""
+    tracker = make_tracker(handle)
+    checkpoint = tmp_path / "import.checkpoint"
+    result = await tracker.import_issues(source(5), checkpoint, queue_size=2)
+
+    assert result.issues == {"1": "NEW-1", "2": "NEW-2", "4": "NEW-4", "5": "NEW-5"}
+    assert result.imported == {"issue": 4, "link": 2}
+    assert sorted((f.kind, f.id) for f in result.failures) == [
+        ("issue", "3"),
+        ("link", "2:relates:3"),
+        ("link", "5:relates:6"),
+    ]
+    lines = checkpoint.read_bytes().splitlines()
+    assert len(lines) == sum(result.imported.values())
+    assert list(tmp_path.iterdir()) == [checkpoint]  # noqa: ASYNC240
+
+
+async def test_failed_import_leaves_no_tasks(
+    make_tracker: Callable[..., YaTracker],
+    tmp_path: Path,
+) -> None:
+    """Unexpected error stops reading of the source as well as workers."""
+
+    def fail(*_: Any) -> Any:  # noqa: ANN401
+        msg = "Unexpected"
+        raise RuntimeError(msg)
+
+    def endless() -> Iterator[SourceIssue]:
+        fields = {"queue": "NEW", "summary": "Issue", **CREATED}
+        for i in itertools.count(1):
+            yield SourceIssue(id=str(i), fields=fields)
+
+    tracker = make_tracker(fail)
+    with pytest.raises(RuntimeError):
+        await tracker.import_issues(endless(), tmp_path / "import.checkpoint")
+
+    await asyncio.sleep(0)
+    assert asyncio.all_tasks() == {asyncio.current_task()}
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import aclosing
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlsplit
+
+import msgspec
+from yatracker import YaTracker
+from yatracker.tracker.client import Response
+from yatracker.tracker.pagination import Cursor
+
+from tests.conftest import FakeClient
+
+API = "https://api.tracker.yandex.net/v2"
+
+
+def page(items: list[int], **headers: str) -> Response:
+    """Get response with page of numbers."""
+    return Response(HTTPStatus.OK, msgspec.json.encode(items), headers)
+
+
+class PagesClient(FakeClient):
+    """Represents client answering numbered pages, later pages are faster.
+
+    With `link` pages refer to the next ones via `Link` header,
+    otherwise the first page has `X-Total-Pages` header.
+    """
+
+    def __init__(self, pages: int, *, link: bool = False) -> None:
+        super().__init__(lambda *_: None)
+        self.pages = pages
+        self.link = link
+
+    async def _make_request(self, method: str, url: str, **kwargs) -> Response:
+        number = (kwargs.get("params") or {}).get("page")
+        if number is None:
+            number = int(parse_qs(urlsplit(url).query)["page"][0])
+        self.calls.append((method, url, number))
+        await asyncio.sleep(0.001 * (self.pages - number))
+
+        if not self.link:
+            return page([number], **{"X-Total-Pages": str(self.pages)})
+        if number < self.pages:
+            return page([number], Link=f'<{API}/issues?page={number + 1}>; rel="next"')
+        return page([number])
+
+
+def make_pages(*responses: Response) -> tuple[YaTracker, FakeClient]:
+    """Get tracker answering the responses in order."""
+    answers = iter(responses)
+    client = FakeClient(lambda *_: next(answers))
+    return YaTracker(client=client), client
+
+
+async def test_scroll_follows_scroll_id_until_total() -> None:
+    """Scroll id is passed to the next page, the last page is by total count."""
+    headers = {"X-Scroll-Id": "scroll", "X-Total-Count": "3"}
+    tracker, client = make_pages(
+        page([1, 2], **headers),
+        page([3], **headers),
+    )
+    cursor = Cursor(uri="/issues/_search", params={"perScroll": 2})
+    pages = [p async for p in tracker._scroll(int, "POST", cursor)]  # noqa: SLF001
+
+    assert [p.items for p in pages] == [[1, 2], [3]]
+    assert [p.total for p in pages] == [3, 3]
+    assert pages[0].next_cursor == Cursor(
+        uri="/issues/_search",
+        params={"perScroll": 2, "scrollId": "scroll"},
+    )
+    assert pages[1].next_cursor is None
+    assert len(client.calls) == 2  # noqa: PLR2004
+
+
+async def test_scroll_follows_link() -> None:
+    """Link with rel="next" is preferred, empty page stops the scroll."""
+    link = f'<{API}/issues/_search?scrollId=next>; rel="next"'
+    tracker, client = make_pages(
+        page([1], Link=link),
+        page([]),
+    )
+    cursor = Cursor(uri="/issues/_search")
+    pages = [p async for p in tracker._scroll(int, "POST", cursor)]  # noqa: SLF001
+
+    assert [p.items for p in pages] == [[1]]
+    assert [path for _, path, _ in client.calls] == [
+        "/issues/_search",
+        "/issues/_search?scrollId=next",
+    ]
+
+
+async def test_scroll_cancels_prefetch_on_exit() -> None:
+    """Prefetched page is not requested when iteration is stopped."""
+    tracker, client = make_pages(
+        page([1], **{"X-Scroll-Id": "scroll"}),
+        page([2], **{"X-Scroll-Id": "scroll"}),
+    )
+    cursor = Cursor(uri="/issues/_search")
+    async with aclosing(tracker._scroll(int, "POST", cursor)) as pages:  # noqa: SLF001
+        async for p in pages:
+            assert p.items == [1]
+            break
+
+    await asyncio.sleep(0)
+    assert len(client.calls) == 1
+
+
+async def test_pages_keep_order() -> None:
+    """Concurrently fetched pages are yielded in order."""
+    client = PagesClient(5)
+    tracker = YaTracker(client=client)
+    pages = tracker._iter_pages(int, "GET", "/issues", concurrency=3)  # noqa: SLF001
+
+    assert [p async for p in pages] == [[1], [2], [3], [4], [5]]
+    assert len(client.calls) == 5  # noqa: PLR2004
+
+
+async def test_pages_follow_link_without_count() -> None:
+    """Pages are followed via Link when total count is unknown."""
+    client = PagesClient(3, link=True)
+    tracker = YaTracker(client=client)
+    pages = tracker._iter_pages(int, "GET", "/issues")  # noqa: SLF001
+
+    assert [p async for p in pages] == [[1], [2], [3]]
+    assert [url for _, url, _ in client.calls][1:] == [
+        f"{API}/issues?page=2",
+        f"{API}/issues?page=3",
+    ]
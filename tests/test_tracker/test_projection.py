@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import msgspec
+import pytest
+from yatracker.tracker.projection import get_fields_param, get_projection
+from yatracker.types import FullIssue
+
+from tests.conftest import issue
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from yatracker import YaTracker
+
+
+def test_projection_accepts_both_names() -> None:
+    """Fields are named as attributes or as in API."""
+    projection = get_projection(FullIssue, ["key", "created_at", "createdBy"])
+    names = [f.name for f in msgspec.structs.fields(projection)]
+
+    assert names[1:] == ["key", "created_at", "created_by"]
+    assert get_fields_param(projection) == "key,createdAt,createdBy"
+    assert get_projection(FullIssue, ["key", "created_at", "createdBy"]) is projection
+
+
+@pytest.mark.parametrize("name", ["unknown", "_tracker"])
+def test_projection_rejects_unknown_fields(name: str) -> None:
+    """Unknown and tech fields are not projected."""
+    with pytest.raises(ValueError, match=name):
+        get_projection(FullIssue, ["key", name])
+
+
+async def test_get_issue_decodes_projection(
+    make_tracker: Callable[..., YaTracker],
+) -> None:
+    """Only the projected fields are decoded."""
+    tracker = make_tracker(lambda *_: issue("closed"))
+    result = await tracker.get_issue("KEY-1", fields=["key", "status"])
+
+    assert type(result).__name__ == "FullIssueProjection"
+    assert result.key == "KEY-1"
+    assert result.status.key == "closed"
+    assert not hasattr(result, "summary")
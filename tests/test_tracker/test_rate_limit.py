@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import asyncio
+from http import HTTPStatus
+
+import pytest
+from yatracker.tracker import rate_limit
+from yatracker.tracker.client import Response
+from yatracker.tracker.rate_limit import (
+    Limit,
+    RateLimiter,
+    TokenBucket,
+    parse_retry_after,
+)
+
+from tests.conftest import FakeClient
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self._sleep = asyncio.sleep
+
+    def monotonic(self) -> float:
+        """Get current time."""
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        """Move time forward instead of sleeping."""
+        self.now += delay
+        await self._sleep(0)
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    """Get fake clock used by the rate limiter."""
+    clock = Clock()
+    monkeypatch.setattr(rate_limit.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(rate_limit.asyncio, "sleep", clock.sleep)
+    return clock
+
+
+async def test_burst_then_rate(clock: Clock) -> None:
+    """Capacity is given at once, then tokens come at the rate."""
+    bucket = TokenBucket(rate=2, capacity=3)
+    for _ in range(3):
+        await bucket.acquire()
+    assert clock.now == 0
+
+    await bucket.acquire()
+    assert clock.now == pytest.approx(0.5)
+
+
+async def test_pause_is_not_refilled(clock: Clock) -> None:
+    """Paused time doesn't give tokens."""
+    bucket = TokenBucket(rate=1, capacity=5)
+    bucket.pause(10)
+
+    await bucket.acquire()
+    await bucket.acquire()
+    assert clock.now == pytest.approx(12)
+
+
+async def test_returned_429_throttles(clock: Clock) -> None:
+    """429 status returned by client pauses and shrinks the limiter."""
+    responses = iter(
+        [
+            Response(HTTPStatus.TOO_MANY_REQUESTS, b"", {"Retry-After": "2"}),
+            Response(HTTPStatus.OK, b"{}", {}),
+        ],
+    )
+    limiter = RateLimiter()
+    client = FakeClient(lambda *_: next(responses))
+    client._rate_limiter = limiter  # noqa: SLF001
+
+    assert await client.request(method="GET", uri="/issues/KEY-1") == b"{}"
+    assert clock.now >= 2  # noqa: PLR2004
+    (endpoint,) = limiter._limiters.values()  # noqa: SLF001
+    assert endpoint.concurrency.limit < Limit().concurrency
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [(None, None), ("", None), ("3", 3.0), ("-1", 0.0), ("soon", None)],
+)
+def test_parse_retry_after(value: str | None, expected: float | None) -> None:
+    """Retry-After seconds are parsed, invalid values are skipped."""
+    assert parse_retry_after(value) == expected
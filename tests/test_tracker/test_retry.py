@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from http import HTTPStatus
+
+import pytest
+from aiohttp import ClientConnectionError
+from yatracker.exceptions import ServerError, YaTrackerError
+from yatracker.tracker import retry
+from yatracker.tracker.client import Response
+from yatracker.tracker.retry import RetryEvent, RetryPolicy
+
+from tests.conftest import FakeClient
+
+
+@pytest.fixture
+def max_jitter(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make jitter always take the upper bound."""
+    monkeypatch.setattr(retry.random, "uniform", lambda _, cap: cap)
+
+
+@pytest.mark.usefixtures("max_jitter")
+def test_delay_grows_up_to_cap() -> None:
+    """Backoff doubles per attempt and is capped."""
+    policy = RetryPolicy(base_delay=0.5, max_delay=3)
+    delays = [policy.get_delay(attempt) for attempt in range(1, 6)]
+    assert delays == [0.5, 1, 2, 3, 3]
+
+
+def test_delay_is_jittered() -> None:
+    """Delay is random between zero and the cap."""
+    policy = RetryPolicy(base_delay=1, max_delay=10)
+    delays = {policy.get_delay(4) for _ in range(100)}
+    assert all(0 <= delay <= 8 for delay in delays)  # noqa: PLR2004
+    assert len(delays) > 1
+
+
+def test_is_idempotent() -> None:
+    """POST is retried only with `unique` key."""
+    policy = RetryPolicy()
+    assert policy.is_idempotent("get")
+    assert policy.is_idempotent("DELETE")
+    assert not policy.is_idempotent("POST", {"summary": "Issue"})
+    assert policy.is_idempotent("POST", {"unique": "key"})
+    assert not policy.is_idempotent("PATCH")
+
+
+def test_is_transient() -> None:
+    """Only listed statuses and network errors are retried."""
+    policy = RetryPolicy()
+    assert policy.is_transient(ServerError(HTTPStatus.BAD_GATEWAY, ""))
+    assert not policy.is_transient(ServerError(HTTPStatus.NOT_IMPLEMENTED, ""))
+    assert policy.is_transient(ClientConnectionError())
+    assert not policy.is_transient(YaTrackerError("Bad request"))
+
+
+async def test_client_retries_returned_status() -> None:
+    """Error status returned by client is retried like raised one."""
+    statuses = iter([HTTPStatus.BAD_GATEWAY, HTTPStatus.OK])
+    client = FakeClient(lambda *_: Response(next(statuses), b"{}", {}))
+    client._retry_policy = RetryPolicy(base_delay=0)  # noqa: SLF001
+
+    assert await client.request(method="GET", uri="/issues/KEY-1") == b"{}"
+    assert len(client.calls) == 2  # noqa: PLR2004
+
+
+def bad_gateway(*_: object) -> None:
+    """Fail like API under maintenance."""
+    raise ServerError(HTTPStatus.BAD_GATEWAY, "")
+
+
+@pytest.mark.usefixtures("max_jitter")
+async def test_client_gives_up_after_attempts() -> None:
+    """Client retries transient errors and reports the attempts."""
+    events: list[RetryEvent] = []
+    given_up: list[RetryEvent] = []
+    client = FakeClient(bad_gateway)
+    client._retry_policy = RetryPolicy(  # noqa: SLF001
+        attempts=3,
+        base_delay=0.001,
+        on_retry=events.append,
+        on_giveup=given_up.append,
+    )
+
+    with pytest.raises(ServerError):
+        await client.request(method="GET", uri="/issues/KEY-1")
+
+    assert [event.attempt for event in events] == [1, 2]
+    assert [event.delay for event in events] == [0.001, 0.002]
+    assert [event.attempt for event in given_up] == [3]
+    assert len(client.calls) == 3  # noqa: PLR2004
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+from yatracker.tracker.client import _make_flight_key
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from yatracker import YaTracker
+
+URL = "https://api.tracker.yandex.net/v2/issues"
+
+
+def test_flight_key_ignores_params_order() -> None:
+    """Params order doesn't change the key."""
+    first = _make_flight_key("get", URL, {"a": 1, "b": [1, 2]}, {})
+    second = _make_flight_key("GET", URL, {"b": [1, 2], "a": 1}, {})
+    assert first == second
+    assert hash(first)
+
+
+def test_flight_key_of_unhashable_params() -> None:
+    """List and dict params are supported, other values are not coalesced."""
+    first = _make_flight_key("GET", URL, {"filter": {"queue": "A"}}, {})
+    second = _make_flight_key("GET", URL, {"filter": {"queue": "B"}}, {})
+    assert first != second
+    assert _make_flight_key("GET", URL, {"a": object()}, {}) is None
+    assert _make_flight_key("GET", URL, None, {"timeout": 1}) is None
+
+
+def test_flight_key_of_body() -> None:
+    """Requests with different bodies are not coalesced."""
+    first = _make_flight_key("GET", URL, None, {}, b'{"queue":"A"}')
+    second = _make_flight_key("GET", URL, None, {}, b'{"queue":"B"}')
+    assert first != second
+    assert first != _make_flight_key("GET", URL, None, {})
+
+
+async def test_identical_requests_are_coalesced(
+    make_tracker: Callable[..., YaTracker],
+) -> None:
+    """Concurrent identical GET requests share one request."""
+
+    async def request() -> Any:  # noqa: ANN401
+        return await tracker._client.request(  # noqa: SLF001
+            method="GET",
+            uri="/issues",
+            params={"keys": ["A-1", "A-2"]},
+        )
+
+    tracker = make_tracker(lambda *_: [])
+    await asyncio.gather(request(), request())
+    assert len(tracker._client.calls) == 1  # noqa: SLF001
+
+
+async def test_requests_with_other_payload_are_not_coalesced(
+    make_tracker: Callable[..., YaTracker],
+) -> None:
+    """GET requests with different bodies are sent separately."""
+
+    async def request(queue: str) -> Any:  # noqa: ANN401
+        return await tracker._client.request(  # noqa: SLF001
+            method="GET",
+            uri="/queues",
+            payload={"queue": queue},
+        )
+
+    tracker = make_tracker(lambda *_: [])
+    await asyncio.gather(request("A"), request("B"), request("B"))
+    calls = tracker._client.calls  # noqa: SLF001
+    assert sorted(payload["queue"] for _, _, payload in calls) == ["A", "B"]
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from tests.conftest import issue, ref
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from yatracker import YaTracker
+
+WORKFLOW = {
+    "open": ["in_progress"],
+    "in_progress": ["review", "open"],
+    "review": ["closed", "in_progress"],
+    "closed": [],
+}
+
+
+def transitions(status: str) -> list[dict[str, Any]]:
+    """Get transitions available in the status."""
+    return [
+        {"id": f"to_{to}", "self": f"/to_{to}", "display": to.title(), "to": ref(to)}
+        for to in WORKFLOW[status]
+    ]
+
+
+def handler(method: str, path: str, payload: Any) -> Any:  # noqa: ANN401, ARG001
+    """Answer as the tracker with the workflow."""
+    if path == "/issues/KEY-1":
+        return issue("open")
+    if path == "/issues/_search":
+        return [{"status": ref(s), "transitions": transitions(s)} for s in WORKFLOW]
+    if path.endswith("/_execute"):
+        return transitions(path.split("/")[-2].removeprefix("to_"))
+    raise AssertionError(path)
+
+
+async def test_transition_to_by_shortest_path(
+    make_tracker: Callable[..., YaTracker],
+) -> None:
+    """Issue is moved by the chain of transitions."""
+    tracker = make_tracker(handler)
+    available = await tracker.transition_to("KEY-1", "closed", resolution="fixed")
+
+    executed = [
+        (path, payload)
+        for method, path, payload in tracker._client.calls  # noqa: SLF001
+        if path.endswith("/_execute")
+    ]
+    assert [path.split("/")[-2] for path, _ in executed] == [
+        "to_in_progress",
+        "to_review",
+        "to_closed",
+    ]
+    assert executed[-1][1] == {"resolution": "fixed"}
+    assert available == []
+
+
+async def test_transition_to_current_status_any_case(
+    make_tracker: Callable[..., YaTracker],
+) -> None:
+    """Nothing is executed if the issue is already in the status."""
+    tracker = make_tracker(handler)
+    assert await tracker.transition_to("KEY-1", "OPEN") == []
+    assert len(tracker._client.calls) == 1  # noqa: SLF001
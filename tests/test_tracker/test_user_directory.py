@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from yatracker.tracker.user_directory import UserDirectory
+from yatracker.types import FullUser
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+
+def user(uid: int, login: str) -> FullUser:
+    """Get user."""
+    return FullUser(
+        url=f"/users/{uid}",
+        uid=uid,
+        login=login,
+        display=login.title(),
+        email=f"{login}@example.com",
+    )
+
+
+class Source:
+    def __init__(self, *users: FullUser) -> None:
+        self.users = list(users)
+        self.created = user(2, "new")
+        self.loading = asyncio.Event()
+        self.loading.set()
+
+    async def iter_users(self, *_: int) -> AsyncIterator[FullUser]:
+        """Yield users, wait for `loading` after the first one."""
+        for u in self.users:
+            yield u
+            await self.loading.wait()
+
+    async def get_user(self, user_id: str | int) -> FullUser:
+        """Get user created after loading."""
+        assert user_id in {self.created.login, self.created.uid}
+        return self.created
+
+
+async def test_get_by_any_key() -> None:
+    """Users are found by uid, login and email case-insensitively."""
+    directory = UserDirectory(Source(user(1, "first")))  # type: ignore[arg-type]
+    await directory.ensure_fresh()
+
+    assert directory.get(1) is directory.get("FIRST")
+    assert directory.get("First@Example.com") is not None
+    assert "missing" not in directory
+
+
+async def test_resolve_during_refresh() -> None:
+    """User requested during refresh is not dropped by it."""
+    source = Source(user(1, "first"), user(3, "third"))
+    directory = UserDirectory(source)  # type: ignore[arg-type]
+    await directory.ensure_fresh()
+
+    source.loading.clear()
+    refresh = asyncio.ensure_future(directory.refresh())
+    await asyncio.sleep(0)
+    resolved = asyncio.ensure_future(directory.resolve("new"))
+    await asyncio.sleep(0)
+    source.loading.set()
+    await refresh
+
+    assert (await resolved).uid == source.created.uid
+    assert directory.get("new") is not None
+    assert len(directory) == 3  # noqa: PLR2004
@@ -0,0 +1,57 @@
+from yatracker.tracker.workflow_graph import WorkflowGraph
+from yatracker.types import Status, Transition
+
+
+def status(key: str) -> Status:
+    """Create status by key."""
+    return Status(url=f"/statuses/{key}", id=key, key=key, display=key.title())
+
+
+def transition(to: str) -> Transition:
+    """Create transition to the status."""
+    return Transition(id=f"to_{to}", url=f"/to_{to}", display=to.title(), to=status(to))
+
+
+def make_graph() -> WorkflowGraph:
+    """Create graph: open -> in_progress -> review -> closed, open -> closed."""
+    graph = WorkflowGraph()
+    graph.add(status("open"), [transition("in_progress"), transition("need_info")])
+    graph.add(status("in_progress"), [transition("review"), transition("open")])
+    graph.add(status("review"), [transition("closed"), transition("in_progress")])
+    graph.add(status("need_info"), [transition("open")])
+    return graph
+
+
+def test_find_path_shortest() -> None:
+    """The shortest chain of transitions is found."""
+    path = make_graph().find_path("open", "closed")
+    assert path is not None
+    assert [t.to.key for t in path] == ["in_progress", "review", "closed"]
+
+
+def test_find_path_same_status() -> None:
+    """No transitions are needed to stay in the status."""
+    assert make_graph().find_path("review", "review") == []
+
+
+def test_find_path_unknown() -> None:
+    """Unreachable status has no path."""
+    assert make_graph().find_path("closed", "open") is None
+    assert make_graph().find_path("open", "missing") is None
+
+
+def test_get_status_case_insensitive() -> None:
+    """Statuses are looked up by key or display name in any case."""
+    graph = make_graph()
+    closed = graph.get_status("CLOSED")
+    assert closed is not None
+    assert closed.key == "closed"
+    assert graph.get_status("In_Progress") == graph.statuses["in_progress"]
+
+
+def test_get_transition() -> None:
+    """Transitions are looked up by target status or display name."""
+    graph = make_graph()
+    assert graph.get_transition("open", "need_info") == transition("need_info")
+    assert graph.get_transition("open", "IN_PROGRESS") == transition("in_progress")
+    assert graph.get_transition("closed", "open") is None
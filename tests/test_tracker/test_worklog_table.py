@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from yatracker.tracker.worklog_table import WorklogTable
+
+BERLIN = ZoneInfo("Europe/Berlin")
+
+
+def test_sum_by_user_and_issue() -> None:
+    """Durations are summed by the columns."""
+    table = WorklogTable()
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    table.append("1", "A-1", start, "PT1H")
+    table.append("1", "A-2", start, "PT30M")
+    table.append("2", "A-1", start, 60.0)
+
+    assert table.sum_by("user") == {("1",): 5400.0, ("2",): 60.0}
+    assert table.sum_by("issue", "day") == {
+        ("A-1", date(2024, 1, 1)): 3660.0,
+        ("A-2", date(2024, 1, 1)): 1800.0,
+    }
+
+
+def test_fixed_offset_buckets() -> None:
+    """Days are bucketed in fixed timezone."""
+    table = WorklogTable(timezone(timedelta(hours=3)))
+    table.append("1", "A-1", datetime(2024, 1, 31, 22, tzinfo=timezone.utc), 1.0)
+    assert table.sum_by("day", "month") == {
+        (date(2024, 2, 1), date(2024, 2, 1)): 1.0,
+    }
+
+
+def test_dst_buckets() -> None:
+    """Offset of DST zone is taken for every row."""
+    table = WorklogTable(BERLIN)
+    # 23:30 local time both in winter (UTC+1) and in summer (UTC+2)
+    table.append("1", "A-1", datetime(2024, 1, 15, 22, 30, tzinfo=timezone.utc), 1.0)
+    table.append("1", "A-1", datetime(2024, 7, 15, 21, 30, tzinfo=timezone.utc), 2.0)
+    assert table.sum_by("day") == {
+        (date(2024, 1, 15),): 1.0,
+        (date(2024, 7, 15),): 2.0,
+    }
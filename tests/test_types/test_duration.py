@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+from yatracker.types.duration import Duration, parse_many, parse_seconds
+
+
+@pytest.mark.parametrize(
+    ("iso", "expected"),
+    [
+        ("PT0S", Duration()),
+        ("PT1H30M", Duration(hours=1, minutes=30)),
+        ("P1W2D", Duration(weeks=1, days=2)),
+        ("P1Y2M3DT4H5M6S", Duration(1, 2, 3, 4, 5, 6)),
+    ],
+)
+def test_from_iso(iso: str, expected: Duration) -> None:
+    """ISO duration is parsed to its parts and back."""
+    duration = Duration.from_iso(iso)
+    assert duration == expected
+    assert duration.to_iso() == iso
+
+
+@pytest.mark.parametrize("iso", ["", "P", "PT", "1H", "PT1.5H", "P1H"])
+def test_from_iso_invalid(iso: str) -> None:
+    """Malformed duration is rejected."""
+    with pytest.raises(ValueError, match="ISO duration pattern"):
+        Duration.from_iso(iso)
+
+
+def test_working_time() -> None:
+    """Days and weeks are counted in working hours."""
+    duration = Duration.from_iso("P1W1DT1H")
+    assert duration.total_seconds() == (5 * 8 + 8 + 1) * 3600
+    assert duration.to_timedelta() == timedelta(hours=49)
+    assert Duration.from_seconds(duration.total_seconds()) == duration
+
+
+def test_parse_seconds() -> None:
+    """Memoized parser agrees with Duration."""
+    values = ["PT30M", "P1D", "PT30M"]
+    assert list(parse_many(values)) == [1800.0, 28800.0, 1800.0]
+    assert parse_seconds("P1W") == Duration(weeks=1).total_seconds()
+    with pytest.raises(ValueError, match="ISO duration pattern"):
+        parse_seconds("1H")
+
+
+def test_str_usage_is_deprecated() -> None:
+    """Duration still works like ISO string, but warns."""
+    duration = Duration(hours=2)
+    assert str(duration) == "PT2H"
+    with pytest.deprecated_call():
+        assert duration == "PT2H"
+    with pytest.deprecated_call():
+        assert duration.startswith("PT")
+    with pytest.raises(AttributeError):
+        duration.unknown  # noqa: B018
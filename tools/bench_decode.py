@@ -0,0 +1,94 @@
+"""Benchmark of issues list decoding with tracker binding.
+
+Compares the current `_decode` with the former recursive `_add_tracker`
+walk over every decoded struct, list and dict.
+
+Usage: python tools/bench_decode.py [count] [repeat]
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+from typing import Any
+
+from msgspec import json
+from yatracker import YaTracker
+from yatracker.types import Base, FullIssue
+
+
+def make_issue(i: int) -> dict[str, Any]:
+    """Create raw issue data."""
+    user = {"self": "u", "id": str(i % 50), "display": f"User {i % 50}"}
+    ref = {"self": "r", "id": "1", "key": "key", "display": "Display"}
+    return {
+        "self": f"https://api.tracker.yandex.net/v2/issues/KEY-{i}",
+        "id": str(i),
+        "key": f"KEY-{i}",
+        "version": 1,
+        "summary": f"Issue {i}",
+        "description": "Description " * 10,
+        "type": ref,
+        "priority": ref,
+        "queue": ref,
+        "status": ref,
+        "favorite": False,
+        "followers": [user, user, user],
+        "assignee": user,
+        "aliases": ["a", "b"],
+        "createdAt": "2024-01-01T10:00:00.000+0000",
+        "createdBy": user,
+        "updatedBy": user,
+        "updatedAt": "2024-01-02T10:00:00.000+0000",
+        "votes": 0,
+    }
+
+
+def add_tracker(tracker: Any, obj: Any) -> None:  # noqa: ANN401
+    """Former implementation of tracker binding."""
+    match obj:
+        case Base():
+            obj._tracker = tracker  # noqa: SLF001
+            for field in obj.__struct_fields__:
+                add_tracker(tracker, getattr(obj, field))
+        case list():
+            for o in obj:
+                add_tracker(tracker, o)
+        case dict():
+            for v in obj.values():
+                add_tracker(tracker, v)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 50  # noqa: PLR2004
+
+    data = json.encode([make_issue(i) for i in range(count)])
+    tracker = YaTracker(org_id="1", token="token")  # noqa: S106
+    decoder = json.Decoder(list[FullIssue])
+
+    def before() -> None:
+        add_tracker(tracker, decoder.decode(data))
+
+    def after() -> None:
+        tracker._decode(list[FullIssue], data)  # noqa: SLF001
+
+    def decode_only() -> None:
+        decoder.decode(data)
+
+    issues = tracker._decode(list[FullIssue], data)  # noqa: SLF001
+    assert all(issue._tracker is tracker for issue in issues)  # noqa: SLF001
+
+    print(f"{count} issues, best of {repeat} runs:")  # noqa: T201
+    for name, func in (
+        ("decode only", decode_only),
+        ("decode + recursive walk", before),
+        ("decode + context binding", after),
+    ):
+        best = min(timeit.repeat(func, number=1, repeat=repeat))
+        print(f"  {name:<26} {best * 1000:8.2f} ms")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Microbenchmark of request payload construction.
+
+Compares the current `_prepare_payload` with the former implementation,
+which converted every key with `camel_case` and walked struct fields
+on every call.
+
+Usage: python tools/bench_payload.py [number]
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+from typing import TYPE_CHECKING, Any
+
+from yatracker.tracker.base import BaseTracker
+from yatracker.tracker.payload import _convert_value
+from yatracker.types import FullIssue
+from yatracker.utils.camel_case import camel_case
+
+if TYPE_CHECKING:
+    from collections.abc import Collection
+
+CREATE_ISSUE = {
+    "self": object(),
+    "summary": "Summary",
+    "queue": "KEY",
+    "parent": None,
+    "description": "Description",
+    "sprint": None,
+    "type_": None,
+    "priority": "normal",
+    "followers": ["user1", "user2"],
+    "assignee": None,
+    "unique": "unique-key",
+    "attachment_ids": None,
+    "_type": FullIssue,
+    "kwargs": {"tags": ["a", "b"]},
+}
+EDIT_ISSUE = {"summary": "New summary", "followers": {"add": ["user3"]}}
+POST_WORKLOG = {
+    "self": object(),
+    "issue_id": "KEY-1",
+    "start": "2024-01-01T10:00:00.000+0000",
+    "duration": "PT1H",
+    "comment": "Done",
+}
+
+
+def legacy_prepare_payload(
+    payload: dict[str, Any],
+    exclude: Collection[str] | None = None,
+    type_: Any = None,  # noqa: ANN401
+    extra: Collection[str] | None = None,
+) -> dict[str, Any]:
+    """Former implementation."""
+    payload = payload.copy()
+    exclude = exclude or []
+
+    kwargs: dict | None = payload.pop("kwargs", None)
+    if kwargs:
+        payload.update(kwargs)
+
+    if type_ is not None:
+        renamed: dict[str, Any] = {}
+        skip = {"self", "cls", *exclude}
+        for name, encode_name in zip(
+            type_.__struct_fields__,
+            type_.__struct_encode_fields__,
+            strict=False,
+        ):
+            if name not in payload or name in skip or name.startswith("_"):
+                continue
+            if (value := _convert_value(payload[name])) is not None:
+                renamed[encode_name] = value
+        for name in extra or ():
+            if (value := payload.get(name)) is not None:
+                renamed[camel_case(name)] = _convert_value(value)
+        return renamed
+
+    return {
+        camel_case(k): v
+        for k, v in payload.items()
+        if k not in {"self", "cls", *exclude}
+        and not k.startswith("_")
+        and v is not None
+    }
+
+
+def main() -> None:
+    """Run the benchmark."""
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    prepare = BaseTracker._prepare_payload  # noqa: SLF001
+    extra = ["type_", "unique", "attachment_ids"]
+
+    cases = {
+        "create_issue": (
+            lambda: legacy_prepare_payload(CREATE_ISSUE, type_=FullIssue, extra=extra),
+            lambda: prepare(CREATE_ISSUE, type_=FullIssue, extra=extra),
+        ),
+        "edit_issue": (
+            lambda: legacy_prepare_payload(EDIT_ISSUE, type_=FullIssue),
+            lambda: prepare(EDIT_ISSUE, type_=FullIssue),
+        ),
+        "post_worklog": (
+            lambda: legacy_prepare_payload(POST_WORKLOG, exclude=["issue_id"]),
+            lambda: prepare(POST_WORKLOG, exclude=["issue_id"]),
+        ),
+    }
+
+    print(f"{number} calls, microseconds per call:")  # noqa: T201
+    for name, (before, after) in cases.items():
+        assert before() == after(), name
+        old = min(timeit.repeat(before, number=number, repeat=5)) / number
+        new = min(timeit.repeat(after, number=number, repeat=5)) / number
+        print(f"  {name:<14} {old * 1e6:6.2f} -> {new * 1e6:6.2f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -33,3 +33,42 @@ class AlreadyExistsError(YaTrackerError):
         super().__init__(
             "An issue with the same value of the unique parameter already exists.",
         )
+
+
+class TooManyRequestsError(YaTrackerError):
+    def __init__(self, retry_after: float | None = None) -> None:
+        self.retry_after = retry_after
+        super().__init__(
+            "Too many requests. The request limit was exceeded, try again later.",
+        )
+
+
+class ServerError(YaTrackerError):
+    def __init__(self, status: int, text: str) -> None:
+        self.status = status
+        super().__init__(text)
+
+
+class ChecksumMismatchError(YaTrackerError):
+    def __init__(self, expected: str, actual: str) -> None:
+        self.expected = expected
+        self.actual = actual
+        super().__init__(
+            f"Downloaded file checksum mismatch: expected {expected}, got {actual}.",
+        )
+
+
+class TransitionPathNotFoundError(YaTrackerError):
+    def __init__(self, source: str, target: str) -> None:
+        self.source = source
+        self.target = target
+        super().__init__(
+            f"No known workflow transitions lead from {source!r} to {target!r}.",
+        )
+
+
+class ComponentNotFoundError(YaTrackerError):
+    def __init__(self, queue: str, name: str) -> None:
+        self.queue = queue
+        self.name = name
+        super().__init__(f"Queue {queue!r} has no component named {name!r}.")
@@ -5,10 +5,16 @@ import logging
 from .base import BaseTracker
 from .categories import (
     Attachments,
+    BulkOperations,
+    Checklists,
     Comments,
+    Components,
+    Export,
+    Import,
     Issues,
     Priorities,
     Queues,
+    Users,
     Worklogs,
 )
 
@@ -22,6 +28,12 @@ class YaTracker(
     Priorities,
     Attachments,
     Worklogs,
+    Export,
+    BulkOperations,
+    Import,
+    Checklists,
+    Users,
+    Components,
     BaseTracker,
 ):
     """Represents Yandex Tracker API client.
@@ -1,21 +1,37 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from functools import lru_cache
-from typing import TYPE_CHECKING, Any, TypeVar
-
-from msgspec import convert, json
+from functools import cached_property, partial
+from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 from yatracker.types.base import Base
-from yatracker.utils.camel_case import camel_case
+from yatracker.types.mixins import current_tracker
+from yatracker.utils.concurrency import iter_limited
 
 from .client import AIOHTTPClient
+from .codecs import default_registry
+from .component_cache import ComponentCache
+from .pagination import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_PER_PAGE,
+    Cursor,
+    ScrollPage,
+    get_total_count,
+    get_total_pages,
+    next_scroll_cursor,
+    parse_links,
+)
+from .payload import get_payload_builder
 
 if TYPE_CHECKING:
-    from collections.abc import Collection
+    from collections.abc import AsyncIterator, Collection
     from types import TracebackType
 
-    from .client import BaseClient
+    from .client import BaseClient, Response
+    from .codecs import CodecRegistry
+    from .component_cache import ComponentSource
+    from .identity_map import IdentityMap
 
 T = TypeVar("T")
 B = TypeVar("B", bound=Base)
@@ -26,7 +42,7 @@ logger = logging.getLogger(__name__)
 class BaseTracker:
     """Represents technical methods for using YaTracker."""
 
-    # ruff: noqa: PLR0913
+    # ruff: noqa: PLR0913 PLR0917
     def __init__(
         self,
         org_id: str | int | None = None,
@@ -34,7 +50,17 @@ class BaseTracker:
         client: BaseClient | None = None,
         api_host: str | None = None,
         api_version: str | None = None,
+        codecs: CodecRegistry | None = None,
+        identity_map: IdentityMap | None = None,
+        **kwargs,
     ) -> None:
+        """Set up tracker.
+
+        Pass `codecs` to use your own registry of JSON decoders.
+        Pass `identity_map` to intern nested reference objects
+        (users, statuses, queues...) of decoded responses.
+        Extra `kwargs` (e.g. `rate_limiter`) are passed to the default client.
+        """
         if (org_id is None or token is None) and client is None:
             msg = (
                 "You must provide either `org_id` and `token` or `BaseClient` "
@@ -43,6 +69,9 @@ class BaseTracker:
             )
             raise RuntimeError(msg)
 
+        self.codecs = codecs or default_registry
+        self.identity_map = identity_map
+
         if client is not None:
             self._client = client
         else:
@@ -55,42 +84,225 @@ class BaseTracker:
                 token=token,
                 api_host=api_host,
                 api_version=api_version,
+                encoder=self.codecs.encoder,
+                **kwargs,
             )
 
     def _decode(self, type_: type[T], data: bytes) -> T:
         """Decode bytes object to struct.
 
-        Also add producer client object to `_tracker` field.
+        Also add producer client object to `_tracker` field
+        of `TrackerBound` objects.
         """
-        decoder = _get_decoder(type_)  # type: ignore[arg-type]
-        obj = decoder.decode(data)
-        _add_tracker(self, obj)
+        decoder = self.codecs.get_decoder(type_)
+        token = current_tracker.set(self)
+        try:
+            obj = decoder.decode(data)
+        finally:
+            current_tracker.reset(token)
+
+        if self.identity_map is not None:
+            obj = self.identity_map.intern(obj)
         return obj
 
+    def _decode_list(self, type_: type[T], data: bytes) -> list[T]:
+        """Decode bytes object to list of structs."""
+        decoder = self.codecs.get_list_decoder(type_)
+        token = current_tracker.set(self)
+        try:
+            obj = decoder.decode(data)
+        finally:
+            current_tracker.reset(token)
+
+        if self.identity_map is not None:
+            obj = self.identity_map.intern(obj)
+        return obj
+
+    def warmup(self) -> int:
+        """Build JSON decoders of all the known types in advance.
+
+        Call it on startup to avoid building them on the first requests.
+        :return: count of built decoders.
+        """
+        return self.codecs.warmup()
+
+    @cached_property
+    def component_cache(self) -> ComponentCache:
+        """Get components of queues cached by name.
+
+        Names passed as `components` to `create_issue` and `edit_issue`
+        are resolved by it, components are loaded by `Components` category.
+        """
+        return ComponentCache(cast("ComponentSource", self))
+
+    async def _iter_scroll(
+        self,
+        type_: type[T],
+        method: str,
+        uri: str,
+        params: dict[str, Any] | None = None,
+        payload: dict[str, Any] | None = None,
+    ) -> AsyncIterator[list[T]]:
+        """Iterate via scrollable pages.
+
+        The next page is requested while the current one is being processed,
+        so only two pages are held in memory at once.
+        """
+        pages = self._scroll(type_, method, Cursor(uri=uri, params=params), payload)
+        async for page in pages:
+            yield page.items
+
+    async def _scroll(
+        self,
+        type_: type[T],
+        method: str,
+        cursor: Cursor,
+        payload: dict[str, Any] | None = None,
+        received: int = 0,
+        *,
+        prefetch: bool = True,
+    ) -> AsyncIterator[ScrollPage]:
+        """Iterate via scrollable pages starting from the cursor.
+
+        Yields items of a page with cursor of the next one (None for the last).
+        With `prefetch` the next page is requested while the current one
+        is being processed.
+        """
+        task: asyncio.Task[Response] | None = self._fetch_page(method, cursor, payload)
+        try:
+            while task is not None:
+                response = await task
+                task = None
+
+                items = self._decode_list(type_, response.body)
+                if not items:
+                    break
+
+                received += len(items)
+                total = get_total_count(response.headers)
+                next_cursor = next_scroll_cursor(response, cursor)
+                if next_cursor is not None and total is not None and received >= total:
+                    next_cursor = None
+
+                if next_cursor is not None and prefetch:
+                    task = self._fetch_page(method, next_cursor, payload)
+
+                yield ScrollPage(items, total, next_cursor)
+
+                if next_cursor is not None and not prefetch:
+                    task = self._fetch_page(method, next_cursor, payload)
+                cursor = next_cursor or cursor
+        finally:
+            if task is not None:
+                task.cancel()
+
+    async def _iter_pages(
+        self,
+        type_: type[T],
+        method: str,
+        uri: str,
+        params: dict[str, Any] | None = None,
+        payload: dict[str, Any] | None = None,
+        per_page: int = DEFAULT_PER_PAGE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> AsyncIterator[list[T]]:
+        """Iterate via numbered pages in order.
+
+        The first page is used to get total pages count from headers,
+        the rest of the pages are fetched concurrently (no more than
+        `concurrency` requests at once).
+        If the count is unknown, pages are followed one by one via `Link`.
+        """
+        params = {**(params or {}), "perPage": per_page}
+        response = await self._client.fetch(
+            method=method,
+            uri=uri,
+            params={**params, "page": 1},
+            payload=payload,
+        )
+        yield self._decode_list(type_, response.body)
+
+        total_pages = get_total_pages(response.headers, per_page)
+        if total_pages is None:
+            while next_url := parse_links(response.headers.get("Link")).get("next"):
+                response = await self._client.fetch(
+                    method=method,
+                    uri=next_url,
+                    payload=payload,
+                )
+                yield self._decode_list(type_, response.body)
+            return
+
+        requests = (
+            partial(
+                self._client.fetch,
+                method=method,
+                uri=uri,
+                params={**params, "page": page},
+                payload=payload,
+            )
+            for page in range(2, total_pages + 1)
+        )
+        async for response in iter_limited(requests, concurrency):
+            yield self._decode_list(type_, response.body)
+
+    async def _paginate(
+        self,
+        type_: type[T],
+        method: str,
+        uri: str,
+        params: dict[str, Any] | None = None,
+        payload: dict[str, Any] | None = None,
+        per_page: int = DEFAULT_PER_PAGE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[T]:
+        """Get objects from all the pages as a single ordered list."""
+        pages = self._iter_pages(
+            type_,
+            method=method,
+            uri=uri,
+            params=params,
+            payload=payload,
+            per_page=per_page,
+            concurrency=concurrency,
+        )
+        return [obj async for page in pages for obj in page]
+
+    def _fetch_page(
+        self,
+        method: str,
+        cursor: Cursor,
+        payload: dict[str, Any] | None = None,
+    ) -> asyncio.Task[Response]:
+        """Schedule page request in background."""
+        kwargs: dict[str, Any] = {"headers": cursor.headers} if cursor.headers else {}
+        return asyncio.create_task(
+            self._client.fetch(
+                method=method,
+                uri=cursor.uri,
+                params=cursor.params,
+                payload=payload,
+                **kwargs,
+            ),
+        )
+
     @staticmethod
     def _prepare_payload(
         payload: dict[str, Any],
         exclude: Collection[str] | None = None,
         type_: type[B] | None = None,
+        extra: Collection[str] | None = None,
     ) -> dict[str, Any]:
-        """Remove empty fields from payload."""
-        payload = payload.copy()
-        exclude = exclude or []
-
-        kwargs: dict | None = payload.pop("kwargs", None)
-        if kwargs:
-            payload.update(kwargs)
-
-        if type_ is not None:
-            return _rename_and_clear(type_, payload, exclude)
+        """Remove empty fields from payload.
 
-        return {
-            camel_case(k): _convert_value(v)
-            for k, v in payload.items()
-            if k not in {"self", "cls", *exclude}
-            and not k.startswith("_")
-            and v is not None
-        }
+        With `type_` only its fields are kept, plus `extra` ones.
+        """
+        builder = get_payload_builder(
+            type_,  # type: ignore[arg-type]
+            tuple(exclude or ()),
+            tuple(extra or ()),
+        )
+        return builder.build(payload)
 
     async def close(self) -> None:
         """Close gracefully."""
@@ -109,63 +321,3 @@ class BaseTracker:
     ) -> None:
         """Close async context."""
         await self.close()
-
-
-@lru_cache
-def _get_decoder(type_: type[T]) -> json.Decoder:
-    """Get cached msgspec encoder."""
-    return json.Decoder(type_)
-
-
-def _add_tracker(tracker: BaseTracker, obj: Any) -> None:  # noqa: ANN401
-    """Add tracker link to the object."""
-    match obj:
-        case Base():
-            obj._tracker = tracker  # noqa: SLF001
-            for field in obj.__struct_fields__:
-                _add_tracker(tracker, getattr(obj, field))
-        case list():
-            for o in obj:
-                _add_tracker(tracker, o)
-        case dict():
-            for v in obj.values():
-                _add_tracker(tracker, v)
-
-
-def _convert_value(obj: Any) -> Any:  # noqa: ANN401
-    """Convert values to basic types."""
-    match obj:
-        case Base():
-            return convert(obj, dict)
-        case list():
-            return [_convert_value(o) for o in obj]
-        case dict():
-            return {k: _convert_value(v) for k, v in obj.items()}
-        case _:
-            return obj
-
-
-def _rename_and_clear(
-    type_: type[B],
-    payload: dict[str, Any],
-    exclude: Collection[str],
-) -> dict[str, Any]:
-    """Replace kwarg key with original field name."""
-    renamed: dict[str, Any] = {}
-    exclude = {"self", "cls", *exclude}
-
-    for name, encode_name in zip(
-        type_.__struct_fields__,
-        type_.__struct_encode_fields__,  # type: ignore[attr-defined]
-        strict=False,
-    ):
-        if name not in payload or name in exclude or name.startswith("_"):
-            continue
-
-        value = _convert_value(payload[name])
-        if value is None:
-            continue
-
-        renamed[encode_name] = value
-
-    return renamed
@@ -0,0 +1,51 @@
+"""Bulk change helpers module."""
+
+from __future__ import annotations
+
+from itertools import islice
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from yatracker.types import BulkChange, BulkChangeFailure
+
+# max count of issues sent in a single bulk change
+BULK_BATCH_SIZE = 1000
+
+DEFAULT_POLL_INTERVAL = 1.0
+MAX_POLL_INTERVAL = 30.0
+POLL_BACKOFF = 1.5
+
+
+class BulkResult(NamedTuple):
+    """Represents finished bulk operation split into bulk changes."""
+
+    changes: list[BulkChange]
+    failures: list[BulkChangeFailure]
+
+    @property
+    def ok(self) -> bool:
+        """Check all the issues were changed."""
+        return not self.failures
+
+
+def iter_batches(issues: Iterable[str], size: int) -> Iterator[list[str]]:
+    """Split issue keys into batches, drop repeated keys."""
+    if size < 1:
+        msg = "Batch size must be positive."
+        raise ValueError(msg)
+
+    keys = iter(dict.fromkeys(issues))
+    while batch := list(islice(keys, size)):
+        yield batch
+
+
+def iter_delays(
+    interval: float = DEFAULT_POLL_INTERVAL,
+    max_interval: float = MAX_POLL_INTERVAL,
+) -> Iterator[float]:
+    """Get delays between status polls growing up to `max_interval`."""
+    while True:
+        yield interval
+        interval = min(max_interval, interval * POLL_BACKOFF)
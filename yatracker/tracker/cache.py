@@ -0,0 +1,237 @@
+"""HTTP response cache module."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import re
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
+
+import msgspec
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+DEFAULT_TTL = 300.0
+DEFAULT_MAXSIZE = 1024
+
+# reference endpoints which data is rarely changed
+DEFAULT_PATHS = (
+    r"/queues/?",
+    r"/queues/[^/]+/?",
+    r"/queues/[^/]+/fields/?",
+    r"/queues/[^/]+/versions/?",
+    r"/priorities/?",
+)
+
+
+class CacheEntry(msgspec.Struct, array_like=True):
+    """Represents cached response."""
+
+    body: bytes
+    headers: dict[str, str]
+    expires: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def is_fresh(self) -> bool:
+        """Check entry is not expired."""
+        return self.expires > time.time()
+
+    def get_validators(self) -> dict[str, str]:
+        """Get conditional request headers."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class CacheBackend(ABC):
+    """Represents abstract cache storage."""
+
+    @abstractmethod
+    async def get(self, key: str) -> CacheEntry | None:
+        """Get entry by key."""
+
+    @abstractmethod
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        """Save entry by key."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Delete entry by key."""
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Delete all entries."""
+
+
+class MemoryBackend(CacheBackend):
+    """Represents in-memory LRU storage."""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+
+    async def get(self, key: str) -> CacheEntry | None:
+        """Get entry by key."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        """Save entry by key, evict the least recently used ones."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        """Delete entry by key."""
+        self._entries.pop(key, None)
+
+    async def clear(self) -> None:
+        """Delete all entries."""
+        self._entries.clear()
+
+
+class FileBackend(CacheBackend):
+    """Represents on-disk LRU storage.
+
+    Every entry is a msgpack file, its modification time is updated on read,
+    so the least recently used files are evicted first.
+    """
+
+    def __init__(self, directory: str | Path, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        self.directory = Path(directory)
+        self.maxsize = maxsize
+        self._encoder = msgspec.msgpack.Encoder()
+        self._decoder = msgspec.msgpack.Decoder(CacheEntry)
+
+    def _path(self, key: str) -> Path:
+        name = hashlib.sha256(key.encode()).hexdigest()
+        return self.directory / f"{name}.msgpack"
+
+    async def get(self, key: str) -> CacheEntry | None:
+        """Get entry by key."""
+        return await asyncio.to_thread(self._get, key)
+
+    def _get(self, key: str) -> CacheEntry | None:
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+        try:
+            entry = self._decoder.decode(data)
+        except msgspec.DecodeError:
+            path.unlink(missing_ok=True)
+            return None
+
+        path.touch()
+        return entry
+
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        """Save entry by key, evict the least recently used ones."""
+        await asyncio.to_thread(self._set, key, entry)
+
+    def _set(self, key: str, entry: CacheEntry) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(self._encoder.encode(entry))
+        tmp.replace(path)
+
+        files = list(self.directory.glob("*.msgpack"))
+        if len(files) <= self.maxsize:
+            return
+
+        files.sort(key=lambda f: f.stat().st_mtime)
+        for file in files[: len(files) - self.maxsize]:
+            file.unlink(missing_ok=True)
+
+    async def delete(self, key: str) -> None:
+        """Delete entry by key."""
+        await asyncio.to_thread(self._path(key).unlink, missing_ok=True)
+
+    async def clear(self) -> None:
+        """Delete all entries."""
+        await asyncio.to_thread(self._clear)
+
+    def _clear(self) -> None:
+        for file in self.directory.glob("*.msgpack"):
+            file.unlink(missing_ok=True)
+
+
+class ResponseCache:
+    """Represents opt-in cache of GET responses.
+
+    Fresh entries (younger than `ttl`) are returned without a request.
+    Expired ones are revalidated with `If-None-Match`/`If-Modified-Since`
+    headers, if the response has `ETag`/`Last-Modified`.
+    Only URLs matching one of `paths` patterns are cached.
+    Entries are kept per organization and token, so a cache
+    may be shared by several clients.
+
+    >>> cache = ResponseCache(FileBackend("/tmp/yatracker"), ttl=600)
+    >>> tracker = YaTracker(org_id=..., token=..., cache=cache)
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend | None = None,
+        ttl: float = DEFAULT_TTL,
+        paths: Iterable[str] = DEFAULT_PATHS,
+    ) -> None:
+        self.backend = backend or MemoryBackend()
+        self.ttl = ttl
+        self._pattern = re.compile("|".join(f"(?:.*{p})" for p in paths))
+
+    def is_cacheable(self, method: str, url: str) -> bool:
+        """Check the request could be cached."""
+        if method.upper() != "GET":
+            return False
+        return self._pattern.fullmatch(urlsplit(url).path) is not None
+
+    @staticmethod
+    def make_scope(org_id: str, authorization: str) -> str:
+        """Get identity of the client responses are cached for.
+
+        Backends may be shared by clients of different organizations
+        and tokens, so their entries never collide.
+        The token is hashed to keep it out of the storage.
+        """
+        digest = hashlib.sha256(authorization.encode()).hexdigest()[:32]
+        return f"{org_id}:{digest}"
+
+    @staticmethod
+    def make_key(
+        url: str,
+        params: Mapping[str, Any] | None = None,
+        scope: str = "",
+    ) -> str:
+        """Get cache key of the request made by the client of `scope`."""
+        key = f"{scope}|{url}"
+        if not params:
+            return key
+        query = "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+        return f"{key}?{query}"
+
+    def make_entry(self, body: bytes, headers: Mapping[str, str]) -> CacheEntry:
+        """Create new cache entry from response."""
+        return CacheEntry(
+            body=body,
+            headers={str(k): v for k, v in headers.items()},
+            expires=time.time() + self.ttl,
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+        )
@@ -1,15 +1,27 @@
 from .attached_files import Attachments
+from .bulk_operations import BulkOperations
+from .checklists import Checklists
 from .comments import Comments
+from .components import Components
+from .export import Export
+from .import_ import Import
 from .issues import Issues
 from .priorities import Priorities
 from .queues import Queues
+from .users import Users
 from .worklogs import Worklogs
 
 __all__ = [
     "Attachments",
+    "BulkOperations",
+    "Checklists",
     "Comments",
+    "Components",
+    "Export",
+    "Import",
     "Issues",
     "Priorities",
     "Queues",
+    "Users",
     "Worklogs",
 ]
@@ -1,11 +1,22 @@
 from __future__ import annotations
 
-from typing import BinaryIO
-
-from aiohttp import FormData
+import hashlib
+from functools import partial
+from http import HTTPStatus
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO
 
+from yatracker.exceptions import ChecksumMismatchError
 from yatracker.tracker.base import BaseTracker
+from yatracker.tracker.pagination import DEFAULT_CONCURRENCY
 from yatracker.types import Attachment
+from yatracker.utils import files
+from yatracker.utils.concurrency import gather_limited
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Iterable
+
+    from yatracker.utils.files import FileSource
 
 
 class Attachments(BaseTracker):
@@ -19,7 +30,7 @@ class Attachments(BaseTracker):
             method="GET",
             uri=f"/issues/{issue_id}/attachments",
         )
-        return self._decode(list[Attachment], data)
+        return self._decode_list(Attachment, data)
 
     async def download_attachment(
         self,
@@ -29,6 +40,9 @@ class Attachments(BaseTracker):
     ) -> bytes:
         """Download file attached to an issue.
 
+        The whole file is loaded into memory,
+        use `iter_attachment` or `save_attachment` for large files.
+
         Source:
         https://cloud.yandex.com/en/docs/tracker/concepts/issues/get-attachment
         """
@@ -52,19 +66,117 @@ class Attachments(BaseTracker):
             uri=f"/issues/{issue_id}/thumbnails/{attachment_id}",
         )
 
+    async def iter_attachment(
+        self,
+        issue_id: str,
+        attachment_id: str | int,
+        filename: str,
+        chunk_size: int = files.DEFAULT_CHUNK_SIZE,
+        offset: int = 0,
+    ) -> AsyncIterator[bytes]:
+        """Download file attached to an issue by chunks.
+
+        The file is never fully buffered in memory.
+        Pass `offset` to start from the given byte (HTTP Range request).
+        """
+        uri = f"/issues/{issue_id}/attachments/{attachment_id}/{filename}"
+        headers = {"Range": f"bytes={offset}-"} if offset else None
+        async with self._client.stream(
+            "GET",
+            uri,
+            headers=headers,
+            chunk_size=chunk_size,
+        ) as response:
+            if response.status == HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE:
+                return
+            async for chunk in response.chunks:
+                yield chunk
+
+    async def iter_thumbnail(
+        self,
+        issue_id: str,
+        attachment_id: str | int,
+        chunk_size: int = files.DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Get thumbnail of image file attached to an issue by chunks."""
+        uri = f"/issues/{issue_id}/thumbnails/{attachment_id}"
+        async with self._client.stream("GET", uri, chunk_size=chunk_size) as response:
+            async for chunk in response.chunks:
+                yield chunk
+
+    # ruff: noqa: PLR0913
+    async def save_attachment(
+        self,
+        issue_id: str,
+        attachment_id: str | int,
+        filename: str,
+        destination: str | Path | BinaryIO,
+        *,
+        chunk_size: int = files.DEFAULT_CHUNK_SIZE,
+        resume: bool = True,
+        checksum: str | None = None,
+        algorithm: str = "sha256",
+    ) -> int:
+        """Download file attached to an issue straight to the destination.
+
+        If destination is a path to partially downloaded file and `resume`
+        is set, only the rest of the file is requested.
+        Pass expected hex digest as `checksum` to verify the whole file.
+
+        :return: Size of the file in bytes.
+        """
+        uri = f"/issues/{issue_id}/attachments/{attachment_id}/{filename}"
+        hasher = hashlib.new(algorithm) if checksum else None
+
+        if not isinstance(destination, (str, Path)):
+            async with self._client.stream("GET", uri, chunk_size=chunk_size) as resp:
+                size = await _write_chunks(resp.chunks, destination, hasher)
+            _verify_checksum(hasher, checksum)
+            return size
+
+        path = Path(destination)
+        offset = _get_size(path) if resume else 0
+        headers = {"Range": f"bytes={offset}-"} if offset else None
+
+        async with self._client.stream(
+            "GET",
+            uri,
+            headers=headers,
+            chunk_size=chunk_size,
+        ) as resp:
+            # server may ignore Range header and send the whole file
+            if resp.status == HTTPStatus.OK:
+                offset = 0
+            if hasher is not None and offset:
+                _hash_file(path, hasher, chunk_size)
+
+            size = offset
+            # 416 means the file is already downloaded
+            if resp.status != HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE:
+                with path.open("ab" if offset else "wb") as f:  # noqa: ASYNC230
+                    size += await _write_chunks(resp.chunks, f, hasher)
+
+        _verify_checksum(hasher, checksum)
+        return size
+
     async def attach_file(
         self,
         issue_id: str,
-        file: BinaryIO,
+        file: FileSource,
         filename: str | None = None,
+        progress: Callable[[str, int, int | None], Any] | None = None,
+        chunk_size: int = files.DEFAULT_CHUNK_SIZE,
     ) -> Attachment:
         """Attach a file to an issue.
 
+        File may be passed as a path, a binary file object or an async
+        iterable of bytes; it's streamed by chunks without buffering.
+        `progress` is called with (filename, sent bytes, total bytes or None).
+
         Source:
         https://cloud.yandex.com/en/docs/tracker/concepts/issues/post-attachment
         """
-        form = FormData()
-        form.add_field("file_data", file)
+        form, filename = files.prepare_form(file, filename, progress, chunk_size)
         data = await self._client.request(
             method="POST",
             uri=f"/issues/{issue_id}/attachments",
@@ -75,19 +187,24 @@ class Attachments(BaseTracker):
 
     async def upload_temp_file(
         self,
-        file: BinaryIO,
+        file: FileSource,
         filename: str | None = None,
+        progress: Callable[[str, int, int | None], Any] | None = None,
+        chunk_size: int = files.DEFAULT_CHUNK_SIZE,
     ) -> Attachment:
         """Upload temporary file.
 
         Use this request to upload a file to Tracker first, and then
         attach it when creating an issue or adding a comment.
 
+        File may be passed as a path, a binary file object or an async
+        iterable of bytes; it's streamed by chunks without buffering.
+        `progress` is called with (filename, sent bytes, total bytes or None).
+
         Source:
         https://cloud.yandex.com/en/docs/tracker/concepts/issues/temp-attachment
         """
-        form = FormData()
-        form.add_field("file_data", file)
+        form, filename = files.prepare_form(file, filename, progress, chunk_size)
         data = await self._client.request(
             method="POST",
             uri="/attachments/",
@@ -96,6 +213,25 @@ class Attachments(BaseTracker):
         )
         return self._decode(Attachment, data)
 
+    async def upload_many(
+        self,
+        paths: Iterable[str | Path],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        progress: Callable[[str, int, int | None], Any] | None = None,
+    ) -> list[str]:
+        """Upload many temporary files concurrently.
+
+        >>> ids = await tracker.upload_many(paths, concurrency=8)
+        >>> await tracker.create_issue("Summary", "KEY", attachment_ids=ids)
+
+        :return: Attachment ids in the order of `paths`.
+        """
+        requests = (
+            partial(self.upload_temp_file, path, progress=progress) for path in paths
+        )
+        attachments = await gather_limited(requests, concurrency)
+        return [attachment.id for attachment in attachments]
+
     async def delete_attachment(self, issue_id: str, attachment_id: str | int) -> bool:
         """Delete attached file.
 
@@ -107,3 +243,42 @@ class Attachments(BaseTracker):
             uri=f"/issues/{issue_id}/attachments/{attachment_id}/",
         )
         return True
+
+
+async def _write_chunks(
+    chunks: AsyncIterator[bytes],
+    file: BinaryIO,
+    hasher: hashlib._Hash | None = None,
+) -> int:
+    """Write chunks to the file, return count of written bytes."""
+    written = 0
+    async for chunk in chunks:
+        file.write(chunk)
+        written += len(chunk)
+        if hasher is not None:
+            hasher.update(chunk)
+    return written
+
+
+def _get_size(path: Path) -> int:
+    """Get size of partially downloaded file."""
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+def _hash_file(path: Path, hasher: hashlib._Hash, chunk_size: int) -> None:
+    """Update hasher with the file content."""
+    with path.open("rb") as f:
+        while block := f.read(chunk_size):
+            hasher.update(block)
+
+
+def _verify_checksum(hasher: hashlib._Hash | None, checksum: str | None) -> None:
+    if hasher is None or checksum is None:
+        return
+
+    digest = hasher.hexdigest()
+    if digest.lower() != checksum.lower():
+        raise ChecksumMismatchError(expected=checksum, actual=digest)
@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import asyncio
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import ClientError
+
+from yatracker.exceptions import YaTrackerError
+from yatracker.tracker.base import BaseTracker
+from yatracker.tracker.bulk import (
+    BULK_BATCH_SIZE,
+    DEFAULT_POLL_INTERVAL,
+    MAX_POLL_INTERVAL,
+    BulkResult,
+    iter_batches,
+    iter_delays,
+)
+from yatracker.tracker.pagination import DEFAULT_CONCURRENCY
+from yatracker.types import BulkChange, BulkChangeFailure, Transition
+from yatracker.utils.concurrency import gather_limited
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+class BulkOperations(BaseTracker):
+    # ruff: noqa: PLR0913
+    async def bulk_update(
+        self,
+        issues: Iterable[str],
+        *,
+        notify: bool = True,
+        batch_size: int = BULK_BATCH_SIZE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        wait: bool = True,
+        timeout: float | None = None,
+        **kwargs,
+    ) -> BulkResult:
+        """Make the same changes to many issues.
+
+        Issue fields are set by `kwargs` in the same format as for `edit_issue`.
+        Keys are split into batches of `batch_size` issues,
+        every batch becomes a bulk change executed by the server.
+
+        >>> result = await tracker.bulk_update(keys, priority="minor")
+        >>> result.failures
+        [BulkChangeFailure(issue_key='KEY-1', reason='...')]
+
+        Source:
+        https://cloud.yandex.com/en/docs/tracker/concepts/bulkchange/bulk-update-issues
+        """
+        payload = {"values": self._prepare_payload(kwargs)}
+        return await self._bulk_change(
+            uri="/bulkchange/_update",
+            issues=issues,
+            payload=payload,
+            notify=notify,
+            batch_size=batch_size,
+            concurrency=concurrency,
+            wait=wait,
+            timeout=timeout,
+        )
+
+    async def bulk_move(
+        self,
+        issues: Iterable[str],
+        queue_key: str,
+        *,
+        move_all_fields: bool = False,
+        initial_status: bool = False,
+        notify: bool = True,
+        batch_size: int = BULK_BATCH_SIZE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        wait: bool = True,
+        timeout: float | None = None,
+        **kwargs,
+    ) -> BulkResult:
+        """Move many issues to a different queue.
+
+        Works like `move_issue` for every issue, fields of the moved
+        issues may be changed by `kwargs`.
+
+        Source:
+        https://cloud.yandex.com/en/docs/tracker/concepts/bulkchange/bulk-move-issues
+        """
+        payload: dict[str, Any] = {"queue": queue_key}
+        if move_all_fields:
+            payload["moveAllFields"] = move_all_fields
+        if initial_status:
+            payload["initialStatus"] = initial_status
+        if kwargs:
+            payload["values"] = self._prepare_payload(kwargs)
+
+        return await self._bulk_change(
+            uri="/bulkchange/_move",
+            issues=issues,
+            payload=payload,
+            notify=notify,
+            batch_size=batch_size,
+            concurrency=concurrency,
+            wait=wait,
+            timeout=timeout,
+        )
+
+    async def bulk_transition(
+        self,
+        issues: Iterable[str],
+        transition: Transition | str,
+        *,
+        notify: bool = True,
+        batch_size: int = BULK_BATCH_SIZE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        wait: bool = True,
+        timeout: float | None = None,
+        **kwargs,
+    ) -> BulkResult:
+        """Change status of many issues.
+
+        `transition` is a transition object or its id,
+        fields changed by the transition may be set by `kwargs`.
+
+        Source:
+        https://cloud.yandex.com/en/docs/tracker/concepts/bulkchange/bulk-transition
+        """
+        if isinstance(transition, Transition):
+            transition = transition.id
+
+        payload: dict[str, Any] = {"transition": transition}
+        if kwargs:
+            payload["values"] = self._prepare_payload(kwargs)
+
+        return await self._bulk_change(
+            uri="/bulkchange/_transition",
+            issues=issues,
+            payload=payload,
+            notify=notify,
+            batch_size=batch_size,
+            concurrency=concurrency,
+            wait=wait,
+            timeout=timeout,
+        )
+
+    async def get_bulk_change(self, bulk_change_id: str) -> BulkChange:
+        """Get status of the bulk change."""
+        data = await self._client.request(
+            method="GET",
+            uri=f"/bulkchange/{bulk_change_id}",
+        )
+        return self._decode(BulkChange, data)
+
+    async def get_bulk_change_failures(
+        self,
+        bulk_change_id: str,
+    ) -> list[BulkChangeFailure]:
+        """Get issues which were not changed by the bulk change."""
+        data = await self._client.request(
+            method="GET",
+            uri=f"/bulkchange/{bulk_change_id}/failed",
+        )
+        return self._decode_list(BulkChangeFailure, data)
+
+    async def wait_bulk_change(
+        self,
+        bulk_change_id: str,
+        *,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        max_poll_interval: float = MAX_POLL_INTERVAL,
+        timeout: float | None = None,
+    ) -> BulkChange:
+        """Poll status of the bulk change until it's finished.
+
+        Delays between polls grow from `poll_interval` up to
+        `max_poll_interval`. `asyncio.TimeoutError` is raised
+        after `timeout` seconds.
+        """
+
+        async def poll() -> BulkChange:
+            delays = iter_delays(poll_interval, max_poll_interval)
+            while True:
+                change = await self.get_bulk_change(bulk_change_id)
+                if change.is_finished:
+                    return change
+                await asyncio.sleep(next(delays))
+
+        return await asyncio.wait_for(poll(), timeout)
+
+    async def _bulk_change(
+        self,
+        *,
+        uri: str,
+        issues: Iterable[str],
+        payload: dict[str, Any],
+        notify: bool,
+        batch_size: int,
+        concurrency: int,
+        wait: bool,
+        timeout: float | None,
+    ) -> BulkResult:
+        """Submit bulk changes by batches concurrently and wait for them.
+
+        Batches rejected by the API are reported as failures of their issues.
+        """
+        params = {"notify": "false"} if not notify else None
+        batches = list(iter_batches(issues, batch_size))
+        submitted = await gather_limited(
+            (
+                partial(
+                    self._submit_bulk_change,
+                    uri,
+                    params,
+                    {**payload, "issues": b},
+                    b,
+                )
+                for b in batches
+            ),
+            concurrency,
+        )
+
+        submitted_batches: list[list[str]] = []
+        changes: list[BulkChange] = []
+        failures: list[BulkChangeFailure] = []
+        for batch, result in zip(batches, submitted, strict=True):
+            if isinstance(result, BulkChange):
+                submitted_batches.append(batch)
+                changes.append(result)
+            else:
+                failures.extend(result)
+
+        if not wait:
+            return BulkResult(changes, failures)
+
+        finished = await gather_limited(
+            (
+                partial(self._finish_bulk_change, change, batch, timeout)
+                for change, batch in zip(changes, submitted_batches, strict=True)
+            ),
+            concurrency,
+        )
+        changes = []
+        for change, items in finished:
+            changes.append(change)
+            failures.extend(items)
+        return BulkResult(changes, failures)
+
+    async def _finish_bulk_change(
+        self,
+        change: BulkChange,
+        batch: list[str],
+        timeout: float | None,
+    ) -> tuple[BulkChange, list[BulkChangeFailure]]:
+        """Wait for the bulk change and get its failures.
+
+        Errors of waiting are reported as failures of the whole batch,
+        so the other bulk changes are not affected.
+        """
+        try:
+            change = await self.wait_bulk_change(change.id, timeout=timeout)
+            if (
+                change.status != "FAILED"
+                and change.total_completed_issues == change.total_issues
+            ):
+                return change, []
+            return change, await self.get_bulk_change_failures(change.id)
+        except asyncio.TimeoutError:
+            reason = f"Bulk change {change.id} is not finished in {timeout}s."
+        except (YaTrackerError, ClientError) as e:
+            reason = f"Bulk change {change.id} status is unknown: {e!r}"
+        return change, _fail_batch(batch, reason)
+
+    async def _submit_bulk_change(
+        self,
+        uri: str,
+        params: dict[str, str] | None,
+        payload: dict[str, Any],
+        batch: list[str],
+    ) -> BulkChange | list[BulkChangeFailure]:
+        """Create a bulk change.
+
+        Errors of creation are reported as failures of the whole batch
+        instead of raising them.
+        """
+        try:
+            data = await self._client.request(
+                method="POST",
+                uri=uri,
+                params=params,
+                payload=payload,
+            )
+        except YaTrackerError as e:
+            reason = str(e)
+        except (ClientError, asyncio.TimeoutError) as e:
+            reason = f"Bulk change is not created: {e!r}"
+        else:
+            return self._decode(BulkChange, data)
+        return _fail_batch(batch, reason)
+
+
+def _fail_batch(batch: list[str], reason: str) -> list[BulkChangeFailure]:
+    """Report all the issues of the batch as failed."""
+    return [BulkChangeFailure(issue_key=key, reason=reason) for key in batch]
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import asyncio
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import ClientError
+
+from yatracker.exceptions import YaTrackerError
+from yatracker.tracker.base import BaseTracker
+from yatracker.tracker.pagination import DEFAULT_CONCURRENCY
+from yatracker.types import ChecklistDeadline, ChecklistItem, ChecklistItemChange
+from yatracker.types.checklist import IssueChecklist
+from yatracker.utils.concurrency import gather_limited
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Collection, Iterable, Mapping
+    from datetime import datetime
+
+# errors of a single issue returned by batch methods instead of raising
+ChecklistError = YaTrackerError | ClientError | asyncio.TimeoutError
+
+
+class Checklists(BaseTracker):
+    async def get_checklist(self, issue_id: str) -> list[ChecklistItem]:
+        """Get checklist items of the issue.
+
+        Source:
+        https://cloud.yandex.com/en/docs/tracker/concepts/issues/get-checklist
+        """
+        data = await self._client.request(
+            method="GET",
+            uri=f"/issues/{issue_id}/checklistItems",
+        )
+        return self._decode_list(ChecklistItem, data)
+
+    async def add_checklist_item(
+        self,
+        issue_id: str,
+        text: str,
+        checked: bool | None = None,  # noqa: FBT001
+        assignee: str | None = None,
+        deadline: datetime | ChecklistDeadline | None = None,
+    ) -> list[ChecklistItem]:
+        """Add an item to the end of the checklist.
+
+        Source:
+        https://cloud.yandex.com/en/docs/tracker/concepts/issues/add-checklist-item
+
+        :return: All the checklist items.
+        """
+        if deadline is not None and not isinstance(deadline, ChecklistDeadline):
+            deadline = ChecklistDeadline(date=deadline, deadline_type="date")
+
+        payload = self._prepare_payload(locals(), exclude=["issue_id"])
+        data = await self._client.request(
+            method="POST",
+            uri=f"/issues/{issue_id}/checklistItems",
+            payload=payload,
+        )
+        return self._decode(IssueChecklist, data).checklist_items
+
+    # ruff: noqa: PLR0913 PLR0917
+    async def edit_checklist_item(
+        self,
+        issue_id: str,
+        item_id: str,
+        text: str | None = None,
+        checked: bool | None = None,  # noqa: FBT001
+        assignee: str | None = None,
+        deadline: datetime | ChecklistDeadline | None = None,
+    ) -> list[ChecklistItem]:
+        """Edit a checklist item, unset fields are kept.
+
+        Use `edit_checklist` to change many items by one request.
+
+        Source:
+        https://cloud.yandex.com/en/docs/tracker/concepts/issues/edit-checklist-item
+
+        :return: All the checklist items.
+        """
+        if deadline is not None and not isinstance(deadline, ChecklistDeadline):
+            deadline = ChecklistDeadline(date=deadline, deadline_type="date")
+
+        payload = self._prepare_payload(locals(), exclude=["issue_id", "item_id"])
+        data = await self._client.request(
+            method="PATCH",
+            uri=f"/issues/{issue_id}/checklistItems/{item_id}",
+            payload=payload,
+        )
+        return self._decode(IssueChecklist, data).checklist_items
+
+    async def edit_checklist(
+        self,
+        issue_id: str,
+        changes: Iterable[ChecklistItemChange],
+    ) -> list[ChecklistItem]:
+        """Edit many checklist items of the issue by one request.
+
+        >>> await tracker.edit_checklist(
+        >>>     "KEY-1",
+        >>>     [ChecklistItemChange(id="1", checked=True), ...],
+        >>> )
+
+        Source:
+        https://cloud.yandex.com/en/docs/tracker/concepts/issues/edit-checklist
+
+        :return: All the checklist items.
+        """
+        data = await self._client.request(
+            method="PATCH",
+            uri=f"/issues/{issue_id}/checklistItems",
+            payload=list(changes),  # type: ignore[arg-type]
+        )
+        return self._decode(IssueChecklist, data).checklist_items
+
+    async def move_checklist_item(
+        self,
+        issue_id: str,
+        item_id: str,
+        before: str | None = None,
+    ) -> list[ChecklistItem]:
+        """Move a checklist item before another one (to the end by default).
+
+        Source:
+        https://cloud.yandex.com/en/docs/tracker/concepts/issues/move-checklist-item
+
+        :return: All the checklist items.
+        """
+        data = await self._client.request(
+            method="POST",
+            uri=f"/issues/{issue_id}/checklistItems/{item_id}/_move",
+            payload={"before": before} if before else {},
+        )
+        return self._decode(IssueChecklist, data).checklist_items
+
+    async def delete_checklist_item(
+        self,
+        issue_id: str,
+        item_id: str,
+    ) -> list[ChecklistItem]:
+        """Delete a checklist item.
+
+        Source:
+        https://cloud.yandex.com/en/docs/tracker/concepts/issues/delete-checklist-item
+
+        :return: The rest checklist items.
+        """
+        data = await self._client.request(
+            method="DELETE",
+            uri=f"/issues/{issue_id}/checklistItems/{item_id}",
+        )
+        return self._decode(IssueChecklist, data).checklist_items
+
+    async def delete_checklist(self, issue_id: str) -> bool:
+        """Delete the whole checklist.
+
+        Source:
+        https://cloud.yandex.com/en/docs/tracker/concepts/issues/delete-checklist
+        """
+        await self._client.request(
+            method="DELETE",
+            uri=f"/issues/{issue_id}/checklistItems",
+        )
+        return True
+
+    async def edit_checklists(
+        self,
+        changes: Mapping[str, Iterable[ChecklistItemChange]],
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> dict[str, list[ChecklistItem] | ChecklistError]:
+        """Edit checklists of many issues concurrently.
+
+        Changes of every issue are sent by one request.
+
+        :return: Checklist items by issue, or an error
+            if the checklist of the issue was not changed.
+        """
+        issue_ids = list(changes)
+        results = await gather_limited(
+            (
+                partial(_catch, self.edit_checklist, issue_id, changes[issue_id])
+                for issue_id in issue_ids
+            ),
+            concurrency,
+        )
+        return dict(zip(issue_ids, results, strict=True))
+
+    async def check_checklist_items(
+        self,
+        issue_ids: Iterable[str],
+        texts: Collection[str],
+        checked: bool = True,  # noqa: FBT001 FBT002
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> dict[str, list[ChecklistItem] | ChecklistError]:
+        """Check (or uncheck) items with the texts in checklists of many issues.
+
+        Every issue costs a request to get its checklist and, if any item
+        should be changed, a request to edit all of them.
+
+        >>> await tracker.check_checklist_items(keys, ["Deployed to production"])
+
+        :return: Checklist items by issue, or an error.
+        """
+        texts = set(texts)
+
+        async def check(issue_id: str) -> list[ChecklistItem]:
+            items = await self.get_checklist(issue_id)
+            changes = [
+                ChecklistItemChange(id=item.id, checked=checked)
+                for item in items
+                if item.text in texts and item.checked != checked
+            ]
+            if not changes:
+                return items
+            return await self.edit_checklist(issue_id, changes)
+
+        issue_ids = list(dict.fromkeys(issue_ids))
+        results = await gather_limited(
+            (partial(_catch, check, issue_id) for issue_id in issue_ids),
+            concurrency,
+        )
+        return dict(zip(issue_ids, results, strict=True))
+
+
+async def _catch(
+    func: Callable[..., Awaitable[list[ChecklistItem]]],
+    *args: Any,  # noqa: ANN401
+) -> list[ChecklistItem] | ChecklistError:
+    """Return API or network error instead of raising it."""
+    try:
+        return await func(*args)
+    except (YaTrackerError, ClientError, asyncio.TimeoutError) as e:
+        return e
@@ -18,7 +18,7 @@ class Comments(BaseTracker):
             method="GET",
             uri=f"/issues/{issue_id}/comments",
         )
-        return self._decode(list[Comment], data)
+        return self._decode_list(Comment, data)
 
     async def post_comment(self, issue_id: str, text: str, **kwargs) -> Comment:
         """Comment the issue."""
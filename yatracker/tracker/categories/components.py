@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from yatracker.tracker.base import BaseTracker
+from yatracker.types import FullComponent
+
+
+class Components(BaseTracker):
+    async def get_components(self) -> list[FullComponent]:
+        """Get all the components of the organization.
+
+        Source:
+        https://cloud.yandex.com/en/docs/tracker/concepts/components/get-components
+        """
+        data = await self._client.request(
+            method="GET",
+            uri="/components",
+        )
+        return self._decode_list(FullComponent, data)
+
+    async def get_queue_components(self, queue_id: str | int) -> list[FullComponent]:
+        """Get components of the queue.
+
+        Use `component_cache` to look them up by name without requests.
+        """
+        data = await self._client.request(
+            method="GET",
+            uri=f"/queues/{queue_id}/components",
+        )
+        return self._decode_list(FullComponent, data)
+
+    async def get_component(self, component_id: int | str) -> FullComponent:
+        """Get component by id."""
+        data = await self._client.request(
+            method="GET",
+            uri=f"/components/{component_id}",
+        )
+        return self._decode(FullComponent, data)
+
+    async def create_component(
+        self,
+        name: str,
+        queue: str,
+        description: str | None = None,
+        lead: str | None = None,
+        assign_auto: bool | None = None,  # noqa: FBT001
+    ) -> FullComponent:
+        """Create a component in the queue.
+
+        Source:
+        https://cloud.yandex.com/en/docs/tracker/concepts/components/create-component
+        """
+        data = await self._client.request(
+            method="POST",
+            uri="/components/",
+            payload=self._prepare_payload(locals()),
+        )
+        component = self._decode(FullComponent, data)
+        self.component_cache.invalidate(queue)
+        return component
+
+    async def edit_component(
+        self,
+        component_id: int | str,
+        version: int | None = None,
+        **kwargs,
+    ) -> FullComponent:
+        """Make changes to a component.
+
+        Source:
+        https://cloud.yandex.com/en/docs/tracker/concepts/components/edit-component
+        """
+        data = await self._client.request(
+            method="PATCH",
+            uri=f"/components/{component_id}",
+            params={"version": str(version)} if version else None,
+            payload=self._prepare_payload(kwargs),
+        )
+        component = self._decode(FullComponent, data)
+        self.component_cache.invalidate(component.queue.key)
+        return component
+
+    async def delete_component(self, component_id: int | str) -> bool:
+        """Delete a component."""
+        await self._client.request(
+            method="DELETE",
+            uri=f"/components/{component_id}",
+        )
+        self.component_cache.invalidate()
+        return True
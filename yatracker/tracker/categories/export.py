@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+import msgspec
+
+from yatracker.tracker.base import BaseTracker
+from yatracker.tracker.export import (
+    DEFAULT_COLUMNS,
+    INCLUDES,
+    ExportCheckpoint,
+    ExportFile,
+    ExportProgress,
+    IssueKey,
+    RowWriter,
+)
+from yatracker.tracker.pagination import DEFAULT_CONCURRENCY, Cursor, parse_links
+from yatracker.utils.concurrency import gather_limited
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from pathlib import Path
+
+    from yatracker.tracker.export import ExportFormat
+
+
+class Export(BaseTracker):
+    # ruff: noqa: PLR0913
+    async def export_issues(
+        self,
+        path: str | Path,
+        format_: ExportFormat = "jsonl",
+        *,
+        filter_: dict[str, str] | None = None,
+        query: str | None = None,
+        queue: str | None = None,
+        order: str | None = None,
+        include: Sequence[str] = (),
+        columns: Sequence[str] = DEFAULT_COLUMNS,
+        per_scroll: int = 1000,
+        scroll_ttl: int | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        checkpoint: str | Path | None = None,
+        resume: bool = True,
+        progress: Callable[[ExportProgress], Any] | None = None,
+    ) -> ExportProgress:
+        """Export issues to JSONL or CSV file with bounded memory.
+
+        Issues are scrolled page by page and written as raw JSON
+        (CSV rows contain `columns` set by dotted paths of API names).
+        `include` adds related objects: `comments`, `worklogs`, `links`,
+        JSONL rows become `{"issue": ..., "comments": [...], ...}` then.
+
+        After every page the scroll position is saved to `checkpoint` file
+        (`<path>.checkpoint` by default). If the export is interrupted,
+        call it again with `resume=True` to continue from the last written
+        page, while the scroll context is alive (see `scroll_ttl`).
+
+        >>> await tracker.export_issues(
+        >>>     "issues.jsonl",
+        >>>     queue="KEY",
+        >>>     include=["comments"],
+        >>>     progress=lambda p: print(p.exported, p.total, p.rate),
+        >>> )
+
+        :return: Final progress.
+        """
+        if unknown := set(include) - INCLUDES.keys():
+            msg = f"Unknown related objects: {', '.join(sorted(unknown))}."
+            raise ValueError(msg)
+
+        writer = RowWriter(format_, columns, include)
+        file = ExportFile(path, checkpoint)
+        state = await asyncio.to_thread(file.load_checkpoint) if resume else None
+        if state is None:
+            payload = self._prepare_payload(
+                {"filter_": filter_, "query": query, "queue": queue},
+            )
+            params: dict[str, Any] = {
+                "scrollType": "sorted" if order else "unsorted",
+                "perScroll": per_scroll,
+            }
+            if scroll_ttl is not None:
+                params["scrollTTLMillis"] = scroll_ttl
+            if order:
+                params["order"] = order
+            cursor = Cursor(uri="/issues/_search", params=params)
+            exported = 0
+        else:
+            payload = state.payload
+            cursor = state.cursor
+            exported = state.exported
+
+        await asyncio.to_thread(file.open, state, writer.encode_header())
+        started = time.monotonic()
+        result = ExportProgress(exported, None, 0.0)
+        completed = False
+        try:
+            pages = self._scroll(
+                msgspec.Raw,
+                method="POST",
+                cursor=cursor,
+                payload=payload,
+                received=exported,
+                prefetch=False,
+            )
+            async for page in pages:
+                related = None
+                if include:
+                    related = await self._get_related(page.items, include, concurrency)
+
+                offset = await asyncio.to_thread(
+                    file.write,
+                    writer.encode(page.items, related),
+                )
+                exported += len(page.items)
+                if page.next_cursor is not None:
+                    await asyncio.to_thread(
+                        file.save_checkpoint,
+                        ExportCheckpoint(
+                            uri=page.next_cursor.uri,
+                            params=page.next_cursor.params,
+                            headers=page.next_cursor.headers,
+                            payload=payload,
+                            exported=exported,
+                            offset=offset,
+                        ),
+                    )
+
+                result = ExportProgress(
+                    exported,
+                    page.total,
+                    time.monotonic() - started,
+                )
+                if progress is not None:
+                    progress(result)
+            completed = True
+        finally:
+            await asyncio.to_thread(file.close, completed=completed)
+
+        return result
+
+    async def _get_related(
+        self,
+        issues: Sequence[msgspec.Raw],
+        include: Sequence[str],
+        concurrency: int,
+    ) -> list[dict[str, msgspec.Raw]]:
+        """Get raw related objects of the issues."""
+        keys = [msgspec.json.decode(issue, type=IssueKey).key for issue in issues]
+        requests = (
+            partial(self._get_related_list, INCLUDES[name].format(key=key))
+            for key in keys
+            for name in include
+        )
+        bodies = iter(await gather_limited(requests, concurrency))
+        return [{name: msgspec.Raw(next(bodies)) for name in include} for _ in keys]
+
+    async def _get_related_list(self, uri: str) -> bytes:
+        """Get raw JSON list of related objects from all the pages.
+
+        Pages are followed via `Link` header, a single page is kept as is.
+        """
+        response = await self._client.fetch(method="GET", uri=uri)
+        bodies = [response.body]
+        while next_url := parse_links(response.headers.get("Link")).get("next"):
+            response = await self._client.fetch(method="GET", uri=next_url)
+            bodies.append(response.body)
+
+        if len(bodies) == 1:
+            return bodies[0]
+        return msgspec.json.encode(
+            [item for body in bodies for item in self._decode_list(msgspec.Raw, body)],
+        )
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from yatracker.tracker.base import BaseTracker
+from yatracker.tracker.importer import DEFAULT_QUEUE_SIZE, Importer
+from yatracker.tracker.pagination import DEFAULT_CONCURRENCY
+from yatracker.types import Attachment, Comment, FullIssue, IssueLink
+from yatracker.utils import files
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, Callable, Iterable
+    from pathlib import Path
+
+    from yatracker.tracker.importer import ImportResult, SourceIssue
+    from yatracker.utils.files import FileSource
+
+
+class Import(BaseTracker):
+    """Import of objects from other systems.
+
+    Unlike regular methods, the original authors and dates are kept:
+    `created_at` / `updated_at` are datetimes or strings in Tracker
+    format (`YYYY-MM-DDThh:mm:ss.sss±hhmm`), users are set by ids or logins.
+    """
+
+    # ruff: noqa: PLR0913 PLR0917
+    async def import_issue(
+        self,
+        queue: str,
+        summary: str,
+        created_at: datetime | str,
+        created_by: str,
+        *,
+        key: str | None = None,
+        updated_at: datetime | str | None = None,
+        updated_by: str | None = None,
+        resolved_at: datetime | str | None = None,
+        resolved_by: str | None = None,
+        status: str | int | None = None,
+        resolution: str | int | None = None,
+        type_: str | int | None = None,
+        priority: str | int | None = None,
+        description: str | None = None,
+        assignee: str | None = None,
+        unique: str | None = None,
+        **kwargs,
+    ) -> FullIssue:
+        """Import an issue.
+
+        `key` keeps the original issue number, when the queue allows it.
+        Other issue fields are passed by `kwargs`.
+
+        Source:
+        https://cloud.yandex.com/en/docs/tracker/concepts/import/import-ticket
+        """
+        payload = self._prepare_payload(_format_times(locals()))
+        data = await self._client.request(
+            method="POST",
+            uri="/issues/_import",
+            payload=payload,
+        )
+        return self._decode(FullIssue, data)
+
+    async def import_comment(
+        self,
+        issue_id: str,
+        text: str,
+        created_at: datetime | str,
+        created_by: str,
+        updated_at: datetime | str | None = None,
+        updated_by: str | None = None,
+    ) -> Comment:
+        """Import a comment of the issue.
+
+        Source:
+        https://cloud.yandex.com/en/docs/tracker/concepts/import/import-comments
+        """
+        payload = self._prepare_payload(_format_times(locals()), exclude=["issue_id"])
+        data = await self._client.request(
+            method="POST",
+            uri=f"/issues/{issue_id}/comments/_import",
+            payload=payload,
+        )
+        return self._decode(Comment, data)
+
+    async def import_link(
+        self,
+        issue_id: str,
+        relationship: str,
+        issue: str,
+        created_at: datetime | str,
+        created_by: str,
+        updated_at: datetime | str | None = None,
+        updated_by: str | None = None,
+    ) -> IssueLink:
+        """Import a link of the issue to another one (`issue`).
+
+        Source:
+        https://cloud.yandex.com/en/docs/tracker/concepts/import/import-links
+        """
+        payload = self._prepare_payload(_format_times(locals()), exclude=["issue_id"])
+        data = await self._client.request(
+            method="POST",
+            uri=f"/issues/{issue_id}/links/_import",
+            payload=payload,
+        )
+        return self._decode(IssueLink, data)
+
+    async def import_attachment(
+        self,
+        issue_id: str,
+        file: FileSource,
+        created_at: datetime | str,
+        created_by: str,
+        *,
+        filename: str | None = None,
+        comment_id: str | int | None = None,
+        progress: Callable[[str, int, int | None], Any] | None = None,
+        chunk_size: int = files.DEFAULT_CHUNK_SIZE,
+    ) -> Attachment:
+        """Import a file attached to the issue (or to its comment).
+
+        The file is streamed by chunks like in `attach_file`.
+
+        Source:
+        https://cloud.yandex.com/en/docs/tracker/concepts/import/import-attachments
+        """
+        form, filename = files.prepare_form(file, filename, progress, chunk_size)
+        uri = f"/issues/{issue_id}/attachments/_import"
+        if comment_id is not None:
+            uri = f"/issues/{issue_id}/comments/{comment_id}/attachments/_import"
+
+        params = {"createdAt": _format_time(created_at), "createdBy": created_by}
+        if filename:
+            params["filename"] = filename
+
+        data = await self._client.request(
+            method="POST",
+            uri=uri,
+            params=params,
+            form=form,
+        )
+        return self._decode(Attachment, data)
+
+    async def import_issues(
+        self,
+        source: Iterable[SourceIssue] | AsyncIterable[SourceIssue],
+        checkpoint: str | Path,
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+    ) -> ImportResult:
+        """Import issues with their comments, attachments and links.
+
+        Issues, comments and attachments are imported concurrently
+        (comments and files of an issue - in order, after the issue),
+        links - after all the issues. Old -> new ids are appended to
+        `checkpoint` file, run it again with the same source and checkpoint
+        to continue interrupted import.
+
+        >>> source = msgspec.json.Decoder(SourceIssue).decode_lines(dump)
+        >>> result = await tracker.import_issues(source, "import.checkpoint")
+        >>> result.issues["OLD-1"]
+        'NEW-1'
+        """
+        importer = Importer(self, checkpoint, concurrency, queue_size)
+        return await importer.run(source)
+
+
+def _format_time(value: datetime | str) -> str:
+    """Format datetime as Tracker expects it on import."""
+    if isinstance(value, str):
+        return value
+    return value.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + value.strftime("%z")
+
+
+def _format_times(values: dict[str, Any]) -> dict[str, Any]:
+    """Format datetime arguments, including extra `kwargs`."""
+    if kwargs := values.get("kwargs"):
+        values = {**values, **kwargs, "kwargs": None}
+    return {
+        k: _format_time(v) if isinstance(v, datetime) else v for k, v in values.items()
+    }
@@ -1,20 +1,40 @@
 from __future__ import annotations
 
-from typing import Any, TypeVar, overload
+from collections import defaultdict
+from functools import cached_property, partial
+from typing import TYPE_CHECKING, Any, TypeVar, overload
 
+from yatracker.exceptions import TransitionPathNotFoundError
 from yatracker.tracker.base import BaseTracker
+from yatracker.tracker.component_cache import (
+    ComponentRef,
+    get_queue_key,
+    has_component_names,
+)
+from yatracker.tracker.pagination import DEFAULT_CONCURRENCY
+from yatracker.tracker.projection import get_fields_param, get_projection
+from yatracker.tracker.workflow_graph import IssueTransitions, WorkflowGraph
 from yatracker.types import (
+    Base,
     FullIssue,
     Issue,
     IssueLink,
     IssueType,
     Priority,
+    Status,
     Transition,
     Transitions,
 )
+from yatracker.utils.concurrency import gather_limited
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Collection, Iterable, Sequence
 
 IssueT_co = TypeVar("IssueT_co", bound=FullIssue, covariant=True)
 
+KEYS_CHUNK_SIZE = 100
+MAX_TRANSITION_HOPS = 10
+
 
 class Issues(BaseTracker):
     @overload
@@ -34,12 +54,25 @@ class Issues(BaseTracker):
     ) -> IssueT_co:
         ...
 
+    @overload
+    async def get_issue(
+        self,
+        issue_id: str,
+        expand: str | None = None,
+        _type: type[FullIssue] = ...,
+        *,
+        fields: Collection[str],
+    ) -> Base:
+        ...
+
     async def get_issue(
         self,
         issue_id: str,
         expand: str | None = None,
         _type: type[IssueT_co | FullIssue] = FullIssue,
-    ) -> IssueT_co | FullIssue:
+        *,
+        fields: Collection[str] | None = None,
+    ) -> IssueT_co | FullIssue | Base:
         """Get issue parameters.
 
         Use this request to get information about an issue.
@@ -49,14 +82,103 @@ class Issues(BaseTracker):
                         transitions — Workflow transitions between statuses.
                         attachments — Attachments
         :param _type: you can use your own extended FullIssue type
+        :param fields: Decode only these fields of `_type`
+                       into a generated struct.
         :return:
         """
+        params = {"expand": expand} if expand else {}
+        type_: type[Base] = _type
+        if fields is not None:
+            type_ = get_projection(_type, fields)
+            params["fields"] = get_fields_param(type_)
+
         data = await self._client.request(
             method="GET",
             uri=f"/issues/{issue_id}",
-            params={"expand": expand} if expand else None,
+            params=params or None,
         )
-        return self._decode(_type, data)
+        return self._decode(type_, data)
+
+    @overload
+    async def get_issues(
+        self,
+        keys: Iterable[str],
+        expand: str | None = None,
+        chunk_size: int = KEYS_CHUNK_SIZE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[FullIssue | None]:
+        ...
+
+    @overload
+    async def get_issues(
+        self,
+        keys: Iterable[str],
+        expand: str | None = None,
+        chunk_size: int = KEYS_CHUNK_SIZE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        _type: type[IssueT_co] = ...,
+    ) -> list[IssueT_co | None]:
+        ...
+
+    async def get_issues(
+        self,
+        keys: Iterable[str],
+        expand: str | None = None,
+        chunk_size: int = KEYS_CHUNK_SIZE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        _type: type[IssueT_co | FullIssue] = FullIssue,
+    ) -> list[IssueT_co | None] | list[FullIssue | None]:
+        """Get many issues by keys.
+
+        Keys are split into chunks of `chunk_size`, each chunk is one
+        search request, no more than `concurrency` requests at once.
+
+        Result has the same order as `keys`.
+        Missing keys (not found or not permitted) are returned as None.
+
+        :param keys: Keys of the issues (old keys of moved issues are ok).
+        :param expand: Additional fields to include in the response.
+        :param _type: you can use your own extended FullIssue type
+        """
+        keys = list(keys)
+        unique_keys = list(dict.fromkeys(keys))
+        requests = (
+            partial(
+                self._get_issues_chunk,
+                unique_keys[i : i + chunk_size],
+                expand,
+                _type,
+            )
+            for i in range(0, len(unique_keys), chunk_size)
+        )
+
+        found: dict[str, IssueT_co | FullIssue] = {}
+        for chunk in await gather_limited(requests, concurrency):
+            for issue in chunk:
+                found[issue.key] = issue
+                for alias in issue.aliases or ():
+                    found.setdefault(alias, issue)
+
+        return [found.get(key) for key in keys]
+
+    async def _get_issues_chunk(
+        self,
+        keys: list[str],
+        expand: str | None,
+        _type: type[IssueT_co | FullIssue],
+    ) -> list[IssueT_co | FullIssue]:
+        """Get a chunk of issues by keys in one request."""
+        params = {"perPage": str(len(keys))}
+        if expand:
+            params["expand"] = expand
+
+        data = await self._client.request(
+            method="POST",
+            uri="/issues/_search",
+            params=params,
+            payload={"keys": keys},
+        )
+        return self._decode_list(_type, data)
 
     @overload
     async def edit_issue(
@@ -89,9 +211,23 @@ class Issues(BaseTracker):
         Use this request to make changes to an issue.
         The issue is selected by its ID or key.
 
+        `components` may be set by names and int ids (a list, or a dict
+        of `set`, `add` and `remove` lists). The queue is taken from the issue key,
+        issues set by ID cost an extra request then.
+
         Source:
         https://cloud.yandex.com/en/docs/tracker/concepts/issues/patch-issue
         """
+        if has_component_names(kwargs.get("components")):
+            queue = get_queue_key(issue_id)
+            if queue is None:
+                issue = await self.get_issue(issue_id, fields=["queue"])
+                queue = issue.queue.key  # type: ignore[attr-defined]
+            kwargs["components"] = await self.component_cache.resolve_value(
+                queue,
+                kwargs["components"],
+            )
+
         data = await self._client.request(
             method="PATCH",
             uri=f"/issues/{issue_id}",
@@ -115,6 +251,7 @@ class Issues(BaseTracker):
         assignee: list[str] | None = None,
         unique: str | None = None,
         attachment_ids: list[str] | None = None,
+        components: Sequence[ComponentRef] | None = None,
         _type: type[IssueT_co] = ...,
         **kwargs,
     ) -> IssueT_co:
@@ -135,11 +272,12 @@ class Issues(BaseTracker):
         assignee: list[str] | None = None,
         unique: str | None = None,
         attachment_ids: list[str] | None = None,
+        components: Sequence[ComponentRef] | None = None,
         **kwargs,
     ) -> FullIssue:
         ...
 
-    # ruff: noqa: ARG002 PLR0913
+    # ruff: noqa: PLR0913 PLR0917
     async def create_issue(
         self,
         summary: str,
@@ -154,15 +292,30 @@ class Issues(BaseTracker):
         assignee: list[str] | None = None,
         unique: str | None = None,
         attachment_ids: list[str] | None = None,
+        components: Sequence[ComponentRef] | None = None,
         _type: type[IssueT_co | FullIssue] = FullIssue,
         **kwargs,
     ) -> IssueT_co | FullIssue:
         """Create an issue.
 
+        Set `unique` to make the request safe to retry.
+        `components` may be set by names and int ids, names are resolved
+        by `component_cache` without extra requests.
+
         Source:
         https://cloud.yandex.ru/docs/tracker/concepts/issues/create-issue
         """
-        payload = self._prepare_payload(locals(), type_=_type)
+        if components:
+            queue_id: Any = queue
+            if isinstance(queue, dict):
+                queue_id = queue.get("key", queue.get("id"))
+            components = await self.component_cache.resolve(str(queue_id), components)
+
+        payload = self._prepare_payload(
+            locals(),
+            type_=_type,
+            extra=["type_", "unique", "attachment_ids"],
+        )
         data = await self._client.request(
             method="POST",
             uri="/issues/",
@@ -297,8 +450,10 @@ class Issues(BaseTracker):
         query: str | None = None,
         order: str | None = None,
         expand: str | None = None,
-        keys: str | None = None,
+        keys: str | list[str] | None = None,
         queue: str | None = None,
+        page: int | None = None,
+        per_page: int | None = None,
     ) -> list[FullIssue]:
         ...
 
@@ -309,32 +464,62 @@ class Issues(BaseTracker):
         query: str | None = None,
         order: str | None = None,
         expand: str | None = None,
-        keys: str | None = None,
+        keys: str | list[str] | None = None,
         queue: str | None = None,
+        page: int | None = None,
+        per_page: int | None = None,
         _type: type[IssueT_co] = ...,
     ) -> list[IssueT_co]:
         ...
 
+    @overload
     async def find_issues(
         self,
         filter_: dict[str, str] | None = None,
         query: str | None = None,
         order: str | None = None,
         expand: str | None = None,
-        keys: str | None = None,
+        keys: str | list[str] | None = None,
         queue: str | None = None,
+        page: int | None = None,
+        per_page: int | None = None,
+        _type: type[FullIssue] = ...,
+        *,
+        fields: Collection[str],
+    ) -> list[Base]:
+        ...
+
+    async def find_issues(
+        self,
+        filter_: dict[str, str] | None = None,
+        query: str | None = None,
+        order: str | None = None,
+        expand: str | None = None,
+        keys: str | list[str] | None = None,
+        queue: str | None = None,
+        page: int | None = None,
+        per_page: int | None = None,
         _type: type[IssueT_co | FullIssue] = FullIssue,
-    ) -> list[IssueT_co] | list[FullIssue]:
+        *,
+        fields: Collection[str] | None = None,
+    ) -> list[IssueT_co] | list[FullIssue] | list[Base]:
         """Find issues.
 
         Use this request to get a list of issues that meet specific criteria.
-        If there are more than 10,000 issues in the response, use paging.
+        Only one page of results is returned (use `page` and `per_page`),
+        use `iter_issues` to walk through all of them.
+
+        With `fields` only these fields of `_type` are requested
+        and decoded into a generated struct:
+        >>> issues = await tracker.find_issues(
+        >>>     queue="KEY",
+        >>>     fields=["key", "status", "updatedAt"],
+        >>> )
         :return:
         """
         payload = self._prepare_payload(
             locals(),
-            exclude=["expand", "order"],
-            type_=_type,
+            exclude=["expand", "order", "page", "per_page", "fields"],
         )
 
         params = {}
@@ -342,6 +527,15 @@ class Issues(BaseTracker):
             params["order"] = order
         if expand:
             params["expand"] = expand
+        if page is not None:
+            params["page"] = str(page)
+        if per_page is not None:
+            params["perPage"] = str(per_page)
+
+        type_: type[Base] = _type
+        if fields is not None:
+            type_ = get_projection(_type, fields)
+            params["fields"] = get_fields_param(type_)
 
         data = await self._client.request(
             method="POST",
@@ -349,7 +543,117 @@ class Issues(BaseTracker):
             params=params,
             payload=payload,
         )
-        return self._decode(list[_type], data)  # type: ignore[valid-type]
+        return self._decode_list(type_, data)
+
+    @overload
+    def iter_issues(
+        self,
+        filter_: dict[str, str] | None = None,
+        query: str | None = None,
+        order: str | None = None,
+        expand: str | None = None,
+        keys: str | list[str] | None = None,
+        queue: str | None = None,
+        per_scroll: int = 100,
+        scroll_ttl: int | None = None,
+    ) -> AsyncIterator[FullIssue]:
+        ...
+
+    @overload
+    def iter_issues(
+        self,
+        filter_: dict[str, str] | None = None,
+        query: str | None = None,
+        order: str | None = None,
+        expand: str | None = None,
+        keys: str | list[str] | None = None,
+        queue: str | None = None,
+        per_scroll: int = 100,
+        scroll_ttl: int | None = None,
+        _type: type[IssueT_co] = ...,
+    ) -> AsyncIterator[IssueT_co]:
+        ...
+
+    @overload
+    def iter_issues(
+        self,
+        filter_: dict[str, str] | None = None,
+        query: str | None = None,
+        order: str | None = None,
+        expand: str | None = None,
+        keys: str | list[str] | None = None,
+        queue: str | None = None,
+        per_scroll: int = 100,
+        scroll_ttl: int | None = None,
+        _type: type[FullIssue] = ...,
+        *,
+        fields: Collection[str],
+    ) -> AsyncIterator[Base]:
+        ...
+
+    async def iter_issues(
+        self,
+        filter_: dict[str, str] | None = None,
+        query: str | None = None,
+        order: str | None = None,
+        expand: str | None = None,
+        keys: str | list[str] | None = None,
+        queue: str | None = None,
+        per_scroll: int = 100,
+        scroll_ttl: int | None = None,
+        _type: type[IssueT_co | FullIssue] = FullIssue,
+        *,
+        fields: Collection[str] | None = None,
+    ) -> AsyncIterator[IssueT_co | FullIssue | Base]:
+        """Iterate via all issues that meet specific criteria.
+
+        Uses scrolling, so there is no 10,000 issues limit.
+        Pages are decoded one by one, the next page is prefetched
+        while the current one is being processed.
+
+        >>> async for issue in tracker.iter_issues(queue="KEY"):
+        >>>     print(issue.key)
+
+        Source:
+        https://cloud.yandex.com/en/docs/tracker/concepts/issues/search-issues
+
+        :param per_scroll: Number of issues per page (max 1000).
+        :param scroll_ttl: Scroll context lifetime in milliseconds.
+        :param _type: you can use your own extended FullIssue type
+        :param fields: Decode only these fields of `_type`
+                       into a generated struct.
+        """
+        payload = self._prepare_payload(
+            locals(),
+            exclude=["expand", "order", "per_scroll", "scroll_ttl", "fields"],
+        )
+
+        params: dict[str, Any] = {
+            "scrollType": "sorted" if order else "unsorted",
+            "perScroll": per_scroll,
+        }
+        if scroll_ttl is not None:
+            params["scrollTTLMillis"] = scroll_ttl
+        if order:
+            params["order"] = order
+        if expand:
+            params["expand"] = expand
+
+        type_: type[Base] = _type
+        if fields is not None:
+            type_ = get_projection(_type, fields)
+            params["fields"] = get_fields_param(type_)
+
+        pages = self._iter_scroll(
+            type_,
+            method="POST",
+            uri="/issues/_search",
+            params=params,
+            payload=payload,
+        )
+        async for page in pages:
+            for issue in page:
+                yield issue
 
     async def get_issue_links(
         self,
@@ -364,7 +668,7 @@ class Issues(BaseTracker):
             method="GET",
             uri=f"/issues/{issue_id}/links",
         )
-        return self._decode(list[IssueLink], data)
+        return self._decode_list(IssueLink, data)
 
     async def get_transitions(self, issue_id: str) -> Transitions:
         """Get transitions.
@@ -376,7 +680,7 @@ class Issues(BaseTracker):
             method="GET",
             uri=f"/issues/{issue_id}/transitions",
         )
-        transitions = self._decode(list[Transition], data)
+        transitions = self._decode_list(Transition, data)
         return Transitions(**{t.id: t for t in transitions})
 
     async def execute_transition(
@@ -391,4 +695,117 @@ class Issues(BaseTracker):
             uri=f"{transition.url}/_execute",
             payload=payload,
         )
-        return self._decode(list[Transition], data)
+        return self._decode_list(Transition, data)
+
+    @cached_property
+    def workflows(self) -> defaultdict[tuple[str, str], WorkflowGraph]:
+        """Get workflow graphs by (queue key, issue type key).
+
+        Graphs are built from transitions observed by `transition_to`
+        and `learn_workflow`, they live as long as the tracker.
+        """
+        return defaultdict(WorkflowGraph)
+
+    async def learn_workflow(
+        self,
+        queue: str,
+        issue_type: str,
+        per_page: int = 100,
+    ) -> WorkflowGraph:
+        """Observe workflow transitions of issues in the queue by one request.
+
+        Issues of the type are requested with their transitions,
+        so every status they are in is added to the graph.
+        """
+        data = await self._client.request(
+            method="POST",
+            uri="/issues/_search",
+            params={"expand": "transitions", "perPage": str(per_page)},
+            payload={"filter": {"queue": queue, "type": issue_type}},
+        )
+        graph = self.workflows[(queue, issue_type)]
+        for issue in self._decode_list(IssueTransitions, data):
+            graph.add(issue.status, issue.transitions)
+        return graph
+
+    async def transition_to(
+        self,
+        issue: FullIssue | str,
+        status: str,
+        max_hops: int = MAX_TRANSITION_HOPS,
+        **kwargs,
+    ) -> list[Transition]:
+        """Move issue to the status by the shortest chain of transitions.
+
+        Status may be set by id, key or display name.
+        The chain is found in the cached workflow graph, transitions
+        returned by every executed hop are saved to the graph,
+        so already known workflows cost a request per hop only.
+        `kwargs` (e.g. `resolution`, `comment`) are sent with the last hop.
+
+        >>> await tracker.transition_to("KEY-1", "closed", resolution="fixed")
+
+        :return: Transitions available in the new status.
+        """
+        if isinstance(issue, str):
+            issue = await self.get_issue(issue)
+
+        graph = self.workflows[(issue.queue.key, issue.type.key)]
+        current = issue.status
+        available: list[Transition] = []
+        learned = False
+        hops = 0
+        while not _is_status(current, status):
+            target = graph.get_status(status)
+            path = graph.find_path(current.key, target.key) if target else None
+            if path is None:
+                if not learned:
+                    await self.learn_workflow(issue.queue.key, issue.type.key)
+                    learned = True
+                elif not graph.is_known(current.key):
+                    transitions = await self.get_transitions(issue.key)
+                    graph.add(current, transitions.values())
+                else:
+                    raise TransitionPathNotFoundError(current.key, status)
+                continue
+
+            # the target is the current status
+            if not path:
+                break
+
+            hops += 1
+            if hops > max_hops:
+                raise TransitionPathNotFoundError(current.key, status)
+
+            hop = path[0]
+            available = await self._execute_transition_by_id(
+                issue.key,
+                hop.id,
+                **(kwargs if len(path) == 1 else {}),
+            )
+            current = hop.to
+            graph.add(current, available)
+
+        return available
+
+    async def _execute_transition_by_id(
+        self,
+        issue_id: str,
+        transition_id: str,
+        **kwargs,
+    ) -> list[Transition]:
+        """Execute transition of the issue by transition id."""
+        data = await self._client.request(
+            method="POST",
+            uri=f"/issues/{issue_id}/transitions/{transition_id}/_execute",
+            payload=self._prepare_payload(kwargs),
+        )
+        return self._decode_list(Transition, data)
+
+
+def _is_status(status: Status, name: str) -> bool:
+    """Check the status has the id, key or display name (case-insensitive)."""
+    name = name.casefold()
+    return name in {status.id.casefold(), status.key.casefold()} or (
+        name == status.display.casefold()
+    )
@@ -17,4 +17,4 @@ class Priorities(BaseTracker):
             uri="/priorities",
             params=params,
         )
-        return self._decode(list[Priority], data)
+        return self._decode_list(Priority, data)
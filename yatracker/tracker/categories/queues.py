@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from typing import TypeVar, overload
+from typing import TYPE_CHECKING, TypeVar, overload
 
 from yatracker.tracker.base import BaseTracker
+from yatracker.tracker.pagination import DEFAULT_CONCURRENCY, DEFAULT_PER_PAGE
 from yatracker.types import (
     FullQueue,
     IssueTypeConfig,
@@ -10,6 +11,9 @@ from yatracker.types import (
     QueueVersion,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
 QueueT_co = TypeVar("QueueT_co", bound=FullQueue, covariant=True)
 QueueFieldT_co = TypeVar("QueueFieldT_co", bound=QueueField, covariant=True)
 QueueVersionT_co = TypeVar("QueueVersionT_co", bound=QueueVersion, covariant=True)
@@ -109,6 +113,7 @@ class Queues(BaseTracker):
         self,
         expand: str | None = None,
         per_page: int | None = None,
+        page: int | None = None,
     ) -> list[FullQueue]:
         ...
 
@@ -117,6 +122,7 @@ class Queues(BaseTracker):
         self,
         expand: str | None = None,
         per_page: int | None = None,
+        page: int | None = None,
         _type: type[QueueT_co] = ...,
     ) -> list[QueueT_co]:
         ...
@@ -125,12 +131,14 @@ class Queues(BaseTracker):
         self,
         expand: str | None = None,
         per_page: int | None = None,
+        page: int | None = None,
         _type: type[FullQueue | QueueT_co] = FullQueue,
     ) -> list[FullQueue] | list[QueueT_co]:
         """Get queues.
 
         Use this request to get a list of available queues.
-        If there are more than 50 queues in the response, use pagination.
+        If there are more than 50 queues in the response, use pagination
+        or `get_all_queues` / `iter_queues` methods.
 
         Source:
         https://cloud.yandex.com/en/docs/tracker/concepts/queues/get-queues
@@ -140,10 +148,12 @@ class Queues(BaseTracker):
             params["expand"] = expand
         if per_page is not None:
             params["perPage"] = str(per_page)
+        if page is not None:
+            params["page"] = str(page)
 
         payload = self._prepare_payload(
             locals(),
-            exclude=["expand", "perPage"],
+            exclude=["expand", "perPage", "page"],
             type_=_type,
         )
         data = await self._client.request(
@@ -152,7 +162,90 @@ class Queues(BaseTracker):
             params=params,
             payload=payload,
         )
-        return self._decode(list[_type], data)  # type: ignore[valid-type]
+        return self._decode_list(_type, data)
+
+    @overload
+    def iter_queues(
+        self,
+        expand: str | None = None,
+        per_page: int = DEFAULT_PER_PAGE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> AsyncIterator[FullQueue]:
+        ...
+
+    @overload
+    def iter_queues(
+        self,
+        expand: str | None = None,
+        per_page: int = DEFAULT_PER_PAGE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        _type: type[QueueT_co] = ...,
+    ) -> AsyncIterator[QueueT_co]:
+        ...
+
+    async def iter_queues(
+        self,
+        expand: str | None = None,
+        per_page: int = DEFAULT_PER_PAGE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        _type: type[FullQueue | QueueT_co] = FullQueue,
+    ) -> AsyncIterator[FullQueue | QueueT_co]:
+        """Iterate via queues from all the pages in order.
+
+        Pages after the first one are fetched concurrently,
+        no more than `concurrency` requests at once.
+        """
+        pages = self._iter_pages(
+            _type,
+            method="GET",
+            uri="/queues",
+            params={"expand": expand} if expand else None,
+            per_page=per_page,
+            concurrency=concurrency,
+        )
+        async for page in pages:
+            for queue in page:
+                yield queue
+
+    @overload
+    async def get_all_queues(
+        self,
+        expand: str | None = None,
+        per_page: int = DEFAULT_PER_PAGE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[FullQueue]:
+        ...
+
+    @overload
+    async def get_all_queues(
+        self,
+        expand: str | None = None,
+        per_page: int = DEFAULT_PER_PAGE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        _type: type[QueueT_co] = ...,
+    ) -> list[QueueT_co]:
+        ...
+
+    async def get_all_queues(
+        self,
+        expand: str | None = None,
+        per_page: int = DEFAULT_PER_PAGE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        _type: type[FullQueue | QueueT_co] = FullQueue,
+    ) -> list[FullQueue] | list[QueueT_co]:
+        """Get queues from all the pages.
+
+        Pages after the first one are fetched concurrently,
+        no more than `concurrency` requests at once.
+        """
+        return await self._paginate(
+            _type,
+            method="GET",
+            uri="/queues",
+            params={"expand": expand} if expand else None,
+            per_page=per_page,
+            concurrency=concurrency,
+        )
 
     async def delete_queue(
         self,
@@ -246,7 +339,7 @@ class Queues(BaseTracker):
             method="GET",
             uri=f"/queues/{queue_id}/fields",
         )
-        return self._decode(list[_type], data)  # type: ignore[valid-type]
+        return self._decode_list(_type, data)
 
     @overload
     async def get_queue_versions(
@@ -277,4 +370,4 @@ class Queues(BaseTracker):
             method="GET",
             uri=f"/queues/{queue_id}/versions",
         )
-        return self._decode(list[_type], data)  # type: ignore[valid-type]
+        return self._decode_list(_type, data)
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from yatracker.tracker.base import BaseTracker
+from yatracker.tracker.pagination import DEFAULT_CONCURRENCY, DEFAULT_PER_PAGE
+from yatracker.tracker.user_directory import UserDirectory
+from yatracker.types import FullUser
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+
+class Users(BaseTracker):
+    async def get_myself(self) -> FullUser:
+        """Get information about the current user.
+
+        Source:
+        https://cloud.yandex.com/en/docs/tracker/get-user-info
+        """
+        data = await self._client.request(
+            method="GET",
+            uri="/myself",
+        )
+        return self._decode(FullUser, data)
+
+    async def get_user(self, user_id: str | int) -> FullUser:
+        """Get information about the user by uid or login.
+
+        Source:
+        https://cloud.yandex.com/en/docs/tracker/get-user
+        """
+        data = await self._client.request(
+            method="GET",
+            uri=f"/users/{user_id}",
+        )
+        return self._decode(FullUser, data)
+
+    async def get_users(
+        self,
+        per_page: int | None = None,
+        page: int | None = None,
+    ) -> list[FullUser]:
+        """Get one page of organization users.
+
+        Use `iter_users` to walk through all of them.
+
+        Source:
+        https://cloud.yandex.com/en/docs/tracker/get-users
+        """
+        params = {}
+        if per_page is not None:
+            params["perPage"] = str(per_page)
+        if page is not None:
+            params["page"] = str(page)
+
+        data = await self._client.request(
+            method="GET",
+            uri="/users",
+            params=params,
+        )
+        return self._decode_list(FullUser, data)
+
+    async def iter_users(
+        self,
+        per_page: int = DEFAULT_PER_PAGE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> AsyncIterator[FullUser]:
+        """Iterate via users from all the pages in order.
+
+        Pages after the first one are fetched concurrently,
+        no more than `concurrency` requests at once.
+        """
+        pages = self._iter_pages(
+            FullUser,
+            method="GET",
+            uri="/users",
+            per_page=per_page,
+            concurrency=concurrency,
+        )
+        async for page in pages:
+            for user in page:
+                yield user
+
+    async def get_all_users(
+        self,
+        per_page: int = DEFAULT_PER_PAGE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[FullUser]:
+        """Get users from all the pages."""
+        return await self._paginate(
+            FullUser,
+            method="GET",
+            uri="/users",
+            per_page=per_page,
+            concurrency=concurrency,
+        )
+
+    @cached_property
+    def user_directory(self) -> UserDirectory:
+        """Get in-memory directory of organization users.
+
+        It's loaded on the first lookup and lives as long as the tracker:
+        >>> user = await tracker.user_directory.resolve("login")
+        >>> user = tracker.user_directory.get("user@example.com")  # no requests
+        """
+        return UserDirectory(self)
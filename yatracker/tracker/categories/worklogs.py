@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone, tzinfo
 from warnings import warn
 
 from yatracker.tracker.base import BaseTracker
+from yatracker.tracker.pagination import DEFAULT_CONCURRENCY
+from yatracker.tracker.worklog_table import WorklogRow, WorklogTable
 from yatracker.types import Worklog
 from yatracker.types.duration import Duration
 
@@ -85,7 +87,7 @@ class Worklogs(BaseTracker):
             method="GET",
             uri=f"/issues/{issue_id}/worklog",
         )
-        return self._decode(list[Worklog], data)
+        return self._decode_list(Worklog, data)
 
     async def get_worklog(
         self,
@@ -108,7 +110,48 @@ class Worklogs(BaseTracker):
             uri="/worklog/_search",
             payload=payload,
         )
-        return self._decode(list[Worklog], data)
+        return self._decode_list(Worklog, data)
+
+    async def get_worklog_table(  # noqa: PLR0913, PLR0917
+        self,
+        created_by: str | None = None,
+        created_at_from: datetime | str | None = None,
+        created_at_to: datetime | str | None = None,
+        per_page: int = 500,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        tz: tzinfo = timezone.utc,
+    ) -> WorklogTable:
+        """Load worklog records into columnar table for aggregation.
+
+        Only user id, issue key, start and duration of records are decoded,
+        pages are added to the table one by one.
+
+        >>> table = await tracker.get_worklog_table(created_at_from=...)
+        >>> table.sum_by("issue")
+        """
+        created_at = _process_created_at(created_at_from, created_at_to)
+        payload = self._prepare_payload(
+            locals(),
+            exclude=[
+                "created_at_from",
+                "created_at_to",
+                "per_page",
+                "concurrency",
+                "tz",
+            ],
+        )
+        pages = self._iter_pages(
+            WorklogRow,
+            method="POST",
+            uri="/worklog/_search",
+            payload=payload,
+            per_page=per_page,
+            concurrency=concurrency,
+        )
+        table = WorklogTable(tz)
+        async for page in pages:
+            table.extend(page)
+        return table
 
 
 def _process_created_at(
@@ -3,39 +3,132 @@
 from __future__ import annotations
 
 import asyncio
-import io
 import logging
 import ssl
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from functools import lru_cache, partial
 from http import HTTPStatus
-from pathlib import Path
-from typing import TYPE_CHECKING, Any, BinaryIO
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar
 
 import certifi
 import msgspec
-from aiohttp import BytesPayload, ClientSession, ClientTimeout, FormData, TCPConnector
+from aiohttp import (
+    BytesPayload,
+    ClientSession,
+    ClientTimeout,
+    FormData,
+    TCPConnector,
+)
+from multidict import CIMultiDict
 
 from yatracker.exceptions import (
     AlreadyExistsError,
     NotAuthorizedError,
     ObjectNotFoundError,
+    ServerError,
     SufficientRightsError,
+    TooManyRequestsError,
     YaTrackerError,
 )
+from yatracker.utils.files import DEFAULT_CHUNK_SIZE
+
+from .cache import ResponseCache
+from .rate_limit import SAFE_METHODS, parse_retry_after
+from .retry import RetryEvent, RetryPolicy
+from .single_flight import SingleFlight
 
 if TYPE_CHECKING:
+    from collections.abc import (
+        AsyncIterator,
+        Awaitable,
+        Callable,
+        Hashable,
+        Mapping,
+    )
+
+    from aiohttp import ClientResponse
     from aiohttp.typedefs import StrOrURL
 
+    from .rate_limit import RateLimiter
+
+    Payload = Mapping[str, Any] | msgspec.Struct
+
+T = TypeVar("T")
+
 DEFAULT_API_HOST = "https://api.tracker.yandex.net"
 DEFAULT_API_VERSION = "v2"
 
+# error statuses returned to callers instead of raising
+PASSED_STATUSES = frozenset(
+    {HTTPStatus.NOT_MODIFIED, HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE},
+)
+
+# methods which requests are sent without body if there is no payload
+BODYLESS_METHODS = SAFE_METHODS | {"DELETE"}
+
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def get_ssl_context() -> ssl.SSLContext:
+    """Get TLS context shared by the whole process."""
+    return ssl.create_default_context(cafile=certifi.where())
+
+
+def create_connector(
+    limit: int = 100,
+    limit_per_host: int = 0,
+    keepalive_timeout: float | None = 15.0,
+    ttl_dns_cache: int | None = 10,
+    *,
+    force_close: bool = False,
+) -> TCPConnector:
+    """Create connection pool with shared TLS context.
+
+    Pass it as `connector` to share one pool by several `YaTracker` instances,
+    in this case you should close the connector by yourself.
+    Must be called inside a running event loop.
+
+    :param limit: total number of simultaneous connections, 0 - no limit.
+    :param limit_per_host: number of simultaneous connections to one host.
+    :param keepalive_timeout: timeout for connection reusing after releasing.
+    :param ttl_dns_cache: DNS cache entries lifetime in seconds, None - forever.
+    :param force_close: close connection after each request (no keep-alive).
+    """
+    options: dict[str, Any] = {
+        "limit": limit,
+        "limit_per_host": limit_per_host,
+        "ttl_dns_cache": ttl_dns_cache,
+        "force_close": force_close,
+    }
+    # aiohttp forbids keepalive_timeout together with force_close
+    if not force_close:
+        options["keepalive_timeout"] = keepalive_timeout
+
+    return TCPConnector(ssl=get_ssl_context(), **options)
+
+
+class Response(NamedTuple):
+    """Represents raw API response."""
+
+    status: int
+    body: bytes
+    headers: Mapping[str, str]
+
+
+class StreamResponse(NamedTuple):
+    """Represents streamed API response."""
+
+    status: int
+    headers: Mapping[str, str]
+    chunks: AsyncIterator[bytes]
+
+
 class BaseClient(ABC):
     """Represents abstract base class for tracker client."""
 
-    # ruff: noqa: PLR0913
+    # ruff: noqa: PLR0913 PLR0917
     def __init__(
         self,
         org_id: str | int,
@@ -43,6 +136,12 @@ class BaseClient(ABC):
         headers: dict[str, str] | None = None,
         api_host: str | None = None,
         api_version: str | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        cache: ResponseCache | None = None,
+        *,
+        coalesce: bool = True,
+        encoder: msgspec.json.Encoder | None = None,
         # ruff: noqa: ARG002
         **kwargs,
     ) -> None:
@@ -51,48 +150,322 @@ class BaseClient(ABC):
         By default, `self._session` is None.
         It will be created on a first API request.
         The second request will use the same `self._session`.
+
+        Pass `rate_limiter` to limit requests rate and concurrency.
+        Pass `retry_policy` to change the default `RetryPolicy()`.
+        Pass `cache` to cache responses of reference endpoints.
+        Identical concurrent GET requests share one in-flight request,
+        pass `coalesce=False` to disable it.
+        Pass `encoder` to serialize payloads with your own JSON encoder.
         """
+        self._org_id = str(org_id)
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._cache = cache
+        self._single_flight: SingleFlight[Response] | None = (
+            SingleFlight() if coalesce else None
+        )
         self._api_version = api_version or DEFAULT_API_VERSION
         self._base_url = api_host or DEFAULT_API_HOST
         _headers = headers.copy() if headers else {}
         _headers.setdefault("X-Org-Id", str(org_id))
         _headers.setdefault("Authorization", f"OAuth {token}")
         self._headers: dict[str, str] = _headers
+        self._cache_scope = ResponseCache.make_scope(
+            self._org_id,
+            _headers["Authorization"],
+        )
         self._session: ClientSession | None = None
-        self._encoder = msgspec.json.Encoder()
+        self._encoder = encoder or msgspec.json.Encoder()
 
     async def request(
         self,
         method: str,
         uri: str,
         params: dict[str, Any] | None = None,
-        payload: dict[str, Any] | None = None,
+        payload: Payload | None = None,
         form: FormData | None = None,
         **kwargs,
     ) -> bytes:
         """Make request."""
-        bytes_payload: FormData | BytesPayload
+        response = await self.fetch(
+            method=method,
+            uri=uri,
+            params=params,
+            payload=payload,
+            form=form,
+            **kwargs,
+        )
+        return response.body
+
+    async def fetch(
+        self,
+        method: str,
+        uri: str,
+        params: dict[str, Any] | None = None,
+        payload: Payload | None = None,
+        form: FormData | None = None,
+        **kwargs,
+    ) -> Response:
+        """Make request and return the whole response.
+
+        Use it when response headers are needed (e.g. pagination).
+        Payload (a dict or a struct) is encoded in a single pass,
+        no body is sent for GET/HEAD/OPTIONS/DELETE without payload.
+        """
+        body: bytes | None = None
+        bytes_payload: FormData | BytesPayload | None = None
         if form:
             bytes_payload = form
-        else:
-            bytes_payload = BytesPayload(
-                value=self._encoder.encode(payload),
-                content_type="application/json",
-            )
+        elif payload is not None or method.upper() not in BODYLESS_METHODS:
+            body = self._encoder.encode(payload)
+            bytes_payload = BytesPayload(value=body, content_type="application/json")
+
+        uri = self._build_url(uri)
+
+        if (
+            self._single_flight is not None
+            and method.upper() in SAFE_METHODS
+            and not form
+        ):
+            key = _make_flight_key(method, uri, params, kwargs, body)
+            if key is not None:
+                return await self._single_flight.do(
+                    key,
+                    partial(
+                        self._fetch,
+                        method=method,
+                        uri=uri,
+                        params=params,
+                        payload=payload,
+                        form=form,
+                        data=bytes_payload,
+                        **kwargs,
+                    ),
+                )
+
+        return await self._fetch(
+            method=method,
+            uri=uri,
+            params=params,
+            payload=payload,
+            form=form,
+            data=bytes_payload,
+            **kwargs,
+        )
 
+    def _build_url(self, uri: str) -> str:
+        """Get full URL of API endpoint."""
         # to support full links (e.g. Transition)
-        if not uri.startswith("http"):
-            uri = f"{self._base_url}/{self._api_version}{uri}"
+        if uri.startswith("http"):
+            return uri
+        return f"{self._base_url}/{self._api_version}{uri}"
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        method: str,
+        uri: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[StreamResponse]:
+        """Make request and stream response body by chunks.
+
+        Use it as async context manager.
+        Status 416 (Range Not Satisfiable) is not raised to support resuming.
+
+        By default, the body is fully read by `_make_request` and split,
+        override it to stream the body without buffering.
+        """
+        response = await self._send(
+            method=method,
+            url=self._build_url(uri),
+            idempotent=self._retry_policy.is_idempotent(method),
+            params=params,
+            headers=headers,
+        )
+        if response.status != HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE:
+            self._check_status(response.status, response.body)
+
+        yield StreamResponse(
+            response.status,
+            response.headers,
+            _iter_chunks(response.body, chunk_size),
+        )
+
+    async def _fetch(
+        self,
+        *,
+        method: str,
+        uri: str,
+        params: dict[str, Any] | None,
+        payload: Payload | None,
+        form: FormData | None,
+        data: FormData | BytesPayload | None,
+        **kwargs,
+    ) -> Response:
+        """Get response from cache or API."""
+        if self._cache is not None and self._cache.is_cacheable(method, uri):
+            return await self._fetch_cached(
+                self._cache,
+                method=method,
+                url=uri,
+                params=params,
+                data=data,
+                **kwargs,
+            )
 
-        status, body = await self._make_request(
+        idempotent = form is None and self._retry_policy.is_idempotent(method, payload)
+        response = await self._send(
             method=method,
             url=uri,
+            idempotent=idempotent,
             params=params,
-            data=bytes_payload,
+            data=data,
             **kwargs,
         )
-        self._check_status(status, body)
-        return body
+        self._check_status(response.status, response.body)
+        return response
+
+    async def _fetch_cached(
+        self,
+        cache: ResponseCache,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None = None,
+        **kwargs,
+    ) -> Response:
+        """Get response from cache, revalidate expired one."""
+        key = cache.make_key(url, params, self._cache_scope)
+        entry = await cache.backend.get(key)
+        if entry is not None and entry.is_fresh():
+            return Response(HTTPStatus.OK, entry.body, CIMultiDict(entry.headers))
+
+        if entry is not None:
+            kwargs["headers"] = {**kwargs.get("headers", {}), **entry.get_validators()}
+
+        response = await self._send(
+            method=method,
+            url=url,
+            idempotent=True,
+            params=params,
+            **kwargs,
+        )
+        if entry is not None and response.status == HTTPStatus.NOT_MODIFIED:
+            headers = CIMultiDict(entry.headers)
+            headers.update(response.headers)
+            entry = cache.make_entry(entry.body, headers)
+            await cache.backend.set(key, entry)
+            return Response(HTTPStatus.OK, entry.body, headers)
+
+        self._check_status(response.status, response.body)
+        await cache.backend.set(key, cache.make_entry(response.body, response.headers))
+        return response
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        *,
+        idempotent: bool = False,
+        **kwargs,
+    ) -> Response:
+        """Send request retrying transient failures of idempotent requests."""
+        return await self._retry(
+            self._make_checked_request,
+            method=method,
+            url=url,
+            idempotent=idempotent,
+            **kwargs,
+        )
+
+    async def _retry(
+        self,
+        make_request: Callable[..., Awaitable[T]],
+        method: str,
+        url: str,
+        *,
+        idempotent: bool = False,
+        **kwargs,
+    ) -> T:
+        """Make request retrying transient failures of idempotent requests."""
+        policy = self._retry_policy
+        attempt = 0
+        delays = 0.0
+        while True:
+            attempt += 1
+            try:
+                return await self._send_limited(
+                    make_request,
+                    method=method,
+                    url=url,
+                    **kwargs,
+                )
+            except Exception as e:
+                if not idempotent or not policy.is_transient(e):
+                    raise
+
+                delay = policy.get_delay(attempt)
+                event = RetryEvent(method, url, attempt, delay, e)
+                out_of_budget = policy.budget is not None and (
+                    delays + delay > policy.budget
+                )
+                if attempt >= policy.attempts or out_of_budget:
+                    if policy.on_giveup is not None:
+                        policy.on_giveup(event)
+                    raise
+
+                if policy.on_retry is not None:
+                    policy.on_retry(event)
+                logger.info("Retry %s %s in %.2fs: %r", method, url, delay, e)
+                delays += delay
+                await asyncio.sleep(delay)
+
+    async def _send_limited(
+        self,
+        make_request: Callable[..., Awaitable[T]],
+        method: str,
+        url: str,
+        **kwargs,
+    ) -> T:
+        """Make request respecting rate limits.
+
+        Throttled requests are repeated after `Retry-After` delay.
+        """
+        if self._rate_limiter is None:
+            return await make_request(method=method, url=url, **kwargs)
+
+        limiter = self._rate_limiter
+        replayable = not isinstance(kwargs.get("data"), FormData)
+        attempt = 0
+        while True:
+            try:
+                async with limiter.slot(self._org_id, method, url):
+                    return await make_request(method=method, url=url, **kwargs)
+            except TooManyRequestsError:  # noqa: PERF203
+                attempt += 1
+                if not replayable or attempt > limiter.max_throttle_retries:
+                    raise
+                logger.info("Throttled: %s %s (attempt %s)", method, url, attempt)
+
+    async def _make_checked_request(
+        self,
+        method: str,
+        url: str,
+        **kwargs,
+    ) -> Response:
+        """Get response raising error statuses.
+
+        Statuses are checked inside retries and rate limits, so returned
+        5xx are retried and 429 throttles like raised ones.
+        Statuses handled by callers (304, 416) are returned as is.
+        """
+        result = await self._make_request(method=method, url=url, **kwargs)
+        response = _as_response(result)
+        if response.status not in PASSED_STATUSES:
+            self._check_status(response.status, response.body, response.headers)
+        return response
 
     @abstractmethod
     async def _make_request(
@@ -100,14 +473,19 @@ class BaseClient(ABC):
         method: str,
         url: StrOrURL,
         **kwargs,
-    ) -> tuple[int, bytes]:
+    ) -> Response | tuple[int, bytes]:
         """Get raw response from via http-client.
 
-        :returns: tuple of (status_code, response_body).
+        :returns: tuple of (status_code, response_body, response_headers).
+            Tuple of (status_code, response_body) is supported as well.
         """
 
     @staticmethod
-    def _check_status(status: int, body: bytes) -> None:
+    def _check_status(
+        status: int,
+        body: bytes,
+        headers: Mapping[str, str] | None = None,
+    ) -> None:
         if status < HTTPStatus.MULTIPLE_CHOICES:
             return
 
@@ -123,6 +501,13 @@ class BaseClient(ABC):
         if status == HTTPStatus.CONFLICT:
             raise AlreadyExistsError
 
+        if status == HTTPStatus.TOO_MANY_REQUESTS:
+            retry_after = parse_retry_after((headers or {}).get("Retry-After"))
+            raise TooManyRequestsError(retry_after)
+
+        if status >= HTTPStatus.INTERNAL_SERVER_ERROR:
+            raise ServerError(status, body.decode("utf-8"))
+
         raise YaTrackerError(body)
 
     @abstractmethod
@@ -130,6 +515,51 @@ class BaseClient(ABC):
         """Close the session gracefully."""
 
 
+def _as_response(result: Response | tuple[int, bytes]) -> Response:
+    """Get response from `_make_request` result of any supported shape."""
+    if isinstance(result, Response):
+        return result
+    status, body = result
+    return Response(status, body, {})
+
+
+def _make_flight_key(
+    method: str,
+    url: str,
+    params: Mapping[str, Any] | None,
+    kwargs: Mapping[str, Any],
+    body: bytes | None = None,
+) -> Hashable | None:
+    """Get key of the request to coalesce identical ones.
+
+    Params and headers are encoded to JSON with sorted keys,
+    so list and dict values are supported too.
+    Encoded JSON body (GET may have one) is a part of the key.
+    Requests with extra options (except headers) or values
+    which can't be encoded are not coalesced.
+    """
+    if kwargs.keys() - {"headers"}:
+        return None
+
+    headers = kwargs.get("headers")
+    try:
+        return (
+            method.upper(),
+            url,
+            msgspec.json.encode(params, order="sorted") if params else None,
+            msgspec.json.encode(headers, order="sorted") if headers else None,
+            body,
+        )
+    except (TypeError, msgspec.EncodeError):
+        return None
+
+
+async def _iter_chunks(body: bytes, chunk_size: int) -> AsyncIterator[bytes]:
+    """Split buffered body by chunks."""
+    for start in range(0, len(body), chunk_size):
+        yield body[start : start + chunk_size]
+
+
 class AIOHTTPClient(BaseClient):
     """Base aiohttp client.
 
@@ -149,6 +579,13 @@ class AIOHTTPClient(BaseClient):
         headers: dict[str, str] | None = None,
         api_host: str | None = None,
         api_version: str | None = None,
+        *,
+        connector: TCPConnector | None = None,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float | None = 15.0,
+        ttl_dns_cache: int | None = 10,
+        force_close: bool = False,
         **kwargs,
     ) -> None:
         """Set defaults on object init.
@@ -156,6 +593,10 @@ class AIOHTTPClient(BaseClient):
         By default, `self._session` is None.
         It will be created on a first API request.
         The second request will use the same `self._session`.
+
+        Connection pool is set up by `limit`, `limit_per_host`,
+        `keepalive_timeout`, `ttl_dns_cache` and `force_close`
+        (see `create_connector`), or pass your own shared `connector`.
         """
         super().__init__(
             org_id=org_id,
@@ -166,20 +607,28 @@ class AIOHTTPClient(BaseClient):
             **kwargs,
         )
         self._timeout: ClientTimeout = kwargs.get("timeout") or ClientTimeout(total=0)
+        self._connector = connector
+        self._pool_options: dict[str, Any] = {
+            "limit": limit,
+            "limit_per_host": limit_per_host,
+            "keepalive_timeout": keepalive_timeout,
+            "ttl_dns_cache": ttl_dns_cache,
+            "force_close": force_close,
+        }
 
     def get_session(self) -> ClientSession:
         """Get cached session. One session per instance."""
         if isinstance(self._session, ClientSession) and not self._session.closed:
             return self._session
 
-        ssl_context = ssl.create_default_context(cafile=certifi.where())
-        connector = TCPConnector(ssl=ssl_context)
+        shared = self._connector is not None
+        connector = self._connector or create_connector(**self._pool_options)
 
-        encoder = msgspec.json.Encoder()
         self._session = ClientSession(
             connector=connector,
+            connector_owner=not shared,
             headers=self._headers,
-            json_serialize=lambda obj: encoder.encode(obj).decode(),
+            json_serialize=lambda obj: self._encoder.encode(obj).decode(),
             timeout=self._timeout,
         )
         return self._session
@@ -189,62 +638,99 @@ class AIOHTTPClient(BaseClient):
         method: str,
         url: StrOrURL,
         **kwargs,
-    ) -> tuple[int, bytes]:
+    ) -> Response:
         """Make a request.
 
         :param method: HTTP Method
         :param url: endpoint link
         :param kwargs: data, params, json and other...
-        :return: status and result or exception
+        :return: status, result and headers or exception
         """
         session = self.get_session()
 
         async with session.request(method, url, **kwargs) as response:
             status = response.status
             body = await response.read()
+            headers = response.headers
 
         if status >= HTTPStatus.BAD_REQUEST:
-            raise self._process_exception(status, body)
-
-        return status, body
+            raise self._process_exception(status, body, headers)
 
-    def _prepare_form(self, file: str | Path | io.IOBase) -> FormData:
-        """Create form to pass file via multipart/form-data."""
-        form = FormData()
-        form.add_field("file", self._prepare_file(file))
-        return form
+        return Response(status, body, headers)
 
-    @staticmethod
-    def _prepare_file(file: str | Path | io.IOBase) -> io.IOBase | BinaryIO:
-        """Prepare accepted types to correct file type."""
-        if isinstance(file, str):
-            with Path(file).open("rb") as f:
-                return f
+    @asynccontextmanager
+    async def stream(
+        self,
+        method: str,
+        uri: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[StreamResponse]:
+        """Make request and stream response body by chunks.
 
-        if isinstance(file, io.IOBase):
-            return file
+        Opening of the stream respects rate limits and retry policy.
+        """
+        response = await self._retry(
+            self._open_stream,
+            method=method,
+            url=self._build_url(uri),
+            idempotent=self._retry_policy.is_idempotent(method),
+            params=params,
+            headers=headers,
+        )
+        try:
+            yield StreamResponse(
+                response.status,
+                response.headers,
+                response.content.iter_chunked(chunk_size),
+            )
+        finally:
+            response.release()
 
-        if isinstance(file, Path):
-            return file.open("rb")
+    async def _open_stream(
+        self,
+        method: str,
+        url: StrOrURL,
+        **kwargs,
+    ) -> ClientResponse:
+        """Get response with unread body."""
+        session = self.get_session()
+        response = await session.request(method, url, **kwargs)
+        status = response.status
+        if (
+            status >= HTTPStatus.BAD_REQUEST
+            and status != HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE
+        ):
+            body = await response.read()
+            response.release()
+            raise self._process_exception(status, body, response.headers)
 
-        msg = (  # type: ignore[unreachable]
-            f"Not supported file type: `{type(file).__name__}`"
-        )
-        raise TypeError(msg)
+        return response
 
     @staticmethod
     def _process_exception(
         status: int,
         data: bytes,
+        headers: Mapping[str, str] | None = None,
     ) -> YaTrackerError:
         """Wrap API exceptions.
 
         :param status: response status
         :param data: response json converted to dict()
+        :param headers: response headers
         :return: wrapped exception
         """
         text = data.decode("utf-8")
         logger.warning("Error! Status: %s. Body: %s", status, text)
+
+        if status == HTTPStatus.TOO_MANY_REQUESTS:
+            retry_after = parse_retry_after((headers or {}).get("Retry-After"))
+            return TooManyRequestsError(retry_after)
+
+        if status >= HTTPStatus.INTERNAL_SERVER_ERROR:
+            return ServerError(status, text)
+
         return YaTrackerError(text)
 
     async def close(self) -> None:
@@ -0,0 +1,136 @@
+"""JSON codecs registry module."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from msgspec import json
+
+from yatracker import types
+from yatracker.types.base import Base
+from yatracker.types.duration import Duration
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+T = TypeVar("T")
+
+# all the structs exported by `yatracker.types`
+BUILTIN_TYPES: tuple[type[Base], ...] = tuple(
+    obj
+    for obj in vars(types).values()
+    if isinstance(obj, type) and issubclass(obj, Base) and obj is not Base
+)
+
+
+def enc_hook(obj: Any) -> Any:  # noqa: ANN401
+    """Encode types unsupported by msgspec."""
+    if isinstance(obj, Duration):
+        return obj.to_iso()
+
+    msg = f"Objects of type {type(obj)} are not supported."
+    raise NotImplementedError(msg)
+
+
+def dec_hook(type_: type, obj: Any) -> Any:  # noqa: ANN401
+    """Decode types unsupported by msgspec."""
+    if type_ is Duration and isinstance(obj, str):
+        return Duration.from_iso(obj)
+
+    msg = f"Objects of type {type_} are not supported."
+    raise NotImplementedError(msg)
+
+
+def _chain_enc_hook(hook: Callable[[Any], Any] | None) -> Callable[[Any], Any]:
+    """Call the hook for objects unsupported by the builtin one."""
+    if hook is None:
+        return enc_hook
+
+    def chained(obj: Any) -> Any:  # noqa: ANN401
+        if isinstance(obj, Duration):
+            return obj.to_iso()
+        return hook(obj)
+
+    return chained
+
+
+def _chain_dec_hook(
+    hook: Callable[[type, Any], Any] | None,
+) -> Callable[[type, Any], Any]:
+    """Call the hook for types unsupported by the builtin one."""
+    if hook is None:
+        return dec_hook
+
+    def chained(type_: type, obj: Any) -> Any:  # noqa: ANN401
+        if type_ is Duration and isinstance(obj, str):
+            return Duration.from_iso(obj)
+        return hook(type_, obj)
+
+    return chained
+
+
+class CodecRegistry:
+    """Represents registry of precompiled JSON decoders and encoder.
+
+    Decoders are built for a type and for a list of it at once,
+    so no generic alias is created per request.
+    Unknown types are registered on the first use,
+    call `warmup` on startup to build them in advance.
+    Your own hooks are called for types unsupported by the builtin ones.
+
+    >>> tracker = YaTracker(org_id=..., token=...)
+    >>> tracker.codecs.register(MyIssue)
+    >>> tracker.warmup()
+    """
+
+    def __init__(
+        self,
+        enc_hook: Callable[[Any], Any] | None = None,
+        dec_hook: Callable[[type, Any], Any] | None = None,
+    ) -> None:
+        self.dec_hook = _chain_dec_hook(dec_hook)
+        self.encoder = json.Encoder(enc_hook=_chain_enc_hook(enc_hook))
+        self._decoders: dict[Any, json.Decoder] = {}
+        self._list_decoders: dict[Any, json.Decoder] = {}
+        self._registered: dict[Any, None] = dict.fromkeys(BUILTIN_TYPES)
+
+    def register(self, *types_: type) -> None:
+        """Register types to build their decoders on warmup."""
+        self._registered.update(dict.fromkeys(types_))
+
+    def warmup(self, types_: Iterable[type] | None = None) -> int:
+        """Build decoders of registered (or the given) types.
+
+        :return: count of built decoders.
+        """
+        built = 0
+        for type_ in self._registered if types_ is None else types_:
+            if type_ not in self._decoders:
+                self._build(type_)
+                built += 1
+        return built
+
+    def get_decoder(self, type_: type[T]) -> json.Decoder[T]:
+        """Get decoder of the type."""
+        try:
+            return self._decoders[type_]
+        except KeyError:
+            return self._build(type_)[0]
+
+    def get_list_decoder(self, type_: type[T]) -> json.Decoder[list[T]]:
+        """Get decoder of a list of the type."""
+        try:
+            return self._list_decoders[type_]
+        except KeyError:
+            return self._build(type_)[1]
+
+    def _build(self, type_: Any) -> tuple[json.Decoder, json.Decoder]:  # noqa: ANN401
+        self._registered.setdefault(type_)
+        decoder = json.Decoder(type_, dec_hook=self.dec_hook)
+        list_decoder = json.Decoder(list[type_], dec_hook=self.dec_hook)  # type: ignore[valid-type]
+        self._decoders[type_] = decoder
+        self._list_decoders[type_] = list_decoder
+        return decoder, list_decoder
+
+
+default_registry = CodecRegistry()
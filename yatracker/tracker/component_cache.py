@@ -0,0 +1,164 @@
+"""Per-queue component cache module."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, NamedTuple, Protocol
+
+from yatracker.exceptions import ComponentNotFoundError
+from yatracker.types import Component, FullComponent
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+DEFAULT_TTL = 15 * 60
+
+ComponentRef = str | int | Component | FullComponent
+
+
+class ComponentSource(Protocol):
+    """Represents tracker able to get components of a queue."""
+
+    async def get_queue_components(
+        self,
+        queue_id: str | int,
+    ) -> list[FullComponent]:
+        """Get components of the queue."""
+        ...
+
+
+class QueueComponents(NamedTuple):
+    """Represents components of a queue loaded at the moment."""
+
+    loaded_at: float
+    by_name: dict[str, FullComponent]
+
+
+class ComponentCache:
+    """Represents components of queues indexed by name.
+
+    Components of a queue are loaded by one request on the first lookup
+    and reloaded when they are older than `ttl` seconds (pass None to keep
+    them until `invalidate` is called). An unknown name causes one reload,
+    in case the component was created after loading.
+
+    >>> ids = await tracker.component_cache.resolve("KEY", ["Backend", "API"])
+    """
+
+    def __init__(
+        self,
+        tracker: ComponentSource,
+        ttl: float | None = DEFAULT_TTL,
+    ) -> None:
+        self.tracker = tracker
+        self.ttl = ttl
+        self._queues: dict[str, QueueComponents] = {}
+        self._locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    def invalidate(self, queue: str | None = None) -> None:
+        """Drop cached components of the queue (of all queues by default)."""
+        if queue is None:
+            self._queues.clear()
+        else:
+            self._queues.pop(queue, None)
+
+    async def get_components(self, queue: str) -> list[FullComponent]:
+        """Get components of the queue."""
+        components = await self._get(queue)
+        return list(components.by_name.values())
+
+    async def get(self, queue: str, name: str) -> FullComponent | None:
+        """Get component of the queue by name (case-insensitive)."""
+        components = await self._get(queue)
+        return components.by_name.get(name.lower())
+
+    async def resolve(
+        self,
+        queue: str,
+        components: Iterable[ComponentRef],
+    ) -> list[int]:
+        """Get ids of components set by names, ids or objects.
+
+        Ids are int only, every string is a name (even all-digit one).
+        `ComponentNotFoundError` is raised for unknown names.
+        """
+        ids = []
+        for component in components:
+            match component:
+                case int():
+                    ids.append(component)
+                case str():
+                    ids.append(await self._resolve_name(queue, component))
+                case _:
+                    ids.append(int(component.id))
+        return ids
+
+    async def resolve_value(self, queue: str, value: Any) -> Any:  # noqa: ANN401
+        """Resolve names in `components` field value of an issue.
+
+        The value is a list to set or a dict with `set`, `add`
+        and `remove` lists, other values are kept as is.
+        """
+        if isinstance(value, list | tuple):
+            return await self.resolve(queue, value)
+        if isinstance(value, dict):
+            return {
+                k: await self.resolve(queue, v) if isinstance(v, list | tuple) else v
+                for k, v in value.items()
+            }
+        return value
+
+    async def _resolve_name(self, queue: str, name: str) -> int:
+        component = await self.get(queue, name)
+        if component is None:
+            component = (await self._get(queue, reload=True)).by_name.get(name.lower())
+        if component is None:
+            raise ComponentNotFoundError(queue, name)
+        return component.id
+
+    async def _get(self, queue: str, *, reload: bool = False) -> QueueComponents:
+        """Get components of the queue, load them if needed.
+
+        Concurrent callers share a single request.
+        """
+        cached = self._queues.get(queue)
+        if not reload and cached is not None and not self._is_stale(cached):
+            return cached
+
+        async with self._locks[queue]:
+            current = self._queues.get(queue)
+            # another caller has loaded them while we were waiting
+            if current is not None and current is not cached:
+                return current
+
+            components = await self.tracker.get_queue_components(queue)
+            current = QueueComponents(
+                loaded_at=time.monotonic(),
+                by_name={c.name.lower(): c for c in components},
+            )
+            self._queues[queue] = current
+            return current
+
+    def _is_stale(self, components: QueueComponents) -> bool:
+        if self.ttl is None:
+            return False
+        return time.monotonic() - components.loaded_at > self.ttl
+
+
+def has_component_names(value: Any) -> bool:  # noqa: ANN401
+    """Check `components` field value contains names to resolve."""
+    if isinstance(value, dict):
+        return any(has_component_names(v) for v in value.values())
+    if isinstance(value, list | tuple):
+        return any(isinstance(v, str) for v in value)
+    return False
+
+
+def get_queue_key(issue_key: str) -> str | None:
+    """Get queue key from the issue key, None for issue ids."""
+    queue, sep, number = issue_key.rpartition("-")
+    if not sep or not queue or not number.isdigit():
+        return None
+    return queue
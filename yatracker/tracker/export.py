@@ -0,0 +1,211 @@
+"""Bulk export helpers module."""
+
+from __future__ import annotations
+
+import csv
+import io
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO, Literal, NamedTuple
+
+import msgspec
+
+from .pagination import Cursor
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+ExportFormat = Literal["jsonl", "csv"]
+
+# related objects which may be exported with issues
+INCLUDES = {
+    "comments": "/issues/{key}/comments",
+    "worklogs": "/issues/{key}/worklog",
+    "links": "/issues/{key}/links",
+}
+
+DEFAULT_COLUMNS = (
+    "key",
+    "summary",
+    "type.key",
+    "status.key",
+    "priority.key",
+    "queue.key",
+    "assignee.id",
+    "createdBy.id",
+    "createdAt",
+    "updatedAt",
+)
+
+
+class ExportProgress(NamedTuple):
+    """Represents export progress passed to the callback."""
+
+    exported: int
+    total: int | None
+    elapsed: float
+
+    @property
+    def rate(self) -> float:
+        """Get exported issues per second."""
+        return self.exported / self.elapsed if self.elapsed else 0.0
+
+
+class ExportCheckpoint(msgspec.Struct):
+    """Represents position of interrupted export.
+
+    `offset` is the file size after the last written page,
+    `cursor` points to the next page.
+    """
+
+    uri: str
+    params: dict[str, Any] | None
+    headers: dict[str, str] | None
+    payload: dict[str, Any]
+    exported: int
+    offset: int
+
+    @property
+    def cursor(self) -> Cursor:
+        """Get cursor of the next page."""
+        return Cursor(uri=self.uri, params=self.params, headers=self.headers)
+
+
+class IssueKey(msgspec.Struct):
+    """Represents the only issue field needed to export related objects."""
+
+    key: str
+
+
+class RowWriter:
+    """Represents encoder of exported rows.
+
+    Issues (and related objects) are kept as raw JSON,
+    JSONL rows are written without decoding them.
+    """
+
+    def __init__(
+        self,
+        format_: ExportFormat,
+        columns: Sequence[str] = DEFAULT_COLUMNS,
+        include: Sequence[str] = (),
+    ) -> None:
+        if format_ not in {"jsonl", "csv"}:
+            msg = f"Unknown export format {format_!r}."
+            raise ValueError(msg)
+
+        self.format = format_
+        self.columns = [column.split(".") for column in columns]
+        self.header = [*columns, *include]
+        self.include = include
+        self._encoder = msgspec.json.Encoder()
+
+    def encode_header(self) -> bytes:
+        """Get file header."""
+        if self.format == "jsonl":
+            return b""
+        return self._encode_csv([self.header])
+
+    def encode(
+        self,
+        issues: Sequence[msgspec.Raw],
+        related: Sequence[Mapping[str, msgspec.Raw]] | None = None,
+    ) -> bytes:
+        """Encode a page of rows."""
+        if self.format == "csv":
+            return self._encode_csv(self._iter_csv_rows(issues, related))
+
+        if related is None:
+            return b"".join(bytes(issue) + b"\n" for issue in issues)
+
+        return b"".join(
+            self._encoder.encode({"issue": issue, **objects}) + b"\n"
+            for issue, objects in zip(issues, related, strict=True)
+        )
+
+    def _iter_csv_rows(
+        self,
+        issues: Sequence[msgspec.Raw],
+        related: Sequence[Mapping[str, msgspec.Raw]] | None,
+    ) -> list[list[Any]]:
+        rows = []
+        for i, issue in enumerate(issues):
+            data = msgspec.json.decode(issue)
+            row = [self._get_cell(data, path) for path in self.columns]
+            if related is not None:
+                row.extend(bytes(related[i][name]).decode() for name in self.include)
+            rows.append(row)
+        return rows
+
+    def _get_cell(self, data: Any, path: list[str]) -> Any:  # noqa: ANN401
+        """Get value by the dotted path, objects are encoded to JSON."""
+        for name in path:
+            if not isinstance(data, dict):
+                return None
+            data = data.get(name)
+        if isinstance(data, dict | list):
+            return self._encoder.encode(data).decode()
+        return data
+
+    @staticmethod
+    def _encode_csv(rows: list[list[Any]]) -> bytes:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        return buffer.getvalue().encode()
+
+
+class ExportFile:
+    """Represents export file with checkpoint.
+
+    Blocking methods are supposed to be called in a thread.
+    """
+
+    def __init__(self, path: str | Path, checkpoint: str | Path | None = None) -> None:
+        self.path = Path(path)
+        self.checkpoint_path = (
+            Path(checkpoint)
+            if checkpoint
+            else self.path.with_name(f"{self.path.name}.checkpoint")
+        )
+        self._file: BinaryIO | None = None
+        self._decoder = msgspec.json.Decoder(ExportCheckpoint)
+        self._encoder = msgspec.json.Encoder()
+
+    def load_checkpoint(self) -> ExportCheckpoint | None:
+        """Get checkpoint of interrupted export, if any."""
+        try:
+            return self._decoder.decode(self.checkpoint_path.read_bytes())
+        except FileNotFoundError:
+            return None
+
+    def open(self, checkpoint: ExportCheckpoint | None, header: bytes) -> None:
+        """Open file from scratch or truncate it to the checkpoint."""
+        if checkpoint is None:
+            self._file = self.path.open("wb")
+            self._file.write(header)
+        else:
+            self._file = self.path.open("r+b")
+            self._file.truncate(checkpoint.offset)
+            self._file.seek(checkpoint.offset)
+
+    def write(self, data: bytes) -> int:
+        """Append data and flush it, return file size."""
+        if self._file is None:
+            msg = "Export file is not opened."
+            raise RuntimeError(msg)
+        self._file.write(data)
+        self._file.flush()
+        return self._file.tell()
+
+    def save_checkpoint(self, checkpoint: ExportCheckpoint) -> None:
+        """Save checkpoint atomically."""
+        tmp = self.checkpoint_path.with_suffix(".tmp")
+        tmp.write_bytes(self._encoder.encode(checkpoint))
+        tmp.replace(self.checkpoint_path)
+
+    def close(self, *, completed: bool) -> None:
+        """Close file, drop checkpoint of completed export."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if completed:
+            self.checkpoint_path.unlink(missing_ok=True)
@@ -0,0 +1,88 @@
+"""Identity map of reference objects module."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import msgspec
+from msgspec import inspect
+
+from yatracker.types import IssueType, Priority, Queue, Status, User
+from yatracker.types.resolution import Resolution
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+DEFAULT_TYPES = (User, Status, Queue, Priority, IssueType, Resolution)
+
+
+class IdentityMap:
+    """Represents opt-in interning of reference objects by (type, id).
+
+    Decoded objects of `types` nested in responses are replaced with
+    the first seen instance having the same id, so a page of issues keeps
+    a single `User` per user. Equal references are the same object,
+    don't mutate them.
+
+    >>> tracker = YaTracker(org_id=..., token=..., identity_map=IdentityMap())
+
+    Instances live as long as the map, call `clear` to drop them.
+    """
+
+    def __init__(self, types: Iterable[type[msgspec.Struct]] = DEFAULT_TYPES) -> None:
+        self.types = frozenset(types)
+        self._objects: dict[type, dict[Any, Any]] = {t: {} for t in self.types}
+        # names of fields which may contain structs, per struct type
+        self._plans: dict[type, tuple[str, ...]] = {}
+
+    def __len__(self) -> int:
+        """Get count of interned objects."""
+        return sum(len(objects) for objects in self._objects.values())
+
+    def clear(self) -> None:
+        """Drop interned objects."""
+        for objects in self._objects.values():
+            objects.clear()
+
+    def intern(self, obj: Any) -> Any:  # noqa: ANN401
+        """Replace nested reference objects with interned ones."""
+        if isinstance(obj, list):
+            return [self.intern(o) for o in obj]
+
+        cls = type(obj)
+        objects = self._objects.get(cls)
+        if objects is not None:
+            return objects.setdefault(obj.id, obj)
+
+        plan = self._plans.get(cls)
+        if plan is None:
+            if not isinstance(obj, msgspec.Struct):
+                return obj
+            plan = self._plans[cls] = _compile(cls)
+
+        for name in plan:
+            value = getattr(obj, name)
+            if value is not None:
+                setattr(obj, name, self.intern(value))
+        return obj
+
+
+def _compile(cls: type[msgspec.Struct]) -> tuple[str, ...]:
+    """Get names of the struct fields which may contain structs."""
+    info = inspect.type_info(cls)
+    if not isinstance(info, inspect.StructType):
+        return ()
+    return tuple(f.name for f in info.fields if _has_structs(f.type))
+
+
+def _has_structs(type_: inspect.Type) -> bool:
+    """Check values of the type may be or contain structs."""
+    match type_:
+        case inspect.StructType():
+            return True
+        case inspect.ListType():
+            return _has_structs(type_.item_type)
+        case inspect.UnionType():
+            return any(_has_structs(t) for t in type_.types)
+        case _:
+            return False
@@ -0,0 +1,434 @@
+"""Import pipeline module."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from collections.abc import AsyncIterable
+from functools import partial
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO, Literal, NamedTuple
+
+import msgspec
+from aiohttp import ClientError
+
+from yatracker.exceptions import YaTrackerError
+from yatracker.utils.concurrency import gather_limited
+
+from .pagination import DEFAULT_CONCURRENCY
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable
+
+    from .categories.import_ import Import
+
+ObjectKind = Literal["issue", "comment", "attachment", "link"]
+
+DEFAULT_QUEUE_SIZE = 100
+
+
+class SourceComment(msgspec.Struct, kw_only=True, rename="camel"):
+    """Represents a comment to import, `id` is the original one."""
+
+    id: str
+    text: str
+    created_at: str
+    created_by: str
+    updated_at: str | None = None
+    updated_by: str | None = None
+
+
+class SourceAttachment(msgspec.Struct, kw_only=True, rename="camel"):
+    """Represents a file to import.
+
+    `comment_id` is the original id of the comment the file is attached to.
+    """
+
+    id: str
+    path: str
+    created_at: str
+    created_by: str
+    filename: str | None = None
+    comment_id: str | None = None
+
+
+class SourceLink(msgspec.Struct, kw_only=True, rename="camel"):
+    """Represents a link to import.
+
+    `issue` is the original id of the linked issue,
+    or a key of the existing one if it's not imported.
+    """
+
+    relationship: str
+    issue: str
+    created_at: str
+    created_by: str
+    updated_at: str | None = None
+    updated_by: str | None = None
+
+
+class SourceIssue(msgspec.Struct, kw_only=True):
+    """Represents an issue to import with its related objects.
+
+    `fields` are keyword arguments of `import_issue`.
+    """
+
+    id: str
+    fields: dict[str, Any]
+    comments: list[SourceComment] = msgspec.field(default_factory=list)
+    attachments: list[SourceAttachment] = msgspec.field(default_factory=list)
+    links: list[SourceLink] = msgspec.field(default_factory=list)
+
+
+class ImportFailure(NamedTuple):
+    """Represents an object which was not imported."""
+
+    kind: ObjectKind
+    id: str
+    error: str
+
+
+class ImportResult(NamedTuple):
+    """Represents result of the import run."""
+
+    issues: dict[str, str]
+    imported: Counter[str]
+    failures: list[ImportFailure]
+
+
+class ImportCheckpoint:
+    """Represents append-only JSONL file of old -> new id mappings.
+
+    Every line is `[kind, old id, new id]`, written as soon as
+    the object is imported. Blocking methods are supposed to be called
+    in a thread.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._file: BinaryIO | None = None
+        self._decoder = msgspec.json.Decoder(tuple[str, str, str])
+        self._encoder = msgspec.json.Encoder()
+
+    def open(self) -> dict[tuple[str, str], str]:
+        """Load mappings saved by previous runs, open file to append."""
+        mapping = {}
+        if self.path.exists():
+            with self.path.open("rb") as f:
+                for line in f:
+                    # the last line may be cut by interruption
+                    if not line.endswith(b"\n"):
+                        break
+                    kind, old, new = self._decoder.decode(line)
+                    mapping[kind, old] = new
+        self._file = self.path.open("ab")
+        return mapping
+
+    def add(self, kind: ObjectKind, old: str, new: str) -> None:
+        """Save mapping."""
+        if self._file is None:
+            msg = "Checkpoint file is not opened."
+            raise RuntimeError(msg)
+        self._file.write(self._encoder.encode((kind, old, new)) + b"\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        """Close file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class LinkSpool:
+    """Represents temporary JSONL file of links waiting for the end of import.
+
+    Links are written by batches and read back by batches, so they
+    don't pile up in memory. The file is deleted on close.
+    Blocking methods are supposed to be called in a thread.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._file: BinaryIO | None = None
+        self._decoder = msgspec.json.Decoder(tuple[str, SourceLink])
+        self._encoder = msgspec.json.Encoder()
+
+    def open(self) -> None:
+        """Create empty file."""
+        self._file = self.path.open("w+b")
+
+    def write(self, links: list[tuple[str, SourceLink]]) -> None:
+        """Save links of the issues (`(old issue id, link)` pairs)."""
+        if self._file is None:
+            msg = "Link spool file is not opened."
+            raise RuntimeError(msg)
+        self._file.write(b"".join(self._encoder.encode(x) + b"\n" for x in links))
+
+    def rewind(self) -> None:
+        """Start reading from the beginning."""
+        if self._file is not None:
+            self._file.flush()
+            self._file.seek(0)
+
+    def read(self, size: int) -> list[tuple[str, SourceLink]]:
+        """Read next links, empty list at the end."""
+        if self._file is None:
+            return []
+        return [self._decoder.decode(line) for line in islice(self._file, size)]
+
+    def close(self) -> None:
+        """Close and delete file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self.path.unlink(missing_ok=True)
+
+
+class Importer:
+    """Represents pipeline importing issues with comments, files and links.
+
+    Issues are imported by `concurrency` workers. As soon as an issue
+    is imported, its comments and then attachments are imported by
+    other workers, while the next issues are being imported.
+    Links are imported at the end, when all the linked issues exist,
+    meanwhile they are flushed by batches to the temporary file.
+    Bounded queues between stages keep memory constant for large sources.
+
+    Imported objects are recorded in the checkpoint file,
+    so a rerun with the same source skips them.
+    Objects failed to import are reported, but don't stop the import.
+    """
+
+    def __init__(
+        self,
+        tracker: Import,
+        checkpoint: str | Path,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+    ) -> None:
+        self.tracker = tracker
+        self.checkpoint = ImportCheckpoint(checkpoint)
+        self.links = LinkSpool(f"{checkpoint}.links")
+        self.concurrency = concurrency
+        self.queue_size = queue_size
+        self.mapping: dict[tuple[str, str], str] = {}
+        self.imported: Counter[str] = Counter()
+        self.failures: list[ImportFailure] = []
+        self._links: list[tuple[str, SourceLink]] = []
+
+    async def run(
+        self,
+        source: Iterable[SourceIssue] | AsyncIterable[SourceIssue],
+    ) -> ImportResult:
+        """Import all the issues of the source."""
+        self.mapping = await asyncio.to_thread(self.checkpoint.open)
+        await asyncio.to_thread(self.links.open)
+        try:
+            await self._run_pipeline(source)
+            await self._import_links()
+        finally:
+            await asyncio.to_thread(self.checkpoint.close)
+            await asyncio.to_thread(self.links.close)
+
+        issues = {
+            old: new for (kind, old), new in self.mapping.items() if kind == "issue"
+        }
+        return ImportResult(issues, self.imported, self.failures)
+
+    async def _run_pipeline(
+        self,
+        source: Iterable[SourceIssue] | AsyncIterable[SourceIssue],
+    ) -> None:
+        """Run issues and related objects stages."""
+        issues: asyncio.Queue[SourceIssue | None] = asyncio.Queue(self.queue_size)
+        children: asyncio.Queue[SourceIssue | None] = asyncio.Queue(self.queue_size)
+        issue_workers = [
+            asyncio.ensure_future(self._issues_worker(issues, children))
+            for _ in range(self.concurrency)
+        ]
+        children_workers = [
+            asyncio.ensure_future(self._children_worker(children))
+            for _ in range(self.concurrency)
+        ]
+
+        async def produce() -> None:
+            async for issue in _iterate(source):
+                await issues.put(issue)
+            for _ in issue_workers:
+                await issues.put(None)
+            await asyncio.gather(*issue_workers)
+            for _ in children_workers:
+                await children.put(None)
+
+        workers = [
+            asyncio.ensure_future(produce()),
+            *issue_workers,
+            *children_workers,
+        ]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
+
+    async def _issues_worker(
+        self,
+        issues: asyncio.Queue[SourceIssue | None],
+        children: asyncio.Queue[SourceIssue | None],
+    ) -> None:
+        while (issue := await issues.get()) is not None:
+            if ("issue", issue.id) not in self.mapping:
+                created = await self._call(
+                    "issue",
+                    issue.id,
+                    partial(self.tracker.import_issue, **issue.fields),
+                )
+                if created is None:
+                    continue
+                await self._save("issue", issue.id, created.key)
+
+            if issue.links:
+                await self._add_links(issue.id, issue.links)
+            if issue.comments or issue.attachments:
+                await children.put(issue)
+
+    async def _children_worker(
+        self,
+        children: asyncio.Queue[SourceIssue | None],
+    ) -> None:
+        while (issue := await children.get()) is not None:
+            key = self.mapping["issue", issue.id]
+            for comment in issue.comments:
+                await self._import_comment(key, comment)
+            for attachment in issue.attachments:
+                await self._import_attachment(key, attachment)
+
+    async def _import_comment(self, key: str, comment: SourceComment) -> None:
+        if ("comment", comment.id) in self.mapping:
+            return
+
+        created = await self._call(
+            "comment",
+            comment.id,
+            partial(
+                self.tracker.import_comment,
+                key,
+                text=comment.text,
+                created_at=comment.created_at,
+                created_by=comment.created_by,
+                updated_at=comment.updated_at,
+                updated_by=comment.updated_by,
+            ),
+        )
+        if created is not None:
+            await self._save("comment", comment.id, str(created.id))
+
+    async def _import_attachment(self, key: str, attachment: SourceAttachment) -> None:
+        if ("attachment", attachment.id) in self.mapping:
+            return
+
+        comment_id = None
+        if attachment.comment_id is not None:
+            comment_id = self.mapping.get(("comment", attachment.comment_id))
+            if comment_id is None:
+                self._fail("attachment", attachment.id, "Comment is not imported.")
+                return
+
+        created = await self._call(
+            "attachment",
+            attachment.id,
+            partial(
+                self.tracker.import_attachment,
+                key,
+                attachment.path,
+                created_at=attachment.created_at,
+                created_by=attachment.created_by,
+                filename=attachment.filename,
+                comment_id=comment_id,
+            ),
+        )
+        if created is not None:
+            await self._save("attachment", attachment.id, created.id)
+
+    async def _add_links(self, old: str, links: list[SourceLink]) -> None:
+        """Keep links to import them at the end, flush them by batches."""
+        self._links.extend((old, link) for link in links)
+        if len(self._links) >= self.queue_size:
+            batch, self._links = self._links, []
+            await asyncio.to_thread(self.links.write, batch)
+
+    async def _import_links(self) -> None:
+        """Import kept links by batches."""
+        batch, self._links = self._links, []
+        await asyncio.to_thread(self.links.write, batch)
+        await asyncio.to_thread(self.links.rewind)
+        while batch := await asyncio.to_thread(self.links.read, self.queue_size):
+            await gather_limited(
+                (partial(self._import_link, old, link) for old, link in batch),
+                self.concurrency,
+            )
+
+    async def _import_link(self, old: str, link: SourceLink) -> None:
+        link_id = f"{old}:{link.relationship}:{link.issue}"
+        if ("link", link_id) in self.mapping:
+            return
+
+        key = self.mapping.get(("issue", old))
+        if key is None:
+            self._fail("link", link_id, "Issue is not imported.")
+            return
+
+        created = await self._call(
+            "link",
+            link_id,
+            partial(
+                self.tracker.import_link,
+                key,
+                relationship=link.relationship,
+                issue=self.mapping.get(("issue", link.issue), link.issue),
+                created_at=link.created_at,
+                created_by=link.created_by,
+                updated_at=link.updated_at,
+                updated_by=link.updated_by,
+            ),
+        )
+        if created is not None:
+            await self._save("link", link_id, str(created.id))
+
+    async def _call(
+        self,
+        kind: ObjectKind,
+        old: str,
+        request: partial,
+    ) -> Any:  # noqa: ANN401
+        """Make import request, report errors as failures.
+
+        Network errors and unreadable files fail the only object,
+        so the import goes on and the checkpoint keeps the progress.
+        """
+        try:
+            return await request()
+        except (YaTrackerError, ClientError, asyncio.TimeoutError, OSError) as e:
+            self._fail(kind, old, str(e) or repr(e))
+            return None
+
+    async def _save(self, kind: ObjectKind, old: str, new: str) -> None:
+        self.mapping[kind, old] = new
+        self.imported[kind] += 1
+        await asyncio.to_thread(self.checkpoint.add, kind, old, new)
+
+    def _fail(self, kind: ObjectKind, old: str, error: str) -> None:
+        self.failures.append(ImportFailure(kind, old, error))
+
+
+async def _iterate(
+    source: Iterable[SourceIssue] | AsyncIterable[SourceIssue],
+) -> AsyncIterator[SourceIssue]:
+    """Iterate over sync or async source."""
+    if isinstance(source, AsyncIterable):
+        async for item in source:
+            yield item
+    else:
+        for item in source:
+            yield item
@@ -0,0 +1,92 @@
+"""Pagination helpers module."""
+
+from __future__ import annotations
+
+import math
+import re
+from typing import TYPE_CHECKING, Any, NamedTuple
+from urllib.parse import parse_qs, urlsplit
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from .client import Response
+
+LINK_PATTERN = re.compile(r'<(?P<url>[^>]+)>\s*;\s*rel="?(?P<rel>[^";]+)"?')
+
+SCROLL_ID_HEADER = "X-Scroll-Id"
+SCROLL_TOKEN_HEADER = "X-Scroll-Token"  # noqa: S105
+TOTAL_COUNT_HEADER = "X-Total-Count"
+TOTAL_PAGES_HEADER = "X-Total-Pages"
+
+DEFAULT_PER_PAGE = 50
+DEFAULT_CONCURRENCY = 8
+
+
+class Cursor(NamedTuple):
+    """Represents position of the next page request."""
+
+    uri: str
+    params: dict[str, Any] | None = None
+    headers: dict[str, str] | None = None
+
+
+class ScrollPage(NamedTuple):
+    """Represents scroll page items with cursor of the next page."""
+
+    items: list[Any]
+    total: int | None
+    next_cursor: Cursor | None
+
+
+def parse_links(header: str | None) -> dict[str, str]:
+    """Parse RFC 8288 `Link` header into `{rel: url}` dict."""
+    if not header:
+        return {}
+    return {m["rel"]: m["url"] for m in LINK_PATTERN.finditer(header)}
+
+
+def get_total_count(headers: Mapping[str, str]) -> int | None:
+    """Get total count of objects from response headers."""
+    value = headers.get(TOTAL_COUNT_HEADER)
+    return int(value) if value else None
+
+
+def get_total_pages(headers: Mapping[str, str], per_page: int) -> int | None:
+    """Get total count of pages from response headers.
+
+    Tries `X-Total-Pages`, then `X-Total-Count`, then `Link` with `rel="last"`.
+    """
+    if value := headers.get(TOTAL_PAGES_HEADER):
+        return int(value)
+
+    if (total := get_total_count(headers)) is not None:
+        return math.ceil(total / per_page)
+
+    links = parse_links(headers.get("Link"))
+    if last_url := links.get("last"):
+        pages = parse_qs(urlsplit(last_url).query).get("page")
+        return int(pages[0]) if pages else None
+
+    return None
+
+
+def next_scroll_cursor(response: Response, cursor: Cursor) -> Cursor | None:
+    """Get cursor of the next scroll page.
+
+    Prefer `Link` header with `rel="next"`, fall back to scroll headers.
+    """
+    links = parse_links(response.headers.get("Link"))
+    if next_url := links.get("next"):
+        return Cursor(uri=next_url, headers=cursor.headers)
+
+    scroll_id = response.headers.get(SCROLL_ID_HEADER)
+    if not scroll_id:
+        return None
+
+    params = {**(cursor.params or {}), "scrollId": scroll_id}
+    headers = cursor.headers
+    if scroll_token := response.headers.get(SCROLL_TOKEN_HEADER):
+        headers = {**(headers or {}), SCROLL_TOKEN_HEADER: scroll_token}
+
+    return Cursor(uri=cursor.uri, params=params, headers=headers)
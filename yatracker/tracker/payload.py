@@ -0,0 +1,118 @@
+"""Request payload builders module."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+import msgspec
+
+from yatracker.types.base import Base
+from yatracker.types.duration import Duration
+from yatracker.utils.camel_case import camel_case
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Mapping
+
+# names which are never sent
+SKIPPED_NAMES = frozenset({"self", "cls", "kwargs"})
+
+
+class PayloadBuilder:
+    """Represents precompiled payload builder.
+
+    Rename map and exclude set are computed once per
+    (type, exclude, extra) combination, see `get_payload_builder`.
+    """
+
+    def __init__(
+        self,
+        type_: type[Base] | None = None,
+        exclude: Collection[str] = (),
+        extra: Collection[str] = (),
+    ) -> None:
+        self.exclude = SKIPPED_NAMES.union(exclude)
+        self.fields: dict[str, str] | None = None
+        if type_ is not None:
+            self.fields = {
+                info.name: info.encode_name
+                for info in msgspec.structs.fields(type_)
+                if info.name not in self.exclude and not info.name.startswith("_")
+            }
+            for name in extra:
+                self.fields.setdefault(name, camel_case(name))
+
+    def build(self, values: Mapping[str, Any]) -> dict[str, Any]:
+        """Build payload from method arguments, skip empty values.
+
+        With `type_` only its fields are kept, plus `extra` ones.
+        """
+        kwargs = values.get("kwargs")
+        if kwargs:
+            values = {**values, **kwargs}
+
+        if (fields := self.fields) is not None:
+            return {
+                fields[name]: _convert_value(value)
+                for name, value in values.items()
+                if value is not None and name in fields
+            }
+
+        return {
+            _camel_case(name): _convert_value(value)
+            for name, value in values.items()
+            if value is not None
+            and name not in self.exclude
+            and not name.startswith("_")
+        }
+
+
+@lru_cache
+def get_payload_builder(
+    type_: type[Base] | None = None,
+    exclude: tuple[str, ...] = (),
+    extra: tuple[str, ...] = (),
+) -> PayloadBuilder:
+    """Get cached payload builder."""
+    return PayloadBuilder(type_, exclude, extra)
+
+
+_camel_case = lru_cache(maxsize=1024)(camel_case)
+
+
+def _convert_value(obj: Any) -> Any:  # noqa: ANN401
+    """Prepare value to be encoded.
+
+    Structs are kept as is to be encoded directly,
+    only producer tracker link is dropped.
+    Durations are converted to ISO strings,
+    so any client encoder can handle them without a hook.
+    """
+    match obj:
+        case Base():
+            return _convert_struct(obj)
+        case Duration():
+            return obj.to_iso()
+        case list():
+            return [_convert_value(o) for o in obj]
+        case dict():
+            return {k: _convert_value(v) for k, v in obj.items()}
+        case _:
+            return obj
+
+
+def _convert_struct(obj: Base) -> Base:
+    """Drop tracker link and convert durations of the struct."""
+    changes: dict[str, Any] = {}
+    if obj._tracker is not None:  # noqa: SLF001
+        changes["_tracker"] = None
+    for name in obj.__struct_fields__:
+        value = getattr(obj, name)
+        if isinstance(value, Base | Duration) and not name.startswith("_"):
+            converted = _convert_value(value)
+            if converted is not value:
+                changes[name] = converted
+
+    if not changes:
+        return obj
+    return msgspec.structs.replace(obj, **changes)
@@ -0,0 +1,65 @@
+"""Field projection module."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+import msgspec
+
+from yatracker.types.base import Base
+
+if TYPE_CHECKING:
+    from collections.abc import Collection
+
+
+def get_projection(type_: type[Base], fields: Collection[str]) -> type[Base]:
+    """Get struct type with only the given fields of `type_`.
+
+    Fields may be named as attributes (`updated_at`) or as in API (`updatedAt`).
+    Generated types are cached, so are their decoders.
+    """
+    return _get_projection(type_, tuple(fields))  # type: ignore[arg-type]
+
+
+def get_fields_param(type_: type[Base]) -> str:
+    """Get `fields` request parameter value for the struct type."""
+    return ",".join(
+        info.encode_name
+        for info in msgspec.structs.fields(type_)
+        if not info.name.startswith("_")
+    )
+
+
+@lru_cache
+def _get_projection(type_: type[Base], fields: tuple[str, ...]) -> type[Base]:
+    known = {f.name: f for f in msgspec.structs.fields(type_)}
+    known.update({f.encode_name: f for f in known.values()})
+
+    selected: dict[str, msgspec.structs.FieldInfo] = {}
+    for name in fields:
+        info = known.get(name)
+        if info is None or info.name.startswith("_"):
+            msg = f"{type_.__name__} has no field {name!r}."
+            raise ValueError(msg)
+        selected[info.name] = info
+
+    return msgspec.defstruct(  # type: ignore[return-value]
+        f"{type_.__name__}Projection",
+        [_define_field(info) for info in selected.values()],
+        bases=(Base,),
+        module=__name__,
+        kw_only=True,
+        rename={info.name: info.encode_name for info in selected.values()},
+    )
+
+
+def _define_field(info: msgspec.structs.FieldInfo) -> tuple[Any, ...]:
+    """Get `defstruct` definition of the field."""
+    if info.default_factory is not msgspec.NODEFAULT:
+        default = msgspec.field(default_factory=info.default_factory)
+    elif info.default is not msgspec.NODEFAULT:
+        default = info.default
+    else:
+        return (info.name, info.type)
+    return (info.name, info.type, default)
@@ -0,0 +1,220 @@
+"""Client-side rate limiting module."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+from yatracker.exceptions import TooManyRequestsError
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Mapping
+    from contextlib import AbstractAsyncContextManager
+
+logger = logging.getLogger(__name__)
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+# absorbs float error of refills, so waiting for a token can't spin
+TOKEN_EPSILON = 1e-9
+
+
+@dataclass(frozen=True)
+class Limit:
+    """Represents limits of an endpoint class.
+
+    `rate` - requests per second, `burst` - token bucket capacity.
+    Concurrency starts from `concurrency` and is adjusted between
+    `min_concurrency` and `max_concurrency`: it grows by one per
+    a window of successful requests and is multiplied by `backoff`
+    on every 429 response.
+    """
+
+    rate: float = 20.0
+    burst: int = 20
+    concurrency: int = 8
+    min_concurrency: int = 1
+    max_concurrency: int = 64
+    backoff: float = 0.5
+
+
+class TokenBucket:
+    """Represents token bucket algorithm."""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait for a token."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated) * self.rate,
+                )
+                self._updated = now
+                if self._tokens >= 1 - TOKEN_EPSILON:
+                    self._tokens = max(0, self._tokens - 1)
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        """Stop giving tokens for a while.
+
+        Tokens are refilled from the end of the pause, not from its start.
+        """
+        self._tokens = 0
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._updated = self._paused_until
+
+
+class AdaptiveConcurrency:
+    """Represents AIMD (additive increase, multiplicative decrease) semaphore."""
+
+    def __init__(self, limit: Limit) -> None:
+        self.limit = float(limit.concurrency)
+        self._min = limit.min_concurrency
+        self._max = limit.max_concurrency
+        self._backoff = limit.backoff
+        self._active = 0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        """Wait for a free slot."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._active < int(self.limit))
+            self._active += 1
+
+    async def release(self) -> None:
+        """Free the slot."""
+        async with self._condition:
+            self._active -= 1
+            self._condition.notify(max(1, int(self.limit) - self._active))
+
+    def increase(self) -> None:
+        """Grow the limit by one per a window of successful requests."""
+        self.limit = min(self._max, self.limit + 1 / self.limit)
+
+    def decrease(self) -> None:
+        """Shrink the limit after throttling."""
+        self.limit = max(self._min, self.limit * self._backoff)
+
+
+class EndpointLimiter:
+    """Represents limiter of a single (org, endpoint class) pair."""
+
+    def __init__(self, limit: Limit) -> None:
+        self.bucket = TokenBucket(limit.rate, limit.burst)
+        self.concurrency = AdaptiveConcurrency(limit)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Take a slot for the request."""
+        await self.concurrency.acquire()
+        try:
+            await self.bucket.acquire()
+            yield
+        except TooManyRequestsError as e:
+            self.concurrency.decrease()
+            self.bucket.pause(e.retry_after or 1 / self.bucket.rate)
+            raise
+        else:
+            self.concurrency.increase()
+        finally:
+            await self.concurrency.release()
+
+
+def classify_endpoint(method: str, url: str) -> str:
+    """Get endpoint class name: `search`, `read` or `write`."""
+    path = urlsplit(url).path.rstrip("/")
+    if path.endswith(("/_search", "/_count")):
+        return "search"
+    if method.upper() in SAFE_METHODS:
+        return "read"
+    return "write"
+
+
+class RateLimiter:
+    """Represents client-side rate limiter.
+
+    Limits are resolved for every (org, endpoint class) pair:
+    `orgs[org_id][class]`, then `limits[class]`, then `default`.
+    One limiter may be shared by several clients.
+
+    >>> limiter = RateLimiter(limits={"write": Limit(rate=5, burst=5)})
+    >>> tracker = YaTracker(org_id=..., token=..., rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        limits: Mapping[str, Limit] | None = None,
+        default: Limit | None = None,
+        orgs: Mapping[str, Mapping[str, Limit]] | None = None,
+        classify: Callable[[str, str], str] = classify_endpoint,
+        max_throttle_retries: int = 3,
+    ) -> None:
+        self.limits = dict(limits or {})
+        self.default = default or Limit()
+        self.orgs = {str(k): dict(v) for k, v in (orgs or {}).items()}
+        self.classify = classify
+        self.max_throttle_retries = max_throttle_retries
+        self._limiters: dict[tuple[str, str], EndpointLimiter] = {}
+
+    def get_limit(self, org_id: str, endpoint_class: str) -> Limit:
+        """Resolve limit for the org and endpoint class."""
+        org_limits = self.orgs.get(org_id, {})
+        if endpoint_class in org_limits:
+            return org_limits[endpoint_class]
+        return self.limits.get(endpoint_class, self.default)
+
+    def slot(
+        self,
+        org_id: str,
+        method: str,
+        url: str,
+    ) -> AbstractAsyncContextManager[None]:
+        """Take a slot for the request.
+
+        Use it as async context manager around the request.
+        """
+        key = (org_id, self.classify(method, url))
+        limiter = self._limiters.get(key)
+        if limiter is None:
+            limiter = EndpointLimiter(self.get_limit(*key))
+            self._limiters[key] = limiter
+        return limiter.slot()
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse `Retry-After` header: delay in seconds or HTTP-date."""
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        logger.warning("Unparsable Retry-After header: %s", value)
+        return None
+
+    return max(0.0, date.timestamp() - time.time())
@@ -0,0 +1,90 @@
+"""Retry policy module."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from aiohttp import ClientConnectionError, ClientPayloadError
+from msgspec import Struct
+
+from yatracker.exceptions import ServerError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+
+class RetryEvent(NamedTuple):
+    """Represents retry attempt info passed to metrics hooks."""
+
+    method: str
+    url: str
+    attempt: int
+    delay: float
+    error: BaseException
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Represents retry policy for transient failures.
+
+    Safe methods (GET, HEAD, OPTIONS, PUT, DELETE) are always retried,
+    POST - only if `unique` is set in payload, so it can't create duplicates.
+
+    Delays use capped exponential backoff with full jitter:
+    `uniform(0, min(max_delay, base_delay * 2 ** (attempt - 1)))`.
+    The call is given up after `attempts` tries or when total delay
+    would exceed `budget` seconds.
+
+    Pass `RetryPolicy(attempts=1)` to disable retries.
+    """
+
+    attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+    budget: float | None = 60.0
+    statuses: frozenset[int] = frozenset(
+        {
+            HTTPStatus.INTERNAL_SERVER_ERROR,
+            HTTPStatus.BAD_GATEWAY,
+            HTTPStatus.SERVICE_UNAVAILABLE,
+            HTTPStatus.GATEWAY_TIMEOUT,
+        },
+    )
+    methods: frozenset[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+    exceptions: tuple[type[BaseException], ...] = (
+        ClientConnectionError,
+        ClientPayloadError,
+        asyncio.TimeoutError,
+    )
+    on_retry: Callable[[RetryEvent], Any] | None = None
+    on_giveup: Callable[[RetryEvent], Any] | None = None
+
+    def is_idempotent(
+        self,
+        method: str,
+        payload: Mapping[str, Any] | Struct | None = None,
+    ) -> bool:
+        """Check the request may be safely repeated."""
+        method = method.upper()
+        if method in self.methods:
+            return True
+        if method != "POST" or payload is None:
+            return False
+        if isinstance(payload, Struct):
+            return getattr(payload, "unique", None) is not None
+        return payload.get("unique") is not None
+
+    def is_transient(self, error: BaseException) -> bool:
+        """Check the error is worth a retry."""
+        if isinstance(error, ServerError):
+            return error.status in self.statuses
+        return isinstance(error, self.exceptions)
+
+    def get_delay(self, attempt: int) -> float:
+        """Get full jitter delay before the next attempt."""
+        cap = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return random.uniform(0, cap)  # noqa: S311
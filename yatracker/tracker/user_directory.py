@@ -0,0 +1,169 @@
+"""In-memory user directory module."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING
+
+from .pagination import DEFAULT_CONCURRENCY
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from yatracker.types import FullUser
+
+    from .categories.users import Users
+
+DEFAULT_TTL = 15 * 60
+DEFAULT_PER_PAGE = 1000
+
+
+class UserDirectory:
+    """Represents organization users indexed by ids, logins and emails.
+
+    All the users are loaded by pages on the first lookup and reloaded
+    when they are older than `ttl` seconds (pass None to keep them
+    until `refresh` is called). Reloading only reindexes changed users.
+
+    `get` answers from memory, `resolve` also requests a user
+    which is not known yet (e.g. created after the last refresh).
+
+    >>> user = await tracker.user_directory.resolve("login")
+    >>> await tracker.create_issue(..., assignee=user.login)
+    """
+
+    def __init__(
+        self,
+        tracker: Users,
+        ttl: float | None = DEFAULT_TTL,
+        per_page: int = DEFAULT_PER_PAGE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> None:
+        self.tracker = tracker
+        self.ttl = ttl
+        self.per_page = per_page
+        self.concurrency = concurrency
+        self.refreshed_at: float | None = None
+        self._users: dict[int, FullUser] = {}
+        self._by_id: dict[str, FullUser] = {}
+        self._by_login: dict[str, FullUser] = {}
+        self._by_email: dict[str, FullUser] = {}
+        self._lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        """Get count of known users."""
+        return len(self._users)
+
+    def __iter__(self) -> Iterator[FullUser]:
+        """Iterate via known users."""
+        return iter(self._users.values())
+
+    def __contains__(self, key: object) -> bool:
+        """Check the user is known by any id, login or email."""
+        return isinstance(key, str | int) and self.get(key) is not None
+
+    @property
+    def is_stale(self) -> bool:
+        """Check users should be reloaded."""
+        if self.refreshed_at is None:
+            return True
+        if self.ttl is None:
+            return False
+        return time.monotonic() - self.refreshed_at > self.ttl
+
+    def get(self, key: str | int) -> FullUser | None:
+        """Get known user by uid (any of them), login or email."""
+        key = str(key)
+        return (
+            self._by_id.get(key)
+            or self._by_login.get(key.lower())
+            or self._by_email.get(key.lower())
+        )
+
+    def add(self, user: FullUser) -> bool:
+        """Add or update the user.
+
+        :return: True if the user is new or changed.
+        """
+        old = self._users.get(user.uid)
+        if old == user:
+            return False
+        if old is not None:
+            self._unindex(old)
+        self._users[user.uid] = user
+        for key in _get_ids(user):
+            self._by_id[key] = user
+        self._by_login[user.login.lower()] = user
+        if user.email:
+            self._by_email[user.email.lower()] = user
+        return True
+
+    def remove(self, uid: int) -> FullUser | None:
+        """Remove the user by uid."""
+        user = self._users.pop(uid, None)
+        if user is not None:
+            self._unindex(user)
+        return user
+
+    async def refresh(self) -> int:
+        """Reload all the users.
+
+        :return: Count of added, changed and removed users.
+        """
+        async with self._lock:
+            return await self._refresh()
+
+    async def ensure_fresh(self) -> None:
+        """Reload users if they are stale, only once for concurrent callers."""
+        if not self.is_stale:
+            return
+        async with self._lock:
+            if self.is_stale:
+                await self._refresh()
+
+    async def resolve(self, key: str | int) -> FullUser:
+        """Get user by uid, login or email.
+
+        Unknown users are requested by uid or login and added.
+        `ObjectNotFoundError` is raised if there is no such user.
+        """
+        await self.ensure_fresh()
+        user = self.get(key)
+        if user is None:
+            user = await self.tracker.get_user(key)
+            # not to be removed by the refresh running at the moment
+            async with self._lock:
+                self.add(user)
+        return user
+
+    async def _refresh(self) -> int:
+        changed = 0
+        seen: set[int] = set()
+        users = self.tracker.iter_users(self.per_page, self.concurrency)
+        async for user in users:
+            changed += self.add(user)
+            seen.add(user.uid)
+
+        for uid in self._users.keys() - seen:
+            self.remove(uid)
+            changed += 1
+
+        self.refreshed_at = time.monotonic()
+        return changed
+
+    def _unindex(self, user: FullUser) -> None:
+        for key in _get_ids(user):
+            self._by_id.pop(key, None)
+        self._by_login.pop(user.login.lower(), None)
+        if user.email:
+            self._by_email.pop(user.email.lower(), None)
+
+
+def _get_ids(user: FullUser) -> set[str]:
+    """Get all the ids the user may be referenced by."""
+    ids = {str(user.uid)}
+    for uid in (user.tracker_uid, user.passport_uid, user.cloud_uid):
+        if uid is not None:
+            ids.add(str(uid))
+    return ids
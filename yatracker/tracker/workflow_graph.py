@@ -0,0 +1,103 @@
+"""Workflow transitions graph module."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import TYPE_CHECKING
+
+import msgspec
+
+from yatracker.types import Status, Transition
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+class IssueTransitions(msgspec.Struct):
+    """Represents issue status with transitions available in it."""
+
+    status: Status
+    transitions: list[Transition] = msgspec.field(default_factory=list)
+
+
+class WorkflowGraph:
+    """Represents workflow of a (queue, issue type) pair.
+
+    It's built from transitions observed in every status,
+    statuses and transitions are looked up by id, key or display name.
+    """
+
+    def __init__(self) -> None:
+        self.statuses: dict[str, Status] = {}
+        self._status_names: dict[str, str] = {}
+        self._transitions: dict[str, dict[str, Transition]] = {}
+        self._by_name: dict[str, dict[str, Transition]] = {}
+
+    def add(self, status: Status | str, transitions: Iterable[Transition]) -> None:
+        """Save transitions available in the status, replace known ones."""
+        if isinstance(status, Status):
+            self._add_status(status)
+            status = status.key
+
+        by_id = {t.id: t for t in transitions}
+        by_name: dict[str, Transition] = {}
+        for t in by_id.values():
+            self._add_status(t.to)
+            by_name[t.display.casefold()] = t
+            by_name[t.to.key] = t
+            by_name[t.id] = t
+
+        self._transitions[status] = by_id
+        self._by_name[status] = by_name
+
+    def is_known(self, status: str) -> bool:
+        """Check transitions of the status are observed."""
+        return status in self._transitions
+
+    def get_status(self, name: str) -> Status | None:
+        """Get status by id, key or display name."""
+        key = self._status_names.get(name) or self._status_names.get(name.casefold())
+        return self.statuses.get(key) if key else None
+
+    def get_transition(self, status: str, name: str) -> Transition | None:
+        """Get transition from the status by id, display name or target status."""
+        by_name = self._by_name.get(status, {})
+        return by_name.get(name) or by_name.get(name.casefold())
+
+    def find_path(self, source: str, target: str) -> list[Transition] | None:
+        """Find the shortest chain of transitions between statuses (by keys)."""
+        if source == target:
+            return []
+
+        previous: dict[str, tuple[str, Transition]] = {}
+        queue = deque([source])
+        while queue:
+            status = queue.popleft()
+            for t in self._transitions.get(status, {}).values():
+                if t.to.key == source or t.to.key in previous:
+                    continue
+                previous[t.to.key] = (status, t)
+                if t.to.key == target:
+                    return _unwind(previous, source, target)
+                queue.append(t.to.key)
+        return None
+
+    def _add_status(self, status: Status) -> None:
+        self.statuses[status.key] = status
+        self._status_names[status.key] = status.key
+        self._status_names[status.id] = status.key
+        self._status_names[status.display.casefold()] = status.key
+
+
+def _unwind(
+    previous: dict[str, tuple[str, Transition]],
+    source: str,
+    target: str,
+) -> list[Transition]:
+    """Get path of transitions found by BFS."""
+    path = []
+    status = target
+    while status != source:
+        status, transition = previous[status]
+        path.append(transition)
+    return path[::-1]
@@ -0,0 +1,217 @@
+"""Columnar worklog table module."""
+
+from __future__ import annotations
+
+from array import array
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from typing import TYPE_CHECKING, Literal
+
+import msgspec
+
+from yatracker.types.duration import Duration, parse_seconds
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from yatracker.types import Worklog
+
+Column = Literal["user", "issue", "day", "week", "month"]
+
+SECONDS_PER_DAY = 24 * 60 * 60
+
+
+class _IssueRef(msgspec.Struct):
+    key: str
+
+
+class _UserRef(msgspec.Struct):
+    id: str
+
+
+class WorklogRow(msgspec.Struct, rename="camel"):
+    """Represents the only worklog fields needed by the table."""
+
+    issue: _IssueRef
+    created_by: _UserRef
+    start: datetime
+    duration: str
+
+
+class WorklogTable:
+    """Represents worklogs as array-backed columns.
+
+    Every row takes 24 bytes: user and issue codes (see `users` and
+    `issues` lists of interned values), start timestamp and duration
+    in seconds of working time.
+
+    >>> table = await tracker.get_worklog_table(created_at_from=..., ...)
+    >>> table.sum_by("user", "month")
+    {("1234", date(2024, 1, 1)): 576000.0, ...}
+
+    Days, weeks and months are bucketed in `tz` timezone,
+    its offset is taken per row, so DST zones (e.g. `ZoneInfo`) are supported.
+    """
+
+    def __init__(self, tz: tzinfo = timezone.utc) -> None:
+        self.tz = tz
+        self.users: list[str] = []
+        self.issues: list[str] = []
+        self.user_codes = array("I")
+        self.issue_codes = array("I")
+        self.starts = array("d")
+        self.durations = array("d")
+        self._user_index: dict[str, int] = {}
+        self._issue_index: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Get count of rows."""
+        return len(self.durations)
+
+    def append(
+        self,
+        user_id: str,
+        issue_key: str,
+        start: datetime | float,
+        duration: Duration | str | float,
+    ) -> None:
+        """Add a row."""
+        self.user_codes.append(_intern(user_id, self.users, self._user_index))
+        self.issue_codes.append(_intern(issue_key, self.issues, self._issue_index))
+        self.starts.append(start.timestamp() if isinstance(start, datetime) else start)
+        if isinstance(duration, Duration):
+            duration = duration.total_seconds()
+        elif isinstance(duration, str):
+            duration = parse_seconds(duration)
+        self.durations.append(duration)
+
+    def extend(self, rows: Iterable[WorklogRow]) -> None:
+        """Add rows decoded from worklog search results."""
+        for row in rows:
+            self.append(row.created_by.id, row.issue.key, row.start, row.duration)
+
+    @classmethod
+    def from_worklogs(
+        cls,
+        worklogs: Iterable[Worklog],
+        tz: tzinfo = timezone.utc,
+    ) -> WorklogTable:
+        """Create table from decoded worklogs."""
+        table = cls(tz)
+        for w in worklogs:
+            table.append(w.created_by.id, w.issue.key, w.start, w.duration)
+        return table
+
+    def total(self) -> float:
+        """Get total duration in seconds."""
+        return sum(self.durations)
+
+    def sum_by(self, *columns: Column) -> dict[tuple, float]:
+        """Get total duration in seconds grouped by the columns.
+
+        Columns are `user`, `issue` and time buckets `day`, `week`, `month`
+        (represented by the date of the bucket start).
+        """
+        if not columns:
+            msg = "Set at least one column to group by."
+            raise ValueError(msg)
+
+        keys = zip(*(self._column(name) for name in columns), strict=True)
+        totals: defaultdict[tuple, float] = defaultdict(float)
+        for key, duration in zip(keys, self.durations, strict=True):
+            totals[key] += duration
+        return dict(totals)
+
+    def filter(
+        self,
+        user_ids: Sequence[str] | None = None,
+        issue_keys: Sequence[str] | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> WorklogTable:
+        """Get new table with rows matching all the conditions.
+
+        `since` is inclusive, `until` is exclusive.
+        """
+        users = _codes(user_ids, self._user_index)
+        issues = _codes(issue_keys, self._issue_index)
+        start = since.timestamp() if since else float("-inf")
+        end = until.timestamp() if until else float("inf")
+
+        table = WorklogTable(self.tz)
+        for i, (user, issue, ts) in enumerate(
+            zip(self.user_codes, self.issue_codes, self.starts, strict=True),
+        ):
+            if (
+                (users is None or user in users)
+                and (issues is None or issue in issues)
+                and start <= ts < end
+            ):
+                table.append(
+                    self.users[user],
+                    self.issues[issue],
+                    ts,
+                    self.durations[i],
+                )
+        return table
+
+    def _column(self, name: Column) -> Iterator:
+        """Get column values by name."""
+        if name == "user":
+            return map(self.users.__getitem__, self.user_codes)
+        if name == "issue":
+            return map(self.issues.__getitem__, self.issue_codes)
+        if name in {"day", "week", "month"}:
+            return self._buckets(name)
+        msg = f"Unknown column {name!r}."
+        raise ValueError(msg)
+
+    def _buckets(self, name: str) -> Iterator[date]:
+        """Get dates of time buckets the rows started in."""
+        cache: dict[int, date] = {}
+        for day in self._days():
+            bucket = cache.get(day)
+            if bucket is None:
+                bucket = _bucket(day, name)
+                cache[day] = bucket
+            yield bucket
+
+    def _days(self) -> Iterator[int]:
+        """Get local days since epoch the rows started in."""
+        tz = self.tz
+        if isinstance(tz, timezone):
+            # fixed offset, no need to convert every timestamp
+            offset = tz.utcoffset(None).total_seconds()
+            for ts in self.starts:
+                yield int((ts + offset) // SECONDS_PER_DAY)
+            return
+
+        for ts in self.starts:
+            local = datetime.fromtimestamp(ts, tz).utcoffset() or timedelta()
+            yield int((ts + local.total_seconds()) // SECONDS_PER_DAY)
+
+
+def _intern(value: str, values: list[str], index: dict[str, int]) -> int:
+    """Get code of the value, add it if needed."""
+    code = index.get(value)
+    if code is None:
+        code = index[value] = len(values)
+        values.append(value)
+    return code
+
+
+def _codes(values: Sequence[str] | None, index: dict[str, int]) -> set[int] | None:
+    """Get codes of the known values."""
+    if values is None:
+        return None
+    return {index[v] for v in values if v in index}
+
+
+def _bucket(day: int, name: str) -> date:
+    """Get start date of the bucket by number of days since epoch."""
+    result = date(1970, 1, 1) + timedelta(days=day)
+    if name == "week":
+        return result - timedelta(days=result.weekday())
+    if name == "month":
+        return result.replace(day=1)
+    return result
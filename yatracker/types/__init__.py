@@ -1,11 +1,19 @@
 __all__ = [
     "Attachment",
     "Base",
+    "BulkChange",
+    "BulkChangeFailure",
+    "ChecklistDeadline",
+    "ChecklistItem",
+    "ChecklistItemChange",
     "Comment",
+    "Component",
     "Duration",
     "field",
+    "FullComponent",
     "FullIssue",
     "FullQueue",
+    "FullUser",
     "Issue",
     "IssueLink",
     "IssueType",
@@ -16,6 +24,7 @@ __all__ = [
     "QueueVersion",
     "Sprint",
     "Status",
+    "TrackerBound",
     "Transition",
     "Transitions",
     "User",
@@ -24,14 +33,19 @@ __all__ = [
 
 from .attachment import Attachment
 from .base import Base, field
+from .bulk_change import BulkChange, BulkChangeFailure
+from .checklist import ChecklistDeadline, ChecklistItem, ChecklistItemChange
 from .comment import Comment
+from .component import Component, FullComponent
 from .duration import Duration
 from .full_issue import FullIssue
 from .full_queue import FullQueue
+from .full_user import FullUser
 from .issue import Issue
 from .issue_link import IssueLink
 from .issue_type import IssueType
 from .issue_type_config import IssueTypeConfig
+from .mixins import TrackerBound
 from .priority import Priority
 from .queue import Queue
 from .queue_field import QueueField
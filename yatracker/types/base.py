@@ -12,7 +12,7 @@ from .mixins import Printable
 class Base(Printable, Struct, omit_defaults=True, rename="camel"):
     """Base structure class."""
 
-    _tracker: Any = None  # this field will be filled after decoding
+    _tracker: Any = None  # filled on decoding for `TrackerBound` types
 
     def __repr__(self) -> str:
         """Represent the object without tech fields."""
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+__all__ = ["BulkChange", "BulkChangeFailure"]
+
+from datetime import datetime
+
+from .base import Base, field
+from .mixins import TrackerBound
+from .user import User
+
+# statuses of finished bulk changes
+FINISHED_STATUSES = frozenset({"COMPLETE", "FAILED"})
+
+
+class BulkChange(TrackerBound, Base, kw_only=True):
+    url: str = field(name="self")
+    id: str
+    created_by: User | None = None
+    created_at: datetime | None = None
+    status: str
+    status_text: str | None = None
+    execution_chunk_percent: int | None = None
+    execution_issue_percent: int | None = None
+    total_issues: int | None = None
+    total_completed_issues: int | None = None
+
+    @property
+    def is_finished(self) -> bool:
+        """Check the operation is finished (successfully or not)."""
+        return self.status in FINISHED_STATUSES
+
+    async def refresh(self) -> BulkChange:
+        """Get current state of the operation."""
+        return await self._tracker.get_bulk_change(self.id)
+
+    async def wait(self, **kwargs) -> BulkChange:
+        """Wait for the operation to finish."""
+        return await self._tracker.wait_bulk_change(self.id, **kwargs)
+
+
+class BulkChangeFailure(Base, kw_only=True):
+    issue_key: str
+    reason: str | None = None
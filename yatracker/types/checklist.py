@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+__all__ = [
+    "ChecklistDeadline",
+    "ChecklistItem",
+    "ChecklistItemChange",
+    "IssueChecklist",
+]
+
+from datetime import datetime
+
+from .base import Base, field
+from .user import User
+
+
+class ChecklistDeadline(Base, kw_only=True):
+    date: datetime
+    # required by API, so it must not be omitted as default
+    deadline_type: str
+    is_exceeded: bool | None = None
+
+
+class ChecklistItem(Base, kw_only=True):
+    id: str
+    text: str
+    text_html: str | None = None
+    checked: bool = False
+    assignee: User | None = None
+    deadline: ChecklistDeadline | None = None
+    checklist_item_type: str | None = None
+
+
+class ChecklistItemChange(Base, kw_only=True):
+    """Represents changes of a checklist item, unset fields are kept."""
+
+    id: str
+    text: str | None = None
+    checked: bool | None = None
+    assignee: str | None = None
+    deadline: ChecklistDeadline | None = None
+
+
+class IssueChecklist(Base, kw_only=True):
+    """Represents the only issue fields returned by checklist requests."""
+
+    key: str
+    checklist_items: list[ChecklistItem] = field(default_factory=list)
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+__all__ = ["Component", "FullComponent"]
+
+from .base import Base, field
+from .queue import Queue
+from .user import User
+
+
+class Component(Base, kw_only=True):
+    """Represents component reference.
+
+    API sends ids of references as strings, they are converted to int
+    to match `FullComponent.id`.
+    """
+
+    url: str = field(name="self")
+    id: int | str
+    display: str
+
+    def __post_init__(self) -> None:
+        """Convert id to int."""
+        self.id = int(self.id)
+
+
+class FullComponent(Base, kw_only=True):
+    url: str = field(name="self")
+    id: int
+    version: int
+    name: str
+    queue: Queue
+    description: str | None = None
+    lead: User | None = None
+    assign_auto: bool = False
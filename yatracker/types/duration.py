@@ -1,31 +1,106 @@
 from __future__ import annotations
 
-__all__ = ["Duration"]
+__all__ = ["Duration", "parse_many", "parse_seconds"]
 
 import re
-from dataclasses import dataclass, fields
+import warnings
+from array import array
+from datetime import timedelta
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
 PATTERN = re.compile(
-    r"^P(?=\d+[YMWD])"
+    r"^P(?!$)"
     r"((?P<years>\d+)Y)?"
     r"((?P<months>\d+)M)?"
     r"((?P<weeks>\d+)W)?"
     r"((?P<days>\d+)D)?"
-    r"(?P<time>T(?=\d+[HMS])"
+    r"(T(?=\d)"
     r"((?P<hours>\d+)H)?"
     r"((?P<minutes>\d+)M)?"
     r"((?P<seconds>\d+)S)?)?$",
 )
 
+# Tracker counts spent time in working units
+HOURS_PER_DAY = 8
+DAYS_PER_WEEK = 5
+WEEKS_PER_MONTH = 4
+MONTHS_PER_YEAR = 12
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = HOURS_PER_DAY * HOUR
+WEEK = DAYS_PER_WEEK * DAY
+MONTH = WEEKS_PER_MONTH * WEEK
+YEAR = MONTHS_PER_YEAR * MONTH
+
+FIELDS = ("years", "months", "weeks", "days", "hours", "minutes", "seconds")
+UNITS = (YEAR, MONTH, WEEK, DAY, HOUR, MINUTE, 1)
+
 
-@dataclass
 class Duration:
-    years: int = 0
-    months: int = 0
-    days: int = 0
-    hours: int = 0
-    minutes: int = 0
-    seconds: int = 0
+    """Represents ISO 8601 duration of spent time.
+
+    Conversions to seconds and timedelta use working time:
+    1 day = 8 hours, 1 week = 5 days, 1 month = 4 weeks.
+
+    `Worklog.duration` used to be ISO string, so comparison with strings
+    and string methods still work, but are deprecated: use `str(duration)`.
+    """
+
+    __slots__ = FIELDS
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        years: int = 0,
+        months: int = 0,
+        days: int = 0,
+        hours: int = 0,
+        minutes: int = 0,
+        seconds: int = 0,
+        *,
+        weeks: int = 0,
+    ) -> None:
+        self.years = years
+        self.months = months
+        self.weeks = weeks
+        self.days = days
+        self.hours = hours
+        self.minutes = minutes
+        self.seconds = seconds
+
+    def __repr__(self) -> str:
+        """Represent only non-zero parts."""
+        parts = ", ".join(
+            f"{name}={getattr(self, name)}" for name in FIELDS if getattr(self, name)
+        )
+        return f"{self.__class__.__name__}({parts})"
+
+    def __str__(self) -> str:
+        """Return ISO data."""
+        return self.to_iso()
+
+    def __eq__(self, other: object) -> bool:
+        """Compare parts of durations."""
+        if isinstance(other, str):
+            _warn_str_usage()
+            return self.to_iso() == other
+        if not isinstance(other, Duration):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in FIELDS)
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        """Get method of ISO string (deprecated)."""
+        if name.startswith("_") or not hasattr(str, name):
+            msg = f"{self.__class__.__name__!r} object has no attribute {name!r}"
+            raise AttributeError(msg)
+        _warn_str_usage()
+        return getattr(self.to_iso(), name)
+
+    __hash__ = None  # type: ignore[assignment]
 
     def to_iso(self) -> str:
         """Convert Duration object to ISO data."""
@@ -42,12 +117,14 @@ class Duration:
             duration = f"{duration}{self.years}Y"
         if self.months:
             duration = f"{duration}{self.months}M"
+        if self.weeks:
+            duration = f"{duration}{self.weeks}W"
         if self.days:
             duration = f"{duration}{self.days}D"
         if time:
             duration = f"{duration}T{time}"
 
-        return duration
+        return duration if duration != "P" else "PT0S"
 
     @classmethod
     def from_iso(cls, duration: str, pattern: re.Pattern = PATTERN) -> Duration:
@@ -57,9 +134,64 @@ class Duration:
             msg = "Duration is not matched to ISO duration pattern."
             raise ValueError(msg)
 
-        data: dict[str, int] = {}
-        for field in fields(Duration):
-            if value := result.group(field.name):
-                data[field.name] = int(value)
+        data = {k: int(v) for k, v in result.groupdict().items() if v and k in FIELDS}
+        return cls(**data)
 
+    def total_seconds(self) -> int:
+        """Get working time in seconds."""
+        return sum(
+            getattr(self, name) * unit for name, unit in zip(FIELDS, UNITS, strict=True)
+        )
+
+    def to_timedelta(self) -> timedelta:
+        """Convert to timedelta of working time."""
+        return timedelta(seconds=self.total_seconds())
+
+    @classmethod
+    def from_seconds(cls, seconds: float) -> Duration:
+        """Create Duration object from working time in seconds.
+
+        Time is split into weeks, days, hours, minutes and seconds,
+        the fractional part of seconds is dropped.
+        """
+        rest = int(seconds)
+        data: dict[str, int] = {}
+        for name, unit in zip(FIELDS[2:], UNITS[2:], strict=True):
+            data[name], rest = divmod(rest, unit)
         return cls(**data)
+
+    @classmethod
+    def from_timedelta(cls, value: timedelta) -> Duration:
+        """Create Duration object from timedelta of working time."""
+        return cls.from_seconds(value.total_seconds())
+
+
+def _warn_str_usage() -> None:
+    warnings.warn(
+        "Using Duration as string is deprecated, use `str(duration)` instead.",
+        DeprecationWarning,
+        stacklevel=3,
+    )
+
+
+def parse_many(durations: Iterable[str]) -> array[float]:
+    """Convert ISO durations to working time in seconds at once.
+
+    Repeated values are parsed once, so typical worklogs
+    (`PT1H`, `PT30M`, `P1D`...) cost a dict lookup.
+    Use `numpy.frombuffer(result)` to get NumPy array without copying.
+    """
+    return array("d", map(parse_seconds, durations))
+
+
+@lru_cache(maxsize=4096)
+def parse_seconds(duration: str) -> float:
+    """Convert ISO duration to working time in seconds (memoized)."""
+    result = PATTERN.match(duration)
+    if result is None:
+        msg = f"Duration {duration!r} is not matched to ISO duration pattern."
+        raise ValueError(msg)
+
+    parts = result.group(*FIELDS)
+    seconds = sum(int(v) * unit for v, unit in zip(parts, UNITS, strict=True) if v)
+    return float(seconds)
@@ -6,9 +6,12 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 
 from .base import Base, field
+from .checklist import ChecklistItem
 from .comment import Comment
+from .component import Component
 from .issue import Issue
 from .issue_type import IssueType
+from .mixins import TrackerBound
 from .priority import Priority
 from .queue import Queue
 from .sprint import Sprint
@@ -20,7 +23,7 @@ if TYPE_CHECKING:
     from .issue_link import IssueLink
 
 
-class FullIssue(Base, kw_only=True):
+class FullIssue(TrackerBound, Base, kw_only=True):
     url: str = field(name="self")
     id: str
     key: str
@@ -48,6 +51,8 @@ class FullIssue(Base, kw_only=True):
     status: Status
     previous_status: Status | None = None
     direction: str | None = None
+    checklist_items: list[ChecklistItem] | None = None
+    components: list[Component] | None = None
 
     async def get_transitions(self) -> Transitions:
         """Return dict and list-like Transitions object.
@@ -79,3 +84,7 @@ class FullIssue(Base, kw_only=True):
     async def get_links(self) -> list[IssueLink]:
         """Get issue links."""
         return await self._tracker.get_issue_links(self.id)
+
+    async def get_checklist(self) -> list[ChecklistItem]:
+        """Get checklist items."""
+        return await self._tracker.get_checklist(self.id)
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+__all__ = ["FullUser"]
+
+from datetime import datetime
+
+from .base import Base, field
+
+
+class FullUser(Base, kw_only=True):
+    url: str = field(name="self")
+    uid: int
+    login: str
+    tracker_uid: int | None = None
+    passport_uid: int | None = None
+    cloud_uid: str | None = None
+    first_name: str | None = None
+    last_name: str | None = None
+    display: str
+    email: str | None = None
+    external: bool = False
+    has_license: bool | None = None
+    dismissed: bool = False
+    use_new_filters: bool | None = None
+    disable_notifications: bool | None = None
+    first_login_date: datetime | None = None
+    last_login_date: datetime | None = None
+    welcome_mail_sent: bool | None = None
+
+    @property
+    def id(self) -> str:
+        """Get id used by `User` objects of other responses."""
+        return str(self.tracker_uid or self.uid)
@@ -1,5 +1,11 @@
 from __future__ import annotations
 
+from contextvars import ContextVar
+from typing import Any
+
+# tracker which is decoding objects at the moment
+current_tracker: ContextVar[Any] = ContextVar("current_tracker", default=None)
+
 
 class Printable:
     display: str | None
@@ -10,3 +16,18 @@ class Printable:
             return self.display or self.__class__.__name__
         except AttributeError:
             return super().__str__()
+
+
+class TrackerBound:
+    """Bind the object to the tracker which decodes it.
+
+    Only types with methods calling the API need the binding,
+    so the other objects are decoded without any Python-level hooks.
+    """
+
+    _tracker: Any
+
+    def __post_init__(self) -> None:
+        """Fill `_tracker` field from the decoding context."""
+        if self._tracker is None:
+            self._tracker = current_tracker.get()
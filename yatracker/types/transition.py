@@ -3,10 +3,11 @@ from __future__ import annotations
 __all__ = ["Transition"]
 
 from .base import Base, field
+from .mixins import TrackerBound
 from .status import Status
 
 
-class Transition(Base, kw_only=True):
+class Transition(TrackerBound, Base, kw_only=True):
     id: str
     url: str = field(name="self")
     display: str
@@ -5,11 +5,13 @@ __all__ = ["Worklog"]
 from datetime import datetime
 
 from .base import Base, field
+from .duration import Duration
 from .issue import Issue
+from .mixins import TrackerBound
 from .user import User
 
 
-class Worklog(Base, kw_only=True):
+class Worklog(TrackerBound, Base, kw_only=True):
     url: str = field(name="self")
     id: int
     version: int
@@ -19,7 +21,7 @@ class Worklog(Base, kw_only=True):
     created_at: datetime
     updated_at: datetime | None = None
     start: datetime
-    duration: str
+    duration: Duration
 
     async def delete(self) -> bool:
         """Delete current worklog."""
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from itertools import islice
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+
+T = TypeVar("T")
+
+
+async def iter_limited(
+    factories: Iterable[Callable[[], Awaitable[T]]],
+    limit: int,
+) -> AsyncIterator[T]:
+    """Run awaitables with bounded concurrency and yield results in order.
+
+    No more than `limit` awaitables are scheduled at once,
+    including finished ones which are not consumed yet.
+    """
+    if limit < 1:
+        msg = "Concurrency limit must be positive."
+        raise ValueError(msg)
+
+    factories = iter(factories)
+    pending: deque[asyncio.Future[T]] = deque(
+        asyncio.ensure_future(factory()) for factory in islice(factories, limit)
+    )
+    try:
+        while pending:
+            result = await pending.popleft()
+            for factory in islice(factories, 1):
+                pending.append(asyncio.ensure_future(factory()))
+            yield result
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+async def gather_limited(
+    factories: Iterable[Callable[[], Awaitable[T]]],
+    limit: int,
+) -> list[T]:
+    """Run awaitables with bounded concurrency and return results in order.
+
+    Unlike `iter_limited`, a slow awaitable doesn't block the others.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(factory: Callable[[], Awaitable[T]]) -> T:
+        async with semaphore:
+            return await factory()
+
+    return list(await asyncio.gather(*(run(factory) for factory in factories)))
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from collections.abc import AsyncIterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO
+
+from aiohttp import FormData
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
+FileSource = str | Path | BinaryIO | AsyncIterable[bytes]
+
+# size of chunks files are uploaded and downloaded by
+DEFAULT_CHUNK_SIZE = 256 * 1024
+
+
+def get_filename(file: FileSource) -> str | None:
+    """Guess file name by the source."""
+    if isinstance(file, (str, Path)):
+        return Path(file).name
+
+    name = getattr(file, "name", None)
+    if isinstance(name, str):
+        return Path(name).name
+
+    return None
+
+
+def get_size(file: FileSource) -> int | None:
+    """Get count of bytes left to read, None if it's unknown."""
+    if isinstance(file, (str, Path)):
+        return Path(file).stat().st_size
+
+    try:
+        return os.fstat(file.fileno()).st_size - file.tell()  # type: ignore[union-attr]
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+async def iter_chunks(
+    file: FileSource,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """Read file by chunks without blocking the event loop.
+
+    Files opened by path are closed after reading.
+    """
+    if isinstance(file, (str, Path)):
+        f = await asyncio.to_thread(Path(file).open, "rb")
+        try:
+            async for chunk in iter_chunks(f, chunk_size):
+                yield chunk
+        finally:
+            await asyncio.to_thread(f.close)
+        return
+
+    if isinstance(file, AsyncIterable):
+        async for chunk in file:
+            yield chunk
+        return
+
+    while chunk := await asyncio.to_thread(file.read, chunk_size):
+        yield chunk
+
+
+async def track_progress(
+    chunks: AsyncIterable[bytes],
+    filename: str,
+    total: int | None,
+    progress: Callable[[str, int, int | None], Any],
+) -> AsyncIterator[bytes]:
+    """Report count of sent bytes after every chunk.
+
+    `progress` is called with (filename, sent bytes, total bytes or None).
+    """
+    sent = 0
+    async for chunk in chunks:
+        yield chunk
+        sent += len(chunk)
+        progress(filename, sent, total)
+
+
+def prepare_form(
+    file: FileSource,
+    filename: str | None = None,
+    progress: Callable[[str, int, int | None], Any] | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> tuple[FormData, str | None]:
+    """Create multipart form streaming the file by chunks.
+
+    :return: form and guessed file name.
+    """
+    filename = filename or get_filename(file)
+    chunks = iter_chunks(file, chunk_size)
+    if progress is not None:
+        total = get_size(file)
+        chunks = track_progress(chunks, filename or "", total, progress)
+
+    form = FormData()
+    form.add_field("file_data", chunks, filename=filename or "file")
+    return form, filename